@@ -1,13 +1,11 @@
 from backends.grpc.interceptors.debug import DebugInterceptor
 from backends.grpc.interceptors.metrics import RequestCounterInterceptor
 from backends.grpc.interceptors.metrics import RequestLatencyInterceptor
-from backends.grpc.interceptors.ttl import TTLInterceptor
 from backends.grpc.interceptors.welcome import WelcomeInterceptor
 
 __all__ = [
     "RequestCounterInterceptor",
     "RequestLatencyInterceptor",
     "WelcomeInterceptor",
-    "TTLInterceptor",
     "DebugInterceptor",
 ]
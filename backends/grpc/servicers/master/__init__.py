@@ -1,18 +1,15 @@
-import functools
 from typing import Tuple, Iterable, Any, List, Callable, TypeVar
 
 import grpc
-import numpy as np
 
 from loggers import logger
 from mab import ThompsonMultiArmedBandit, Context
-from mab.thomson import Prediction
+from mab.thomson import Prediction, PredictionBatch
 from protos import bandit_pb2, bandit_pb2_grpc
+from writers import Writer
 
 T = TypeVar("T")
 
-DEFAULT_BETA_DIST = functools.partial(np.random.beta, 1, 1)
-
 
 def to_proto_prediction(x: Prediction) -> bandit_pb2.Prediction:
     return bandit_pb2.Prediction(
@@ -23,6 +20,12 @@ def to_proto_prediction(x: Prediction) -> bandit_pb2.Prediction:
     )
 
 
+def to_proto_predictions(batch: PredictionBatch) -> List[bandit_pb2.Prediction]:
+    """PredictionBatch 의 column 을 Prediction 객체 없이 바로 protobuf 로 변환한다."""
+    Message = bandit_pb2.Prediction
+    return [Message(item_id=i, score=s, alpha=a, beta=b) for i, s, a, b in batch.rows()]
+
+
 def select(
     ids: List[str],
     tuples: Iterable[Tuple[str, T]],
@@ -36,8 +39,11 @@ def select(
 
 
 class MasterBanditServicer(bandit_pb2_grpc.BanditServicer):
-    def __init__(self, multi_armed_bandit: ThompsonMultiArmedBandit = None):
+    def __init__(
+        self, multi_armed_bandit: ThompsonMultiArmedBandit = None, writer: Writer = None
+    ):
         self.multi_armed_bandit = multi_armed_bandit or ThompsonMultiArmedBandit()
+        self.writer = writer or Writer(self.multi_armed_bandit)
 
     async def rank(
         self, request: bandit_pb2.RankRequest, context: grpc.aio.ServicerContext
@@ -45,10 +51,14 @@ class MasterBanditServicer(bandit_pb2_grpc.BanditServicer):
         """List all predictions of the multi armed bandits."""
 
         count, explorable = request.count or 20, request.explorable
-        predictions = self.multi_armed_bandit.pull(explorable=explorable)
-        predictions = predictions[:count]
-        predictions = map(to_proto_prediction, predictions)
-        predictions = list(predictions)
+        segments = list(request.segments) or None
+        try:
+            predictions = self.multi_armed_bandit.pull(
+                explorable=explorable, k=count, segments=segments
+            )
+        except ValueError as e:
+            return bandit_pb2.RankResponse(success=False, error=str(e))
+        predictions = to_proto_predictions(predictions)
 
         logger.debug(f"Found {len(predictions)} predictions..")
 
@@ -62,38 +72,31 @@ class MasterBanditServicer(bandit_pb2_grpc.BanditServicer):
         self, request: bandit_pb2.GetRequest, context: grpc.aio.ServicerContext
     ) -> bandit_pb2.GetResponse:
         explorable = request.explorable
-        bandit = self.multi_armed_bandit.bandits.get(request.item_id, None)
-        if bandit is None:
+        prediction = self.multi_armed_bandit.get(request.item_id, explorable=explorable)
+        if prediction is None:
             return bandit_pb2.GetResponse(
                 success=False,
                 error=f"Item {request.item_id} not found.",
             )
 
-        prediction = bandit.pull(explorable=explorable)
         return bandit_pb2.GetResponse(
             success=True,
-            prediction=bandit_pb2.Prediction(
-                item_id=prediction.item_id,
-                score=prediction.score,
-                alpha=prediction.alpha,
-                beta=prediction.beta,
-            ),
+            prediction=to_proto_prediction(prediction),
         )
 
     async def samples(
         self, request: bandit_pb2.SamplesRequest, context: grpc.aio.ServicerContext
     ) -> bandit_pb2.SamplesResponse:
         item_ids, explorable = request.item_ids, request.explorable
+        segments = list(request.segments) or None
 
-        def default(item_id: str):
-            return Prediction(item_id=item_id, score=DEFAULT_BETA_DIST(), alpha=0, beta=0)
-
-        predictions = self.multi_armed_bandit.pull(explorable=explorable)
-        predictions = map(lambda x: (x.item_id, x), predictions)
-        predictions = dict(predictions)
-        predictions = [predictions.get(x, default(x)) for x in request.item_ids]
-        predictions = map(to_proto_prediction, predictions)
-        predictions = list(predictions)
+        try:
+            predictions = self.multi_armed_bandit.pull(
+                explorable=explorable, item_ids=item_ids, segments=segments
+            )
+        except ValueError as e:
+            return bandit_pb2.SamplesResponse(success=False, error=str(e))
+        predictions = to_proto_predictions(predictions)
 
         response = bandit_pb2.SamplesResponse(
             success=True,
@@ -117,9 +120,12 @@ class MasterBanditServicer(bandit_pb2_grpc.BanditServicer):
         """Update the bandit with the new observation"""
 
         c = Context(
-            item_id=request.item_id, value=request.value, updated_at=request.updated_at
+            item_id=request.item_id,
+            value=int(request.value),
+            updated_at=request.updated_at,
+            author_id=request.author_id if request.HasField("author_id") else None,
         )
-        self.multi_armed_bandit.update(c)
+        await self.writer.update([c])
 
         response = bandit_pb2.UpdateResponse(success=True)
         return response
@@ -129,7 +135,7 @@ class MasterBanditServicer(bandit_pb2_grpc.BanditServicer):
     ) -> bandit_pb2.DeleteResponse:
         """Delete the bandit"""
 
-        deleted_bandits = self.multi_armed_bandit.delete(request.item_id)
+        deleted_bandits = await self.writer.delete([request.item_id])
         deleted_bandits = [x for x in deleted_bandits if x is not None]
 
         for bandit in deleted_bandits:
@@ -1,21 +1,35 @@
+from typing import Optional
+
 import grpc
-import numpy as np
 
 import clients
 from configs import settings
+from mab.rng import LegacyEngine, RandomEngine
 from protos import bandit_pb2
 from protos import bandit_pb2_grpc
 
 
 class SlaveBanditServicer(bandit_pb2_grpc.BanditServicer):
-    def __init__(self):
+    def __init__(self, rng: Optional[RandomEngine] = None):
         self._samples = {}
+        self._rng = rng or LegacyEngine()
+        self._master: Optional[bandit_pb2_grpc.BanditStub] = None
+
+    def master(self) -> bandit_pb2_grpc.BanditStub:
+        """segment 통계는 slave 에 복제되지 않으므로 segment 를 지정한 요청은 master 로 보낸다."""
+        if self._master is None:
+            channel = grpc.aio.insecure_channel(settings.bandit_master_grpc_endpoint)
+            self._master = bandit_pb2_grpc.BanditStub(channel)
+        return self._master
 
     async def rank(
         self, request: bandit_pb2.RankRequest, context: grpc.aio.ServicerContext
     ) -> bandit_pb2.RankResponse:
         """List all predictions of the multi armed bandits"""
 
+        if request.segments:
+            return await self.master().rank(request)
+
         predictions = self._samples[request.explorable].values()
         predictions = list(predictions)
         predictions = predictions[: request.count]
@@ -27,8 +41,9 @@ class SlaveBanditServicer(bandit_pb2_grpc.BanditServicer):
     ) -> bandit_pb2.GetResponse:
         prediction = self._samples[request.explorable].get(request.item_id, None)
         if not prediction:
+            # 통계가 없는 item 의 Beta(1, 1) 은 uniform 이다.
             prediction = bandit_pb2.Prediction(
-                item_id=request.item_id, score=np.random.beta(1, 1)
+                item_id=request.item_id, score=self._rng.random()
             )
 
         response = bandit_pb2.GetResponse(success=True, prediction=prediction)
@@ -37,11 +52,20 @@ class SlaveBanditServicer(bandit_pb2_grpc.BanditServicer):
     async def samples(
         self, request: bandit_pb2.SamplesRequest, context: grpc.aio.ServicerContext
     ) -> bandit_pb2.SamplesResponse:
+        if request.segments:
+            return await self.master().samples(
+                bandit_pb2.SamplesRequest(
+                    item_ids=request.item_ids,
+                    explorable=request.explorable,
+                    segments=request.segments,
+                )
+            )
+
         def to_prediction(item_id: str) -> bandit_pb2.Prediction:
             prediction = getter(item_id, None)
             prediction = prediction or bandit_pb2.Prediction(
                 item_id=item_id,
-                score=np.random.beta(1, 1),
+                score=self._rng.random(),
                 alpha=0,
                 beta=0,
             )
@@ -69,6 +93,9 @@ class SlaveBanditServicer(bandit_pb2_grpc.BanditServicer):
     ) -> bandit_pb2.UpdateResponse:
         """Update the bandit with the new observation."""
 
+        if request.HasField("author_id"):
+            return await self.master().update(request)
+
         response = await clients.grpc.bandit.update(
             settings.bandit_master_grpc_endpoint,
             request.item_id,
@@ -1,50 +1,140 @@
+import heapq
+import math
 import time
 from collections.abc import Iterable
-from typing import Optional, Union, Dict, List
+from typing import Callable, Optional, Union, Dict, List, Tuple
 
 from loggers import logger
+from mab.interning import Interner
 
 
 class TTL:
-    def __init__(self, default_ttl: float = 60 * 60 * 24 * 1):
-        self._data: Dict[str, float] = {}
+    """
+    item 별 만료 timestamp 를 보관한다.
+
+    만료 순서는 (ttl, code) min-heap 으로 관리한다. update 나 delete 로 값이 바뀐 heap entry 는
+    바로 지우지 않고 (lazy invalidation) 꺼낼 때 _data 와 비교해서 버린다.
+    따라서 expired, pop_expired 는 전체를 훑지 않고 만료된 entry 수에 비례하는 비용만 든다.
+    버려질 entry 가 살아 있는 entry 보다 많아지면 heap 을 다시 만든다.
+
+    expire 가 주어지면 update, delete 한 번마다 만료 timestamp 가 바뀐 (item_ids, ttls) 로 한 번 호출한다.
+    삭제된 item 은 inf 로 호출된다. ThompsonMultiArmedBandit.expire_many 를 넘겨서
+    만료된 arm 을 샘플링에서 제외하는 데 사용한다.
+    """
+
+    def __init__(
+        self,
+        default_ttl: float = 60 * 60 * 24 * 1,
+        interner: Optional[Interner] = None,
+        expire: Optional[Callable[[List[str], List[float]], object]] = None,
+    ):
+        self._interner = Interner() if interner is None else interner
+        self._expire = expire
+        self._data: Dict[int, float] = {}
+        self._heap: List[Tuple[float, int]] = []
+        self._stale = 0
         self.default_ttl = default_ttl
 
     def get(self, key: str, default: float = None) -> Optional[float]:
-        return self._data.get(key, default)
+        code = self._interner.code(key)
+        if code is None:
+            return default
+        return self._data.get(code, default)
 
     def update(self, key_or_keys: Union[str, Iterable[str]], ttl: Optional[float] = None):
         if ttl is None:
             ttl = time.time() + (ttl or self.default_ttl)
 
         if isinstance(key_or_keys, str):
-            self._data[key_or_keys] = ttl
+            key_or_keys = [key_or_keys]
+        elif not isinstance(key_or_keys, Iterable):
+            logger.warn(f"Invalid key_or_keys: {key_or_keys}")
             return
 
-        if isinstance(key_or_keys, Iterable):
-            for k in key_or_keys:
-                self._data[k] = ttl
-            return
-
-        logger.warn(f"Invalid key_or_keys: {key_or_keys}")
+        # 같은 item 이 여러 번 들어와도 heap entry 와 expire 호출은 한 번만 만든다.
+        keys = list(dict.fromkeys(key_or_keys))
+        for code in self._interner.intern_many(keys).tolist():
+            self._put(code, ttl)
+        self._rebuild()
+        if self._expire is not None and keys:
+            self._expire(keys, [ttl] * len(keys))
 
     def delete(
         self, key_or_keys: Union[str, Iterable[str]]
     ) -> Union[Optional[float], List[float]]:
         if isinstance(key_or_keys, str):
-            return self._data.pop(key_or_keys, None)
+            return self.delete([key_or_keys])[0]
 
-        if isinstance(key_or_keys, Iterable):
-            getter = self._data.get
-            deleted = [getter(k, None) for k in key_or_keys]
-            self._data = {k: v for k, v in self._data.items() if k not in key_or_keys}
-            return deleted
+        if not isinstance(key_or_keys, Iterable):
+            logger.warn(f"Invalid key_or_keys: {key_or_keys}")
+            return
 
-        logger.warn(f"Invalid key_or_keys: {key_or_keys}")
+        code = self._interner.code
+        keys = list(key_or_keys)
+        ttls = [self._pop(code(k)) for k in keys]
+        self._rebuild()
+        deleted = [k for k, ttl in zip(keys, ttls) if ttl is not None]
+        if self._expire is not None and deleted:
+            self._expire(deleted, [math.inf] * len(deleted))
+        return ttls
 
     def items(self):
-        return self._data.items()
+        name = self._interner.name
+        return [(name(k), v) for k, v in self._data.items()]
+
+    def expired(self) -> List[str]:
+        """
+        만료된 item 을 만료 순서와 무관하게 반환한다. TTL 은 바뀌지 않는다.
 
-    def expired(self):
-        current_timestamp = time.time()
-        return [k for k, v in self._data.items() if v < current_timestamp]
+        heap 에서 만료된 entry 의 자식만 따라 내려가므로 만료된 entry 수에 비례한다.
+        """
+        now = time.time()
+        heap, data = self._heap, self._data
+        expired, stack = {}, [0] if heap else []
+        while stack:
+            i = stack.pop()
+            ttl, code = heap[i]
+            if ttl >= now:
+                continue
+            if data.get(code, None) == ttl:
+                expired[code] = None
+            stack.extend(x for x in (2 * i + 1, 2 * i + 2) if x < len(heap))
+        return self._interner.names(expired)
+
+    def pop_expired(self, limit: Optional[int] = None) -> List[str]:
+        """
+        만료된 item 을 만료된 순서대로 최대 limit 개 꺼내서 TTL 에서 지운다.
+
+        :param limit: 한 번에 꺼낼 최대 item 수, None 이면 만료된 item 을 모두 꺼낸다.
+        """
+        now = time.time()
+        heap, data = self._heap, self._data
+        expired = []
+        while heap and heap[0][0] < now and (limit is None or len(expired) < limit):
+            ttl, code = heapq.heappop(heap)
+            if data.get(code, None) == ttl:
+                del data[code]
+                expired.append(code)
+            else:
+                self._stale -= 1
+        return self._interner.names(expired)
+
+    def _put(self, code: int, ttl: float):
+        if code in self._data:
+            self._stale += 1
+        self._data[code] = ttl
+        heapq.heappush(self._heap, (ttl, code))
+
+    def _pop(self, code: Optional[int]) -> Optional[float]:
+        if code is None or code not in self._data:
+            return None
+        self._stale += 1
+        return self._data.pop(code)
+
+    def _rebuild(self):
+        """버려질 entry 가 살아 있는 entry 보다 많으면 heap 을 _data 로 다시 만든다."""
+        if self._stale <= max(len(self._data), 1024):
+            return
+        self._heap = [(ttl, code) for code, ttl in self._data.items()]
+        heapq.heapify(self._heap)
+        self._stale = 0
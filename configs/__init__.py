@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic_settings import BaseSettings
 
 
@@ -11,9 +13,63 @@ class Settings(BaseSettings):
     # PROMETHEUS
     metrics_port: int = 80
 
+    # KAFKA
+    # 비어 있지 않으면 재시작할 때 snapshot 의 watermark 시각으로 topic 을 seek 한다.
+    kafka_bootstrap_servers: str = ""
+
     # TTL
     default_ttl: int = 60 * 60 * 24 * 7
     ttl_cleanup_interval: int = 600 * 12
+    ttl_expiry_limit: int = 10000
+
+    # OBSERVABLE
+    observable_queue_size: int = 1000
+    observable_batch_size: int = 100
+    observable_linger_seconds: float = 0.005
+    observable_subscriber_queue_size: int = 0
+
+    # AGGREGATION
+    trace_aggregation_interval_seconds: float = 0.05
+    trace_aggregation_max_items: int = 10000
+
+    # RANDOM
+    rng_engine: str = "legacy"
+    rng_seed: Optional[int] = None
+    rng_buffer_size: int = 0
+
+    # SAMPLING
+    sampling_kernel: str = "exact"
+    sampling_kernel_threshold: int = 100
+    sampling_processes: int = 0
+    sampling_sharding_threshold: int = 100000
+
+    # WINDOW
+    window: str = "count"
+    window_half_life_seconds: float = 60 * 60 * 24
+    window_buckets: int = 24
+    window_bucket_seconds: float = 60 * 60
+    # 새 context 가 없는 "bucket" window 의 오래된 bucket 을 빼는 주기와 한 번에 처리할 arm 수
+    window_advance_interval_seconds: int = 60
+    window_advance_limit: int = 10000
+
+    # SEGMENT
+    segmented: bool = False
+
+    # READ VIEW
+    read_view_interval_seconds: float = 0.005
+
+    # COMPACTION
+    compaction_interval_seconds: int = 60
+    compaction_limit: int = 10000
+
+    # SNAPSHOT
+    snapshot_directory: str = ""
+    snapshot_interval_seconds: int = 60 * 10
+
+    # JOURNAL
+    # snapshot 을 기록할 때만 truncate 되므로 snapshot_directory 와 함께 설정해야 한다.
+    journal_directory: str = ""
+    journal_commit_interval_seconds: float = 0.05
 
     bandit_master_grpc_endpoint: str = ""
     bandit_slave_grpc_endpoint: str = ""
@@ -1,17 +1,13 @@
 import abc
-from typing import NoReturn, TypeVar, List
+from typing import Awaitable, NoReturn, Optional, TypeVar, List
 
-import annotations
-from caches import TTL
-from loggers import logger
-from mab import Context, ThompsonMultiArmedBandit
-from observable import Observable
+from mab import Context
+from observable import BatchObservable, Observable
+from writers import Writer
 
 T1 = TypeVar("T1")
 T2 = TypeVar("T2")
 
-awaitable = annotations.awaitable(max_worker=1)
-
 
 class Connector(abc.ABC):
     def update(self, data: T1) -> NoReturn:
@@ -21,45 +17,42 @@ class Connector(abc.ABC):
         pass
 
 
-class MABConnector(Connector):
-    def __init__(
-        self, mab: ThompsonMultiArmedBandit, updatable: Observable, deletable: Observable
-    ):
-        self.mab = mab
-        self.updatable = updatable
-        self.deletable = deletable
-
-        self.updatable.subscribe(callback=self.update)
-        self.deletable.subscribe(callback=self.delete)
-
-    @awaitable
-    def update(self, context: Context) -> NoReturn:
-        logger.info(f"MABConnector.Update: {context}")
-        self.mab.update(context)
-
-    @awaitable
-    def delete(self, item_ids: List[str]) -> NoReturn:
-        logger.info(f"MABConnector.Delete: {item_ids}")
-        self.mab.delete(item_ids)
+class WriterConnector(Connector):
+    """
+    updatable, deletable 을 writers.Writer 에 연결한다.
 
+    thread pool 을 거치지 않고 command 를 writer 의 queue 에 넣기만 하며,
+    반환된 future 를 Observable 이 기다리므로 writer 가 밀리면 publish 도 함께 느려진다.
+    """
 
-class TTLConnector(Connector):
     def __init__(
-        self, ttl: TTL, updatable: Observable[Context], deletable: Observable[List[str]]
+        self,
+        writer: Writer,
+        updatable: Observable[Context],
+        deletable: Observable[List[str]],
+        queue_size: Optional[int] = None,
     ):
-        self.ttl = ttl
+        self.writer = writer
         self.updatable = updatable
         self.deletable = deletable
 
-        self.updatable.subscribe(callback=self.update)
-        self.deletable.subscribe(callback=self.delete)
+        batched = isinstance(self.updatable, BatchObservable)
+        self.updatable.subscribe(
+            callback=self.update_many if batched else self.update, max_size=queue_size
+        )
+        batched = isinstance(self.deletable, BatchObservable)
+        self.deletable.subscribe(
+            callback=self.delete_many if batched else self.delete, max_size=queue_size
+        )
+
+    def update(self, context: Context) -> Awaitable:
+        return self.writer.update([context])
+
+    def update_many(self, contexts: List[Context]) -> Awaitable:
+        return self.writer.update(contexts)
 
-    @awaitable
-    def update(self, context: Context) -> NoReturn:
-        logger.info(f"TTLConnector.Update: {context}")
-        self.ttl.update(context.item_id)
+    def delete(self, item_ids: List[str]) -> Awaitable:
+        return self.writer.delete(item_ids)
 
-    @awaitable
-    def delete(self, item_ids: List[str]) -> NoReturn:
-        logger.info(f"TTLConnector.Delete: {item_ids}")
-        self.ttl.delete(item_ids)
+    def delete_many(self, batches: List[List[str]]) -> Awaitable:
+        return self.writer.delete([x for item_ids in batches for x in item_ids])
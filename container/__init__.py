@@ -9,52 +9,92 @@ class Container(containers.DeclarativeContainer):
     config = providers.Configuration()
 
     updatable = providers.Singleton(
-        "observable.Observable",
-        max_size=10,
+        "observable.BatchObservable",
+        max_size=settings.observable_queue_size,
+        batch_size=settings.observable_batch_size,
+        linger=settings.observable_linger_seconds,
     )
 
     deletable = providers.Singleton(
         "observable.Observable",
-        max_size=10,
+        max_size=settings.observable_queue_size,
     )
 
-    ttl = providers.Singleton(
-        "caches.TTL",
-        default_ttl=settings.default_ttl,
+    trace_updatable = providers.Singleton(
+        "observable.AggregateObservable",
+        max_size=settings.observable_queue_size,
+        interval=settings.trace_aggregation_interval_seconds,
+        max_items=settings.trace_aggregation_max_items,
+        downstream=updatable,
+    )
+
+    interner = providers.Singleton(
+        "mab.interning.Interner",
+    )
+
+    rng = providers.Singleton(
+        "mab.rng.build",
+        engine=settings.rng_engine,
+        seed=settings.rng_seed,
+        buffer_size=settings.rng_buffer_size,
+    )
+
+    journal = providers.Singleton(
+        "mab.journal.build",
+        directory=settings.journal_directory,
+        commit_interval=settings.journal_commit_interval_seconds,
+        snapshot_directory=settings.snapshot_directory,
     )
 
     multi_armed_bandit = providers.Singleton(
         "mab.ThompsonMultiArmedBandit",
+        rng=rng,
+        kernel=settings.sampling_kernel,
+        kernel_threshold=settings.sampling_kernel_threshold,
+        processes=settings.sampling_processes,
+        sharding_threshold=settings.sampling_sharding_threshold,
+        journal=journal,
+        interner=interner,
+        window=settings.window,
+        half_life=settings.window_half_life_seconds,
+        buckets=settings.window_buckets,
+        bucket_seconds=settings.window_bucket_seconds,
+        segmented=settings.segmented,
+        publish_interval=settings.read_view_interval_seconds,
+    )
+
+    ttl = providers.Singleton(
+        "caches.TTL",
+        default_ttl=settings.default_ttl,
+        interner=interner,
+        expire=multi_armed_bandit.provided.expire_many,
     )
 
     item_stream = providers.Singleton(
         "streamable.ItemStream",
         updatable=updatable,
         deletable=deletable,
+        interner=interner,
     )
 
     trace_stream = providers.Singleton(
         "streamable.TraceStream",
-        updatable=updatable,
+        updatable=trace_updatable,
+        interner=interner,
     )
 
-    ttl_connector = providers.Singleton(
-        "connectors.TTLConnector",
+    writer = providers.Singleton(
+        "writers.Writer",
+        multi_armed_bandit=multi_armed_bandit,
         ttl=ttl,
-        updatable=updatable,
-        deletable=deletable,
     )
 
-    mab_connector = providers.Singleton(
-        "connectors.MABConnector",
-        mab=multi_armed_bandit,
+    writer_connector = providers.Singleton(
+        "connectors.WriterConnector",
+        writer=writer,
         updatable=updatable,
         deletable=deletable,
-    )
-
-    ttl_interceptor = providers.Singleton(
-        "backends.grpc.interceptors.ttl.TTLInterceptor",
-        ttl=ttl,
+        queue_size=settings.observable_subscriber_queue_size or None,
     )
 
     welcome_interceptor = providers.Singleton(
@@ -77,7 +117,6 @@ class Container(containers.DeclarativeContainer):
         welcome_interceptor,
         request_counter_interceptor,
         request_latency_interceptor,
-        ttl_interceptor,
     )
 
     slave_interceptors = providers.List(
@@ -90,10 +129,12 @@ class Container(containers.DeclarativeContainer):
     master_bandit_servicer = providers.Singleton(
         "backends.grpc.servicers.MasterBanditServicer",
         multi_armed_bandit=multi_armed_bandit,
+        writer=writer,
     )
 
     slave_bandit_servicer = providers.Singleton(
         "backends.grpc.servicers.SlaveBanditServicer",
+        rng=rng,
     )
 
     health_servicer = providers.Singleton(
@@ -119,6 +160,14 @@ class Container(containers.DeclarativeContainer):
         deletable=deletable,
         ttl=ttl,
         seconds=settings.ttl_cleanup_interval,
+        expiry_limit=settings.ttl_expiry_limit,
+        writer=writer,
+        snapshot_directory=settings.snapshot_directory,
+        snapshot_seconds=settings.snapshot_interval_seconds,
+        compaction_seconds=settings.compaction_interval_seconds,
+        compaction_limit=settings.compaction_limit,
+        advance_seconds=settings.window_advance_interval_seconds,
+        advance_limit=settings.window_advance_limit,
     )
 
     slave_scheduler = providers.Callable(
@@ -0,0 +1,44 @@
+"""
+Side-by-side benchmark of the count, exponentially decayed and time-bucketed windows.
+
+- memory: bytes held by one arm's window after a stream of contexts.
+- throughput: contexts applied per second to a single arm.
+- drift: how quickly each window follows a click rate that drops from 10% to 2%.
+"""
+import time
+
+import numpy as np
+
+from mab import Context
+from mab import windows
+
+N = 200000
+rng = np.random.default_rng(0)
+rates = np.where(np.arange(N) < N // 2, 0.1, 0.02)
+values = (rng.random(N) < rates).astype(int)
+contexts = [
+    Context(item_id="item", value=int(v), updated_at=x) for x, v in enumerate(values)
+]
+
+print(f"== {N} contexts on one arm, click rate 10% -> 2% at {N // 2} ==")
+for name, window in [
+    ("count(pool_size=1000)", windows.build("count", "item", pool_size=1000)),
+    ("count(pool_size=100000)", windows.build("count", "item", pool_size=100000)),
+    ("decayed(half_life=1000)", windows.build("decayed", "item", half_life=1000)),
+    (
+        "bucket(24 x 100s)",
+        windows.build("bucket", "item", buckets=24, bucket_seconds=100),
+    ),
+]:
+    start = time.perf_counter()
+    checkpoints = {}
+    for x, c in enumerate(contexts):
+        window.append(c)
+        if x + 1 in (N // 2 + 1000, N // 2 + 5000, N):
+            checkpoints[x + 1] = window.alpha / max(window.alpha + window.beta, 1e-12)
+    took = time.perf_counter() - start
+    drift = " ".join(f"{k}:{v:.3f}" for k, v in checkpoints.items())
+    print(
+        f"{name:<26} nbytes={window.nbytes:>8} "
+        f"updates/s={N / took:>10.0f} mean@{drift}"
+    )
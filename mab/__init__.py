@@ -1,8 +1,11 @@
 from mab.context import Context
+from mab.store import ArmStore, ArmView
 from mab.thomson import ThompsonBandit
 from mab.thomson import ThompsonMultiArmedBandit
 
 __all__ = [
+    "ArmStore",
+    "ArmView",
     "Context",
     "ThompsonBandit",
     "ThompsonMultiArmedBandit",
@@ -7,3 +7,5 @@ class Context:
     value: int
     updated_at: float
     author_id: str | None = None
+    # 같은 context 가 반복된 횟수, 여러 event 를 하나로 합쳐서 반영할 때 사용한다.
+    count: int = 1
@@ -0,0 +1,81 @@
+import threading
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+class Interner:
+    """
+    item_id 문자열과 0 부터 빈틈없이 증가하는 int32 code 를 서로 변환한다.
+
+    문자열은 ingestion 경계에서 한 번만 hash 하고, 내부 자료구조는 code 로 배열을 index 한다.
+    같은 문자열에는 항상 같은 str 객체를 돌려주므로 item_id 문자열이 여러 곳에 복제되지 않는다.
+    release 로 반납한 code 는 새 문자열에 다시 발급되므로, code 의 상한은 살아 있는 문자열 수를 따라간다.
+    """
+
+    def __init__(self):
+        self._codes: Dict[str, int] = {}
+        self._names: List[Optional[str]] = []
+        self._free: List[int] = []
+        self._lock = threading.Lock()
+
+    def intern(self, name: str) -> int:
+        code = self._codes.get(name, None)
+        if code is not None:
+            return code
+        with self._lock:
+            code = self._codes.get(name, None)
+            if code is None:
+                if self._free:
+                    code = self._free.pop()
+                    self._names[code] = name
+                else:
+                    code = len(self._names)
+                    self._names.append(name)
+                self._codes[name] = code
+            return code
+
+    def release(self, codes: Iterable[int]):
+        """
+        더 이상 아무도 참조하지 않는 codes 를 반납한다.
+
+        반납한 code 는 다른 문자열에 다시 발급되므로, 호출하는 쪽은 code 를 들고 있는 자료구조에서
+        해당 code 가 모두 빠진 뒤에 호출해야 한다.
+        """
+        with self._lock:
+            for code in codes:
+                name = self._names[code]
+                if name is None:
+                    continue
+                del self._codes[name]
+                self._names[code] = None
+                self._free.append(code)
+
+    def intern_many(self, names: Iterable[str]) -> np.ndarray:
+        return np.fromiter((self.intern(x) for x in names), dtype=np.int32)
+
+    def code(self, name: str) -> Optional[int]:
+        """name 의 code, 등록되지 않았으면 None."""
+        return self._codes.get(name, None)
+
+    def codes(self, names: Iterable[str]) -> np.ndarray:
+        """names 의 code 배열, 등록되지 않은 name 은 -1."""
+        getter = self._codes.get
+        return np.fromiter((getter(x, -1) for x in names), dtype=np.int32)
+
+    def name(self, code: int) -> str:
+        return self._names[code]
+
+    def names(self, codes: Iterable[int]) -> List[str]:
+        names = self._names
+        return [names[x] for x in codes]
+
+    def __len__(self) -> int:
+        """발급된 적 있는 code 의 상한, code 로 index 하는 배열의 길이로 사용한다."""
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._codes
+
+    def __str__(self):
+        return f"Interner: {len(self._codes)} names, {len(self._free)} free codes"
@@ -0,0 +1,204 @@
+import os
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
+
+from mab.context import Context
+
+UPDATE, DELETE = 1, 2
+
+# Context.count 가 1 보다 큰 UPDATE, author_id 뒤에 count 가 붙는다.
+_COUNTED = 3
+
+# crc32, kind, value, updated_at, item_id 길이, author_id 길이 + item_id, author_id (utf-8)
+_HEADER = struct.Struct("<IBidHH")
+_COUNT = struct.Struct("<I")
+
+_SUFFIX = ".wal"
+
+Record = Tuple[int, Union[Context, str]]
+
+
+class Journal:
+    """
+    ThompsonMultiArmedBandit 에 반영된 update, delete 를 기록하는 append-only write-ahead log.
+
+    record 는 메모리 buffer 에 모았다가 commit_interval 마다 background thread 에서 한 번에
+    write + fsync 한다. (group commit) 따라서 process 가 죽으면 최대 commit_interval 동안의
+    record 를 잃을 수 있다.
+
+    log 는 segment 파일로 나뉘며, snapshot 을 기록하기 직전에 rotate 로 새 segment 를 열고
+    snapshot 이 완료되면 truncate 로 이전 segment 를 지운다. 재시작 시에는 snapshot 이후의
+    segment 만 replay 하면 된다.
+    """
+
+    def __init__(self, directory: Union[str, Path], commit_interval: float = 0.05):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.commit_interval = commit_interval
+
+        segments = self.segments()
+        self._segment = segments[-1] + 1 if segments else 0
+        self._stream = open(self._path(self._segment), "ab")
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._committer = threading.Thread(target=self._run, daemon=True)
+        self._committer.start()
+
+    @property
+    def segment(self) -> int:
+        """현재 기록 중인 segment 번호."""
+        return self._segment
+
+    def segments(self) -> List[int]:
+        return sorted(int(x.stem) for x in self.directory.glob(f"*{_SUFFIX}"))
+
+    def update(self, c: Context):
+        self.update_many([c])
+
+    def update_many(self, contexts: List[Context]):
+        """
+        contexts 를 모두 encode 한 뒤 한 번에 buffer 에 붙인다.
+
+        encode 할 수 없는 context 가 있으면 아무것도 기록하지 않고 예외를 그대로 던지므로,
+        반영하기 전에 호출하면 기록되지 않은 변경이 반영되는 일이 없다.
+        """
+        records = bytearray()
+        for c in contexts:
+            if c.count == 1:
+                records += _encode(UPDATE, c.item_id, c.value, c.updated_at, c.author_id)
+            else:
+                count = _COUNT.pack(c.count)
+                records += _encode(
+                    _COUNTED, c.item_id, c.value, c.updated_at, c.author_id, count
+                )
+        self._append(records)
+
+    def delete(self, item_id: str):
+        self.delete_many([item_id])
+
+    def delete_many(self, item_ids: List[str]):
+        records = bytearray()
+        for item_id in item_ids:
+            records += _encode(DELETE, item_id, 0, float("nan"), None)
+        self._append(records)
+
+    def commit(self):
+        """buffer 에 쌓인 record 를 파일에 쓰고 fsync 한다."""
+        with self._lock:
+            self._commit()
+
+    def rotate(self) -> int:
+        """
+        지금까지의 record 를 commit 하고 새 segment 를 연다.
+
+        :return: 새 segment 번호, 이 번호 이상의 segment 에 이후의 record 가 기록된다.
+        """
+        with self._lock:
+            self._commit()
+            self._stream.close()
+            self._segment += 1
+            self._stream = open(self._path(self._segment), "ab")
+            return self._segment
+
+    def truncate(self, segment: int):
+        """segment 번호보다 앞선 segment 파일을 지운다."""
+        for x in self.segments():
+            if x < segment:
+                self._path(x).unlink(missing_ok=True)
+
+    def replay(self, segment: int = 0) -> Iterator[Record]:
+        """
+        segment 번호 이상인 segment 의 record 를 기록된 순서대로 반환한다.
+
+        마지막 record 가 기록 도중 잘렸거나 손상되었으면 그 segment 는 거기까지만 읽는다.
+        """
+        for x in self.segments():
+            if segment <= x < self._segment:
+                yield from _read(self._path(x).read_bytes())
+
+    def close(self):
+        self._closed.set()
+        self._committer.join()
+        with self._lock:
+            self._commit()
+            self._stream.close()
+
+    def _append(self, records: bytes):
+        with self._lock:
+            self._buffer += records
+
+    def _commit(self):
+        if not self._buffer:
+            return
+        self._stream.write(self._buffer)
+        self._stream.flush()
+        os.fsync(self._stream.fileno())
+        self._buffer.clear()
+
+    def _run(self):
+        while not self._closed.wait(self.commit_interval):
+            self.commit()
+
+    def _path(self, segment: int) -> Path:
+        return self.directory / f"{segment:020d}{_SUFFIX}"
+
+
+def build(
+    directory: str = "", commit_interval: float = 0.05, snapshot_directory: str = ""
+) -> Optional[Journal]:
+    """
+    Settings 값으로 Journal 을 만든다. directory 가 비어 있으면 journal 을 쓰지 않는다.
+
+    journal 은 snapshot 이 기록될 때만 truncate 되므로 snapshot_directory 없이는 끝없이 자란다.
+    """
+    if not directory:
+        return None
+    if not snapshot_directory:
+        raise ValueError(
+            "Journal requires a snapshot directory to checkpoint and truncate it."
+        )
+    return Journal(directory, commit_interval=commit_interval)
+
+
+def _encode(
+    kind: int,
+    item_id: str,
+    value: float,
+    updated_at: float,
+    author_id: Optional[str],
+    suffix: bytes = b"",
+) -> bytes:
+    """crc32 를 앞에 붙인 record 하나, value 는 gRPC 에서 float 로 들어오므로 int 로 기록한다."""
+    item_id = item_id.encode("utf-8")
+    author_id = author_id.encode("utf-8") if author_id else b""
+    header = _HEADER.pack(0, kind, int(value), updated_at, len(item_id), len(author_id))
+    payload = header[4:] + item_id + author_id + suffix
+    return struct.pack("<I", zlib.crc32(payload)) + payload
+
+
+def _read(data: bytes) -> Iterator[Record]:
+    position = 0
+    while position + _HEADER.size <= len(data):
+        crc, kind, value, updated_at, n_item, n_author = _HEADER.unpack_from(
+            data, position
+        )
+        start = position + _HEADER.size
+        strings = start + n_item + n_author
+        stop = strings + (_COUNT.size if kind == _COUNTED else 0)
+        if stop > len(data) or zlib.crc32(data[position + 4 : stop]) != crc:
+            return
+
+        item_id = data[start : start + n_item].decode("utf-8")
+        author_id = data[start + n_item : strings].decode("utf-8") or None
+        if kind == UPDATE:
+            yield UPDATE, Context(item_id, value, updated_at, author_id)
+        elif kind == _COUNTED:
+            (count,) = _COUNT.unpack_from(data, strings)
+            yield UPDATE, Context(item_id, value, updated_at, author_id, count)
+        else:
+            yield DELETE, item_id
+        position = stop
@@ -0,0 +1,117 @@
+from typing import Callable, Dict, Optional
+
+import numpy as np
+
+from mab.rng import RandomEngine
+
+Kernel = Callable[..., np.ndarray]
+
+# 정규분포로 근사할 수 있는 Beta 분포의 최대 왜도, KS 거리로 약 0.003 에 해당한다.
+MAX_SKEWNESS = 0.05
+
+
+def exact(
+    rng: RandomEngine,
+    alphas: np.ndarray,
+    betas: np.ndarray,
+    threshold: Optional[float] = None,
+) -> np.ndarray:
+    """모든 arm 을 Beta 분포에서 그대로 샘플링한다."""
+    return rng.beta(alphas, betas)
+
+
+def approximate(
+    rng: RandomEngine,
+    alphas: np.ndarray,
+    betas: np.ndarray,
+    threshold: float = 100,
+    max_skewness: float = MAX_SKEWNESS,
+) -> np.ndarray:
+    """
+    alpha, beta 가 모두 threshold 이상이고 왜도가 max_skewness 이하인 arm 은
+    평균과 분산이 같은 정규분포로 근사해서 샘플링한다.
+
+    - mean: a / (a + b)
+    - variance: a * b / ((a + b)^2 * (a + b + 1))
+    - skewness: 2 (b - a) sqrt(a + b + 1) / ((a + b + 2) sqrt(a b))
+
+    평균이 0 이나 1 에 가까운 arm 은 count 가 커도 왜도가 커서 정규분포와 구분되므로 제외한다.
+    나머지 arm 은 exact 와 동일하게 Beta 분포에서 샘플링한다.
+    """
+    total = alphas + betas
+    product = alphas * betas
+    large = np.minimum(alphas, betas) >= threshold
+    if large.any():
+        # skewness^2 <= max_skewness^2 를 sqrt 없이 비교한다.
+        difference = betas - alphas
+        np.multiply(difference, difference, out=difference)
+        large &= (
+            4 * difference * (total + 1) <= max_skewness**2 * (total + 2) ** 2 * product
+        )
+    if not large.any():
+        return rng.beta(alphas, betas)
+
+    if large.all():
+        means = alphas / total
+        stds = np.sqrt(product / (total * total * (total + 1)))
+        return np.clip(means + stds * rng.standard_normal(len(alphas)), 0, 1)
+
+    samples = np.empty(len(alphas), dtype=np.float64)
+    small = ~large
+    samples[small] = rng.beta(alphas[small], betas[small])
+
+    a, total, product = alphas[large], total[large], product[large]
+    means = a / total
+    stds = np.sqrt(product / (total * total * (total + 1)))
+    normals = rng.standard_normal(len(a))
+    samples[large] = np.clip(means + stds * normals, 0, 1)
+    return samples
+
+
+KERNELS: Dict[str, Kernel] = {
+    "exact": exact,
+    "approximate": approximate,
+}
+
+
+def sample_scores(
+    rng: RandomEngine,
+    alphas: np.ndarray,
+    betas: np.ndarray,
+    explores: Optional[np.ndarray] = None,
+    kernel: str = "exact",
+    threshold: float = 100,
+) -> np.ndarray:
+    """
+    arm 별 score 를 샘플링한다.
+
+    - reward: Beta(alpha + 1, beta + 1) 에서 kernel 로 샘플링한 값.
+    - regret: Beta(log(alpha + 1) + 1, log(beta + 1) + 1) 에서 샘플링한 탐험용 값.
+    - score: reward * (1 - explore) + regret * explore, explores 가 None 이면 reward.
+    """
+    alphas, betas = alphas + 1, betas + 1
+    regret_a, regret_b = np.log(alphas) + 1, np.log(betas) + 1
+
+    rewards = KERNELS[kernel](rng, alphas, betas, threshold=threshold)
+
+    if explores is None:
+        return rewards
+
+    regrets = rng.beta(regret_a, regret_b)
+    exploits = 1 - explores
+    return (rewards * exploits) + (regrets * explores)
+
+
+def top_k(scores: np.ndarray, k: Optional[int] = None) -> np.ndarray:
+    """
+    scores 가 큰 순서대로 상위 k 개의 index 를 반환한다.
+
+    argpartition 으로 상위 k 개를 먼저 고른 뒤 그 k 개만 정렬하므로 O(N + k log k) 이다.
+    """
+    size = len(scores)
+    if k is None or k >= size:
+        return np.argsort(scores)[::-1]
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    winners = np.argpartition(scores, size - k)[size - k :]
+    return winners[np.argsort(scores[winners])[::-1]]
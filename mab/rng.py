@@ -0,0 +1,177 @@
+import abc
+import concurrent.futures
+import threading
+from typing import List, Optional, Union
+
+import numpy as np
+
+Size = Optional[Union[int, tuple]]
+
+BIT_GENERATORS = {
+    "pcg64": np.random.PCG64,
+    "philox": np.random.Philox,
+}
+
+
+class RandomEngine(abc.ABC):
+    """bandit 샘플링에 쓰이는 난수 생성기의 공통 interface."""
+
+    @abc.abstractmethod
+    def beta(self, a, b, size: Size = None):
+        pass
+
+    @abc.abstractmethod
+    def random(self, size: Size = None):
+        pass
+
+    @abc.abstractmethod
+    def standard_normal(self, size: Size = None):
+        pass
+
+    @abc.abstractmethod
+    def spawn(self, n: int) -> List["GeneratorEngine"]:
+        """
+        서로 독립적인 stream 을 가진 n 개의 engine 을 만든다. (process worker 용)
+
+        이 engine 의 seed 에서 파생되므로 seed 가 같으면 같은 engine 들이 만들어진다.
+        """
+        pass
+
+
+class LegacyEngine(RandomEngine):
+    """전역 np.random 을 그대로 사용한다. np.random.seed 로 재현 가능한 기본 engine."""
+
+    def beta(self, a, b, size: Size = None):
+        return np.random.beta(a, b, size)
+
+    def random(self, size: Size = None):
+        return np.random.random(size)
+
+    def standard_normal(self, size: Size = None):
+        return np.random.standard_normal(size)
+
+    def spawn(self, n: int) -> List["GeneratorEngine"]:
+        seeds = np.random.randint(0, 2**32, size=n, dtype=np.uint64)
+        return [GeneratorEngine(seed=int(x)) for x in seeds]
+
+
+class GeneratorEngine(RandomEngine):
+    """
+    numpy.random.Generator 기반 engine.
+
+    thread 마다 SeedSequence 에서 분기한 독립적인 Generator 를 사용하므로 lock 없이 안전하며,
+    seed 를 지정하면 benchmark 등에서 재현 가능하다.
+    """
+
+    def __init__(
+        self,
+        seed: Union[None, int, np.random.SeedSequence] = None,
+        bit_generator: str = "pcg64",
+    ):
+        if bit_generator not in BIT_GENERATORS:
+            raise ValueError(f"Invalid bit generator: {bit_generator}")
+        if isinstance(seed, np.random.SeedSequence):
+            self._seed_sequence = seed
+        else:
+            self._seed_sequence = np.random.SeedSequence(seed)
+        self._bit_generator = bit_generator
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def seed_sequence(self) -> np.random.SeedSequence:
+        """pickle 할 수 있는 seed, 다른 process 에서 같은 stream 의 engine 을 만들 때 쓴다."""
+        return self._seed_sequence
+
+    @property
+    def generator(self) -> np.random.Generator:
+        generator = getattr(self._local, "generator", None)
+        if generator is None:
+            with self._lock:
+                (seed_sequence,) = self._seed_sequence.spawn(1)
+            bit_generator = BIT_GENERATORS[self._bit_generator](seed_sequence)
+            generator = np.random.Generator(bit_generator)
+            self._local.generator = generator
+        return generator
+
+    def beta(self, a, b, size: Size = None):
+        return self.generator.beta(a, b, size)
+
+    def random(self, size: Size = None):
+        return self.generator.random(size)
+
+    def standard_normal(self, size: Size = None):
+        return self.generator.standard_normal(size)
+
+    def spawn(self, n: int) -> List["GeneratorEngine"]:
+        with self._lock:
+            seed_sequences = self._seed_sequence.spawn(n)
+        return [GeneratorEngine(x, self._bit_generator) for x in seed_sequences]
+
+
+class _Buffer:
+    """background thread 에서 미리 채워두는 double buffer."""
+
+    def __init__(self, draw, size: int, executor: concurrent.futures.Executor):
+        self._draw = draw
+        self._size = size
+        self._executor = executor
+        self._current = draw(size)
+        self._position = 0
+        self._next = executor.submit(draw, size)
+        self._lock = threading.Lock()
+
+    def take(self, size: Size):
+        count = int(np.prod(size)) if size is not None else 1
+        if count > self._size:
+            values = self._draw(count)
+        else:
+            with self._lock:
+                if self._position + count > self._size:
+                    self._current = self._next.result()
+                    self._position = 0
+                    self._next = self._executor.submit(self._draw, self._size)
+                start, self._position = self._position, self._position + count
+                values = self._current[start : self._position]
+        return values[0] if size is None else values.reshape(size)
+
+
+class BufferedEngine(RandomEngine):
+    """
+    uniform / standard normal 난수를 background thread 에서 미리 뽑아 두는 engine.
+
+    beta 는 모수가 arm 마다 다르므로 미리 뽑을 수 없어 내부 engine 에 그대로 위임하고,
+    모수가 고정된 uniform (= Beta(1, 1)) 과 standard normal 만 buffer 에서 꺼내 쓴다.
+    """
+
+    def __init__(self, engine: GeneratorEngine, size: int = 2**16):
+        (refill,) = engine.spawn(1)
+        self._engine = engine
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._uniforms = _Buffer(lambda n: refill.random(n), size, self._executor)
+        self._normals = _Buffer(lambda n: refill.standard_normal(n), size, self._executor)
+
+    def beta(self, a, b, size: Size = None):
+        return self._engine.beta(a, b, size)
+
+    def random(self, size: Size = None):
+        return self._uniforms.take(size)
+
+    def standard_normal(self, size: Size = None):
+        return self._normals.take(size)
+
+    def spawn(self, n: int) -> List[GeneratorEngine]:
+        return self._engine.spawn(n)
+
+
+def build(engine: str = "legacy", seed: Optional[int] = None, buffer_size: int = 0):
+    """Settings 값으로 RandomEngine 을 만든다."""
+    if engine == "legacy":
+        if seed is not None:
+            np.random.seed(seed)
+        return LegacyEngine()
+
+    generator = GeneratorEngine(seed=seed, bit_generator=engine)
+    if buffer_size:
+        return BufferedEngine(generator, size=buffer_size)
+    return generator
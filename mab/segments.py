@@ -0,0 +1,367 @@
+import math
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+from mab import snapshot
+from mab import windows
+from mab.context import Context
+from mab.interning import Interner
+from mab.store import ArmStore, ArmView, decay_factors
+from mab.windows import Expiries, Window
+
+# pair 이름에서 segment 와 item_id 를 나누는 문자.
+_SEPARATOR = "\x00"
+
+
+class SegmentStore:
+    """
+    segment (Context.author_id) 별 arm 통계를 (segment, item) 쌍 단위로 보관한다.
+
+    (segment, item) 쌍마다 pair code 를 발급하고, 모든 쌍의 alpha, beta 를 하나의 ArmStore 배열에 넣는다.
+    pair code -> segment code, item code 는 int32 배열로 관리하므로 한 segment 만 고르거나
+    여러 segment 를 item 별로 합산하는 일이 segment 수와 무관하게 배열 연산 한 번으로 끝난다.
+
+    item code 는 ThompsonMultiArmedBandit 의 Interner 를, segment code 는 별도의 Interner 를 사용한다.
+    pair code 는 "segment\\x00item_id" 이름의 Interner code 이므로 snapshot 에 ArmStore 와 같은 형식으로
+    기록되고, window 는 ThompsonBandit 과 같이 처음 update 될 때 snapshot 에서 복원된다.
+    """
+
+    def __init__(self, build: Callable[[str], Window], capacity: int = 1024):
+        """
+        :param build: item_id 로 (segment, item) 쌍의 빈 window 를 만드는 함수.
+        """
+        self._build = build
+        self._capacity = capacity
+        self._segments = Interner()
+        self._pairs: Dict[Tuple[int, int], int] = {}
+        self._by_item: Dict[int, List[int]] = {}
+        self._windows: Dict[int, Window] = {}
+        self._expiries = Expiries()
+        # 직전 snapshot 이후 window 가 바뀐 pair, snapshot 이 기록 중인 pair
+        self._dirty: Set[int] = set()
+        self._exporting: Set[int] = set()
+        # 삭제된 item code 의 pair, item code 가 반납될 때 pair code 도 반납한다.
+        self._retired: Dict[int, Set[int]] = {}
+        self._snapshot: Optional[snapshot.Snapshot] = None
+        self._clear()
+
+    @property
+    def segments(self) -> Interner:
+        return self._segments
+
+    @property
+    def store(self) -> ArmStore:
+        return self._store
+
+    def update(self, key: int, c: Context):
+        """item code key 의 context 를 c.author_id segment 에 반영한다."""
+        if c.author_id is None:
+            return
+        pair = self._pair(self._segments.intern(c.author_id), key, c.item_id)
+        window = self._find(pair)
+        if window is None:
+            window = self._windows[pair] = self._build(c.item_id)
+        window.append(c)
+        self._store.put(pair, window.alpha, window.beta, window.updated_at)
+        self._expiries.schedule(pair, window.expires_at)
+        self._dirty.add(pair)
+
+    def delete(self, key: int):
+        """item code key 의 모든 segment 통계를 지운다."""
+        pairs = self._by_item.pop(key, ())
+        for pair in pairs:
+            self._windows.pop(pair, None)
+            self._expiries.discard(pair)
+            self._dirty.discard(pair)
+            self._store.delete(pair)
+        if pairs:
+            self._retired.setdefault(key, set()).update(pairs)
+
+    def release(self, keys: Sequence[int]):
+        """Interner 에 반납되는 item code 의 pair code 를 함께 반납한다."""
+        released = []
+        for key in keys:
+            for pair in self._retired.pop(key, ()):
+                self._pairs.pop((int(self._segment_of[pair]), key), None)
+                self._segment_of[pair] = -1
+                self._item_of[pair] = -1
+                released.append(pair)
+        self._names.release(released)
+
+    def advance(self, now: float, limit: Optional[int] = None) -> int:
+        """
+        expires_at 이 now 이전인 (segment, item) window 를 최대 limit 개 now 까지 옮긴다.
+
+        :return: 처리한 window 수.
+        """
+        due = self._expiries.pop(now, limit)
+        for pair in due:
+            window = self._find(pair)
+            if window is None:
+                continue
+            if window.advance(now):
+                self._store.put(pair, window.alpha, window.beta, window.updated_at)
+                self._dirty.add(pair)
+            self._expiries.schedule(pair, window.expires_at)
+        return len(due)
+
+    def aggregate(
+        self,
+        segments: Optional[Sequence[str]],
+        size: int,
+        now: Optional[float] = None,
+        half_life: Optional[float] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        segments 의 현재 통계를 item code 별로 합산한다. reader 는 view 의 SegmentView.aggregate 를 쓴다.
+
+        :param segments: 합산할 segment 목록, None 이면 모든 segment 를 합산한다.
+        :param size: 반환할 배열의 길이, item code 의 상한.
+        :param half_life: 주어지면 (segment, item) 통계를 합산하기 전에 각자 now 까지 감쇠한다.
+        :return: item code 로 index 하는 (alphas, betas, updated_ats, present) 배열.
+            updated_ats 는 segment 중 가장 최근 값이고, present 는 segments 에 통계가 있는 item 이다.
+        """
+        return _aggregate(
+            self._store,
+            self._segment_of,
+            self._item_of,
+            self._segments,
+            segments,
+            size,
+            now,
+            half_life,
+        )
+
+    def view(self, now: Optional[float] = None) -> "SegmentView":
+        """현재 상태의 lease 된 SegmentView, 다 읽었으면 release 해야 한다."""
+        return SegmentView(
+            self._store.view(now), self._segment_of, self._item_of, self._segments
+        )
+
+    def compact(self, limit: Optional[int] = None) -> int:
+        return self._store.compact(limit)
+
+    def export(
+        self,
+    ) -> Tuple[List[str], np.ndarray, Callable[[str], snapshot.WindowState]]:
+        """
+        snapshot.save 의 segments 로 넘길 (ids, matrix, state) 를 만든다.
+
+        직전 snapshot 이후 바뀐 window 만 지금 복사하고, 나머지는 state 를 호출할 때 직전 snapshot 에서 읽는다.
+        기록이 끝나면 exported 를 호출해야 한다.
+        """
+        ids, matrix = self._store.export()
+        self._exporting, self._dirty = self._dirty, set()
+        exported = {}
+        for pair in self._exporting:
+            window = self._windows.get(pair, None)
+            if window is not None:
+                exported[self._names.name(pair)] = (math.nan, *window.export())
+        previous = self._snapshot
+
+        def state(name: str) -> snapshot.WindowState:
+            window = exported.get(name, None)
+            if window is None and previous is not None:
+                window = previous.state(name)
+            if window is None:
+                window = (math.nan, *self._build(_split(name)[1]).export())
+            return window
+
+        return ids, matrix, state
+
+    def exported(self, saved: Optional[snapshot.Snapshot]):
+        """
+        export 한 상태가 saved 로 기록되었음을 알린다. 기록에 실패했으면 None 을 넘긴다.
+        """
+        if saved is None:
+            self._dirty |= self._exporting
+        else:
+            self._snapshot = saved
+        self._exporting = set()
+
+    def restore(
+        self,
+        saved: Optional[snapshot.Snapshot],
+        items: Interner,
+        bucket_seconds: Optional[float] = None,
+    ):
+        """
+        snapshot 의 segment 통계로 전체를 교체한다. window 는 처음 update 될 때 복원된다.
+
+        :param items: pair 이름의 item_id 를 item code 로 바꿀 ThompsonMultiArmedBandit 의 Interner.
+        :param bucket_seconds: "bucket" window 이면 복원한 pair 를 advance 하도록 예약한다.
+        """
+        self._store.close()
+        self._clear()
+        self._windows = {}
+        self._dirty = set()
+        self._retired = {}
+        self._snapshot = saved
+        if saved is None:
+            return
+
+        self._store.restore(saved.ids, saved.matrix)
+        for name in saved.ids:
+            segment, item_id = _split(name)
+            self._register(self._segments.intern(segment), items.intern(item_id), name)
+        if bucket_seconds is not None:
+            store = self._store
+            self._expiries.schedule_buckets(
+                store.keys.tolist(), store.updated_ats.tolist(), bucket_seconds
+            )
+
+    def reset(self):
+        for pair, window in self._windows.items():
+            self._windows[pair] = window.renew()
+        self._dirty = set(self._windows)
+        self._snapshot = None
+        self._expiries.clear()
+        self._store.reset()
+
+    def close(self):
+        self._store.close()
+
+    def _clear(self):
+        self._names = Interner()
+        self._pairs = {}
+        self._by_item = {}
+        self._segment_of = np.full(max(int(self._capacity), 1), -1, dtype=np.int32)
+        self._item_of = np.full(max(int(self._capacity), 1), -1, dtype=np.int32)
+        self._expiries.clear()
+        self._store = ArmStore(capacity=self._capacity, interner=self._names)
+
+    def _find(self, pair: int) -> Optional[Window]:
+        """pair 의 window, snapshot 에만 있는 pair 이면 이때 복원한다."""
+        window = self._windows.get(pair, None)
+        if window is not None or self._snapshot is None or pair not in self._store:
+            return window
+
+        name = self._names.name(pair)
+        state = self._snapshot.state(name)
+        if state is None:
+            return None
+        _, *exported = state
+        window = self._windows[pair] = windows.restore(_split(name)[1], *exported)
+        return window
+
+    def _pair(self, segment: int, key: int, item_id: str) -> int:
+        pair = self._pairs.get((segment, key), None)
+        if pair is not None:
+            if pair not in self._store:
+                self._by_item.setdefault(key, []).append(pair)
+            return pair
+
+        name = _SEPARATOR.join((self._segments.name(segment), item_id))
+        return self._register(segment, key, name)
+
+    def _register(self, segment: int, key: int, name: str) -> int:
+        pair = self._names.intern(name)
+        while pair >= len(self._segment_of):
+            self._segment_of = _grow(self._segment_of)
+            self._item_of = _grow(self._item_of)
+        self._pairs[(segment, key)] = pair
+        self._segment_of[pair] = segment
+        self._item_of[pair] = key
+        self._by_item.setdefault(key, []).append(pair)
+        return pair
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def __str__(self):
+        return f"SegmentStore: {len(self)} segment arms"
+
+
+class SegmentView:
+    """
+    SegmentStore.view 로 만든 특정 version 의 읽기 전용 상태.
+
+    pair 통계의 ArmView 와 그 view 를 만들 때의 pair code -> segment code, item code 배열을 함께 가진다.
+    이 배열은 view 에 없는 새 pair 를 쓸 때와, view 의 lease 가 모두 풀린 뒤 pair 를 반납할 때만 제자리에서
+    바뀌고 커지거나 reset 되면 새 배열로 교체되므로, view 를 lease 하고 있는 동안 view 의 pair 는 그대로 읽힌다.
+    """
+
+    __slots__ = ("view", "_segment_of", "_item_of", "_segments")
+
+    def __init__(
+        self,
+        view: ArmView,
+        segment_of: np.ndarray,
+        item_of: np.ndarray,
+        segments: Interner,
+    ):
+        self.view = view
+        self._segment_of = segment_of
+        self._item_of = item_of
+        self._segments = segments
+
+    @property
+    def version(self) -> int:
+        return self.view.version
+
+    def lease(self) -> bool:
+        return self.view.lease()
+
+    def release(self):
+        self.view.release()
+
+    def aggregate(
+        self,
+        segments: Optional[Sequence[str]],
+        size: int,
+        now: Optional[float] = None,
+        half_life: Optional[float] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """SegmentStore.aggregate 와 같은 합산을 view 의 통계로 한다."""
+        return _aggregate(
+            self.view,
+            self._segment_of,
+            self._item_of,
+            self._segments,
+            segments,
+            size,
+            now,
+            half_life,
+        )
+
+
+def _aggregate(
+    store: Union[ArmStore, ArmView],
+    segment_of: np.ndarray,
+    item_of: np.ndarray,
+    interner: Interner,
+    segments: Optional[Sequence[str]],
+    size: int,
+    now: Optional[float],
+    half_life: Optional[float],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    keys = store.keys
+    live = keys >= 0
+    if segments is not None:
+        codes = interner.codes(segments)
+        live[live] = np.isin(segment_of[keys[live]], codes[codes >= 0])
+
+    items = item_of[keys[live]]
+    alphas, betas = store.alphas[live], store.betas[live]
+    decays = decay_factors(now, store.updated_ats[live], half_life)
+    if decays is not None:
+        alphas, betas = alphas * decays, betas * decays
+    alphas = np.bincount(items, weights=alphas, minlength=size)
+    betas = np.bincount(items, weights=betas, minlength=size)
+    updated_ats = np.full(size, np.nan)
+    np.fmax.at(updated_ats, items, store.updated_ats[live])
+    present = np.bincount(items, minlength=size) > 0
+    return alphas[:size], betas[:size], updated_ats, present[:size]
+
+
+def _split(name: str) -> Tuple[str, str]:
+    """pair 이름을 (segment, item_id) 로 나눈다."""
+    segment, item_id = name.split(_SEPARATOR, 1)
+    return segment, item_id
+
+
+def _grow(codes: np.ndarray) -> np.ndarray:
+    grown = np.full(len(codes) * 2, -1, dtype=np.int32)
+    grown[: len(codes)] = codes
+    return grown
@@ -0,0 +1,160 @@
+import collections
+import concurrent.futures
+import multiprocessing
+import time
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional, Tuple
+
+import numpy as np
+
+from mab.kernels import sample_scores, top_k
+from mab.rng import GeneratorEngine, RandomEngine
+from mab.store import (
+    ALPHAS,
+    BETAS,
+    DEFAULTS,
+    DELETED,
+    TTLS,
+    UPDATED_ATS,
+    VIEW_BUFFERS,
+    ArmView,
+    decay_factors,
+    explore_factors,
+)
+
+# worker process 에서 attach 한 ArmView 의 shared memory block, 오래 쓰지 않은 block 부터 닫는다.
+_attached: "collections.OrderedDict[str, Tuple[SharedMemory, np.ndarray]]" = (
+    collections.OrderedDict()
+)
+# 번갈아 publish 되는 view buffer 들의 block 을 다시 attach 하지 않도록 buffer 수보다 넉넉히 둔다.
+ATTACHED_BLOCKS = 2 * VIEW_BUFFERS
+
+
+def _attach(name: str, capacity: int) -> np.ndarray:
+    attached = _attached.get(name, None)
+    if attached is not None:
+        _attached.move_to_end(name)
+        return attached[1]
+
+    while len(_attached) >= ATTACHED_BLOCKS:
+        block = _attached.popitem(last=False)[1][0]
+        block.close()
+
+    block = SharedMemory(name=name)
+    matrix = np.ndarray((len(DEFAULTS), capacity), dtype=np.float64, buffer=block.buf)
+    _attached[name] = (block, matrix)
+    return matrix
+
+
+def _sample_shard(
+    name: str,
+    capacity: int,
+    start: int,
+    stop: int,
+    k: Optional[int],
+    now: float,
+    kernel: str,
+    threshold: float,
+    seed: np.random.SeedSequence,
+    explorable: bool = True,
+    half_life: Optional[float] = None,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    shard [start, stop) 를 샘플링하고 shard 내 상위 k 개의 (slot, score, alpha, beta) 를 반환한다.
+
+    tombstone 이거나 now 기준으로 만료된 slot 은 샘플링하기 전에 제외된다.
+    half_life 가 주어지면 alpha, beta 를 now 까지 감쇠한 뒤 샘플링한다.
+    """
+    matrix = _attach(name, capacity)
+    available = (matrix[DELETED, start:stop] == 0) & (matrix[TTLS, start:stop] >= now)
+    slots = np.flatnonzero(available)
+    alphas = matrix[ALPHAS, start:stop][slots]
+    betas = matrix[BETAS, start:stop][slots]
+    updated_ats = matrix[UPDATED_ATS, start:stop][slots]
+    decays = decay_factors(now, updated_ats, half_life)
+    if decays is not None:
+        alphas, betas = alphas * decays, betas * decays
+    explores = explore_factors(now, updated_ats) if explorable else None
+
+    rng = GeneratorEngine(seed=seed)
+    scores = sample_scores(rng, alphas, betas, explores, kernel, threshold)
+    winners = top_k(scores, len(scores) if k is None else min(k, len(scores)))
+    return slots[winners] + start, scores[winners], alphas[winners], betas[winners]
+
+
+class ShardedSampler:
+    """
+    publish 된 ArmView 를 shard 로 나누어 process pool 에서 샘플링한다.
+
+    view 는 shared=True 인 ArmStore 에서 만들어져 있어야 하며, worker 는 view 의 shared memory 를
+    이름으로 attach 하므로 요청마다 arm 배열을 복사하지 않는다. view 는 바뀌지 않으므로 pull 하는 동안
+    lease 를 잡고 있으면 worker 는 writer 와 관계없이 한 version 의 상태를 읽는다. 각 shard 는 rng 에서 spawn 한 독립적인 SeedSequence 로
+    샘플링하고 shard 별 상위 k 개를 모아 다시 상위 k 개를 고른다.
+    """
+
+    def __init__(self, processes: int, rng: Optional[RandomEngine] = None):
+        """
+        :param rng: shard 의 seed 를 파생할 engine, seed 가 지정된 engine 이면 결과를 재현할 수 있다.
+        """
+        self.processes = processes
+        self._rng = GeneratorEngine() if rng is None else rng
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def pull(
+        self,
+        view: ArmView,
+        k: Optional[int] = None,
+        now: Optional[float] = None,
+        kernel: str = "exact",
+        threshold: float = 100,
+        explorable: bool = True,
+        half_life: Optional[float] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        :param now: 만료와 explore 계산의 기준 시각, None 이면 현재 시각.
+        :param explorable: False 이면 탐험 없이 reward 만 샘플링한다.
+        :param half_life: DecayedWindow 의 반감기, 주어지면 alpha, beta 를 now 까지 감쇠한다.
+        :return: score 순으로 정렬된 (slots, scores, alphas, betas)
+        """
+        if view.shared_name is None:
+            raise ValueError(
+                "ShardedSampler requires an ArmView of an ArmStore created with shared=True."
+            )
+
+        now = time.time() if now is None else now
+        size = view.size
+        bounds = np.linspace(0, size, self.processes + 1, dtype=np.int64).tolist()
+        seeds = [x.seed_sequence for x in self._rng.spawn(self.processes)]
+        futures = [
+            self._executor.submit(
+                _sample_shard,
+                view.shared_name,
+                view.capacity,
+                start,
+                stop,
+                k,
+                now,
+                kernel,
+                threshold,
+                seed,
+                explorable,
+                half_life,
+            )
+            for start, stop, seed in zip(bounds[:-1], bounds[1:], seeds)
+            if start < stop
+        ]
+        shards = [x.result() for x in futures]
+
+        if not shards:
+            empty = np.empty(0, dtype=np.float64)
+            return np.empty(0, dtype=np.intp), empty, empty, empty
+
+        slots, scores, alphas, betas = (np.concatenate(x) for x in zip(*shards))
+        winners = top_k(scores, k)
+        return slots[winners], scores[winners], alphas[winners], betas[winners]
+
+    def close(self):
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,202 @@
+import json
+import math
+import os
+import shutil
+import time
+from array import array
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from mab import windows as _windows
+from mab.store import UPDATED_ATS
+
+VERSION = 2
+
+CURRENT = "CURRENT"
+
+# SegmentStore 의 snapshot 을 같은 형식으로 기록하는 하위 directory.
+SEGMENTS = "segments"
+
+# window 종류와 windows.npy 에 기록되는 번호.
+KINDS = list(_windows.WINDOWS)
+
+# window 별 params 를 기록하는 column 수.
+PARAMS = 5
+
+# (created_at, kind, params, (view sequences, offsets), (click sequences, offsets))
+WindowState = Tuple[
+    float, str, Tuple[float, ...], Tuple[bytes, bytes], Tuple[bytes, bytes]
+]
+
+
+class Snapshot:
+    """
+    save 로 기록한 snapshot 을 np.load(mmap_mode="r") 로 연다.
+
+    arm 배열은 파일을 그대로 mmap 하므로 열자마자 사용할 수 있고,
+    arm 별 window 는 window(item_id) 를 호출할 때 해당 구간만 읽어서 복원한다.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path / "meta.json", "r") as stream:
+            self.meta = json.load(stream)
+        if self.meta["version"] != VERSION:
+            raise ValueError(f"Unsupported snapshot version: {self.meta['version']}")
+
+        self.matrix = np.load(self.path / "arms.npy", mmap_mode="r")
+        self._windows = np.load(self.path / "windows.npy", mmap_mode="r")
+        self._window_index = np.load(self.path / "window_index.npy", mmap_mode="r")
+        self._sequences = np.load(self.path / "sequences.npy", mmap_mode="r")
+        self._offsets = np.load(self.path / "offsets.npy", mmap_mode="r")
+
+        encoded = np.load(self.path / "ids.npy", mmap_mode="r").tobytes()
+        bounds = np.load(self.path / "id_index.npy").tolist()
+        self.ids: List[str] = [
+            encoded[start:stop].decode("utf-8") for start, stop in zip(bounds, bounds[1:])
+        ]
+        self._index: Dict[str, int] = {x: i for i, x in enumerate(self.ids)}
+
+        segments = self.path / SEGMENTS
+        self.segments = Snapshot(segments) if segments.exists() else None
+
+    @property
+    def watermark(self) -> float:
+        """snapshot 에 반영된 가장 최근 context 의 timestamp."""
+        return self.meta["watermark"]
+
+    @property
+    def checkpoint(self) -> Optional[int]:
+        """snapshot 이후의 record 가 기록된 첫 journal segment 번호."""
+        return self.meta.get("checkpoint", None)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._index
+
+    def state(self, item_id: str) -> Optional[WindowState]:
+        slot = self._index.get(item_id, None)
+        if slot is None:
+            return None
+
+        row = self._windows[slot].tolist()
+        created_at, kind, params = row[0], KINDS[int(row[1])], tuple(row[2 : 2 + PARAMS])
+        n_views, n_clicks = row[2 + PARAMS :]
+        start = int(self._window_index[slot])
+        middle, stop = start + int(n_views), start + int(n_views) + int(n_clicks)
+        views = (
+            self._sequences[start:middle].tobytes(),
+            self._offsets[start:middle].tobytes(),
+        )
+        clicks = (
+            self._sequences[middle:stop].tobytes(),
+            self._offsets[middle:stop].tobytes(),
+        )
+        return created_at, kind, params, views, clicks
+
+    def window(self, item_id: str) -> Optional[Tuple[float, _windows.Window]]:
+        """(created_at, window) 를 반환한다."""
+        state = self.state(item_id)
+        if state is None:
+            return None
+        created_at, *exported = state
+        return created_at, _windows.restore(item_id, *exported)
+
+
+def save(
+    directory: Union[str, Path],
+    ids: List[str],
+    matrix: np.ndarray,
+    state: Callable[[str], WindowState],
+    checkpoint: Optional[int] = None,
+    segments: Optional[Tuple[List[str], np.ndarray, Callable[[str], WindowState]]] = None,
+) -> Path:
+    """
+    arm store 와 window 를 directory 아래의 새 snapshot 으로 기록한다.
+
+    segments 가 주어지면 SegmentStore 의 (ids, matrix, state) 를 같은 형식으로 SEGMENTS 아래에 기록한다.
+    snapshot 은 임시 directory 에 모두 쓴 뒤 rename 하고, CURRENT 파일을 교체하여 가리키므로
+    기록 도중 process 가 죽어도 직전 snapshot 은 그대로 남는다.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    name = f"snapshot-{time.time_ns()}"
+    temporary = directory / f"{name}.tmp"
+    temporary.mkdir()
+    _write(temporary, ids, matrix, state, checkpoint)
+    if segments is not None:
+        (temporary / SEGMENTS).mkdir()
+        _write(temporary / SEGMENTS, *segments)
+
+    path = directory / name
+    os.rename(temporary, path)
+    _write_current(directory, name)
+
+    for stale in directory.iterdir():
+        if stale.is_dir() and stale.name != name and stale.name.startswith("snapshot-"):
+            shutil.rmtree(stale, ignore_errors=True)
+
+    return path
+
+
+def _write(
+    path: Path,
+    ids: List[str],
+    matrix: np.ndarray,
+    state: Callable[[str], WindowState],
+    checkpoint: Optional[int] = None,
+):
+    encoded = [x.encode("utf-8") for x in ids]
+    id_index = np.zeros(len(ids) + 1, dtype=np.int64)
+    np.cumsum([len(x) for x in encoded], out=id_index[1:])
+
+    windows = np.zeros((len(ids), 2 + PARAMS + 2), dtype=np.float64)
+    window_index = np.zeros(len(ids) + 1, dtype=np.int64)
+    sequences, offsets = array("I"), array("f")
+    for slot, item_id in enumerate(ids):
+        created_at, kind, params, views, clicks = state(item_id)
+        counts = []
+        for entries in (views, clicks):
+            start = len(sequences)
+            sequences.frombytes(entries[0])
+            offsets.frombytes(entries[1])
+            counts.append(len(sequences) - start)
+        params = tuple(params) + (0.0,) * (PARAMS - len(params))
+        windows[slot] = (created_at, KINDS.index(kind), *params, *counts)
+        window_index[slot + 1] = len(sequences)
+
+    updated_ats = matrix[UPDATED_ATS][~np.isnan(matrix[UPDATED_ATS])]
+    meta = {
+        "version": VERSION,
+        "size": len(ids),
+        "created_at": time.time(),
+        "watermark": float(updated_ats.max()) if len(updated_ats) else -math.inf,
+        "checkpoint": checkpoint,
+    }
+
+    np.save(path / "arms.npy", np.ascontiguousarray(matrix))
+    np.save(path / "ids.npy", np.frombuffer(b"".join(encoded), dtype=np.uint8))
+    np.save(path / "id_index.npy", id_index)
+    np.save(path / "windows.npy", windows)
+    np.save(path / "window_index.npy", window_index)
+    np.save(path / "sequences.npy", np.frombuffer(sequences, dtype=np.uint32))
+    np.save(path / "offsets.npy", np.frombuffer(offsets, dtype=np.float32))
+    with open(path / "meta.json", "w") as stream:
+        json.dump(meta, stream)
+
+
+def load(directory: Union[str, Path]) -> Optional[Snapshot]:
+    """CURRENT 가 가리키는 snapshot 을 연다. 없으면 None."""
+    current = Path(directory) / CURRENT
+    if not current.exists():
+        return None
+    name = current.read_text().strip()
+    return Snapshot(Path(directory) / name)
+
+
+def _write_current(directory: Path, name: str):
+    temporary = directory / f"{CURRENT}.tmp"
+    temporary.write_text(name)
+    os.replace(temporary, directory / CURRENT)
@@ -0,0 +1,737 @@
+import math
+import threading
+import time
+import weakref
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from mab.interning import Interner
+
+ALPHAS, BETAS, UPDATED_ATS, TTLS, EXPLORES, DELETED = range(6)
+
+DEFAULTS = (0.0, 0.0, math.nan, math.inf, 0.0, 0.0)
+
+# ArmStore.view 가 바뀐 부분만 복사하는 단위, slot 과 key 를 이 수만큼씩 묶는다.
+CHUNK = 1024
+
+# ArmStore.view 가 재사용하는 view 배열 묶음의 최대 수.
+VIEW_BUFFERS = 3
+
+
+class ArmStore:
+    """
+    arm 들의 상태를 item_id 별 객체가 아닌 연속된 numpy 배열(struct of arrays)로 보관한다.
+
+    arm 은 Interner 가 발급한 int32 key 로 접근하며, key -> slot 과 slot -> key 도
+    dict 가 아닌 int32 배열로 관리한다.
+
+    - alphas: reward 가 나온 횟수.
+    - betas: reward 가 나오지 않은 횟수.
+    - updated_ats: 마지막 context 의 timestamp, context 가 없으면 nan.
+    - ttls: 만료 timestamp, 지정되지 않았으면 inf. 만료된 arm 은 available 에서 제외된다.
+    - deleted: 삭제된 slot (tombstone) 이면 1.
+
+    slot 은 0 부터 size - 1 까지 순서대로 채워진다. 삭제는 slot 을 tombstone 으로 표시만 하고
+    compact 가 뒤쪽의 live slot 을 tombstone 자리로 옮겨 공간을 회수한다.
+    len(store) 는 tombstone 을 제외한 arm 수이고, 배열 property 는 tombstone 을 포함한 size 길이다.
+
+    explore 값은 분 단위로만 변하므로 wall-clock 분 마다 한 번 전체를 계산해 두고,
+    같은 분 안에서는 updated_at 이 바뀐 slot 만 다시 계산한다.
+
+    모든 column 은 (column 수, capacity) 모양의 matrix 하나에 들어 있으며, shared=True 이면
+    view 의 matrix 를 multiprocessing.shared_memory 에 할당해서 다른 process 가 복사 없이 읽을 수 있다.
+
+    변경과 동시에 읽어야 하는 thread 는 배열을 직접 읽지 말고 view 로 만든 ArmView 를 읽는다.
+    view 는 lease 된 상태로 반환되며, 읽는 쪽은 view 를 읽는 동안 lease 를 잡고 다 읽으면 release 한다.
+    view 는 CHUNK 단위로 바뀐 slot 과 key 를 기록해 두었다가, lease 가 모두 풀린 이전 view 의 배열에
+    바뀐 chunk 만 복사해서 재사용한다.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        shared: bool = False,
+        interner: Optional[Interner] = None,
+    ):
+        self._interner = Interner() if interner is None else interner
+        self._size = 0
+        self._tombstones = 0
+        self._slots = np.full(max(int(capacity), 1), -1, dtype=np.int32)
+        self._keys = np.full(max(int(capacity), 1), -1, dtype=np.int32)
+        self._shared = shared
+        self._matrix = self._allocate(max(int(capacity), 1))
+        self._explored_minute: Optional[float] = None
+        self._stale: List[int] = []
+        # 아직 slot 이 없는 key 의 만료 timestamp, slot 이 생길 때 적용된다.
+        self._deadlines: Dict[int, float] = {}
+        self._version = 0
+        self._view: Optional[ArmView] = None
+        # 마지막 view 이후 바뀐 slot, key 의 chunk 번호, _changed_all 이면 전체가 바뀌었다.
+        self._changed_slots: Set[int] = set()
+        self._changed_keys: Set[int] = set()
+        self._changed_all = True
+        self._buffers: List[_ViewBuffer] = []
+        # view 의 lease 수를 바꿀 때만 잡는 lock, reader 가 writer 를 기다리지 않도록 따로 둔다.
+        self._leases = threading.Lock()
+        self._views: "weakref.WeakSet[ArmView]" = weakref.WeakSet()
+
+    @property
+    def capacity(self) -> int:
+        return self._matrix.shape[1]
+
+    @property
+    def shared(self) -> bool:
+        """view 의 matrix 를 shared memory 에 할당하면 True."""
+        return self._shared
+
+    @property
+    def interner(self) -> Interner:
+        return self._interner
+
+    @property
+    def size(self) -> int:
+        """tombstone 을 포함해 사용 중인 slot 수."""
+        return self._size
+
+    @property
+    def tombstones(self) -> int:
+        return self._tombstones
+
+    @property
+    def version(self) -> int:
+        """arm 상태가 바뀔 때마다 증가하는 번호."""
+        return self._version
+
+    @property
+    def keys(self) -> np.ndarray:
+        """slot 별 key, tombstone 은 -1."""
+        return self._keys[: self._size]
+
+    @property
+    def ids(self) -> List[str]:
+        keys = self.keys
+        return self._interner.names(keys[keys >= 0].tolist())
+
+    @property
+    def alphas(self) -> np.ndarray:
+        return self._alphas[: self._size]
+
+    @property
+    def betas(self) -> np.ndarray:
+        return self._betas[: self._size]
+
+    @property
+    def updated_ats(self) -> np.ndarray:
+        return self._updated_ats[: self._size]
+
+    @property
+    def ttls(self) -> np.ndarray:
+        return self._ttls[: self._size]
+
+    @property
+    def deleted(self) -> np.ndarray:
+        """slot 별 tombstone 여부."""
+        return self._deleted[: self._size] > 0
+
+    def slot(self, key: int) -> Optional[int]:
+        if 0 <= key < len(self._slots):
+            slot = self._slots.item(key)
+            if slot >= 0:
+                return slot
+        return None
+
+    def slots(self, keys: np.ndarray) -> np.ndarray:
+        """keys 에 해당하는 slot 배열, 존재하지 않는 arm 이나 음수 key 는 -1."""
+        keys = np.asarray(keys, dtype=np.intp)
+        found = (keys >= 0) & (keys < len(self._slots))
+        slots = np.full(len(keys), -1, dtype=np.intp)
+        slots[found] = self._slots[keys[found]]
+        return slots
+
+    def names(self, slots: np.ndarray) -> List[str]:
+        """slots 에 있는 arm 의 item_id."""
+        return self._interner.names(self._keys[slots].tolist())
+
+    def put(
+        self,
+        key: int,
+        alpha: float,
+        beta: float,
+        updated_at: Optional[float] = None,
+    ) -> int:
+        slot = self.slot(key)
+        if slot is None:
+            if self._size == self.capacity:
+                self.compact()
+            if self._size == self.capacity:
+                self._grow()
+            slot = self._size
+            self._assign(key, slot)
+            self._size += 1
+            self._ttls[slot] = self._deadlines.pop(key, math.inf)
+
+        self._alphas[slot] = alpha
+        self._betas[slot] = beta
+        self._changed_slots.add(slot // CHUNK)
+        self._version += 1
+        updated_at = math.nan if updated_at is None else updated_at
+        if not self._updated_ats[slot] == updated_at:
+            self._updated_ats[slot] = updated_at
+            self._invalidate(slot)
+        return slot
+
+    def expire(self, key: int, ttl: float) -> bool:
+        """
+        key 의 만료 timestamp 를 ttl 로 바꾼다. ttl 이 inf 이면 만료되지 않는다.
+
+        arm 이 아직 없으면 ttl 을 기억해 두었다가 put 으로 slot 이 생길 때 적용한다.
+
+        :return: 이미 slot 이 있는 arm 이면 True.
+        """
+        slot = self.slot(key)
+        if slot is None:
+            if ttl == math.inf:
+                self._deadlines.pop(key, None)
+            else:
+                self._deadlines[key] = ttl
+            return False
+        self._ttls[slot] = ttl
+        self._changed_slots.add(slot // CHUNK)
+        self._version += 1
+        return True
+
+    def available(self, now: float) -> Optional[np.ndarray]:
+        """
+        tombstone 도 아니고 now 기준으로 만료되지도 않은 slot 배열.
+
+        :return: 모든 slot 을 사용할 수 있으면 복사를 피하기 위해 None.
+        """
+        mask = self.ttls >= now
+        if self._tombstones:
+            mask &= self._deleted[: self._size] == 0
+        if mask.all():
+            return None
+        return np.flatnonzero(mask)
+
+    def delete(self, key: int) -> bool:
+        """slot 을 tombstone 으로 표시한다. 공간은 compact 에서 회수된다."""
+        slot = self.slot(key)
+        if slot is None:
+            return False
+        self._slots[key] = -1
+        self._keys[slot] = -1
+        self._deleted[slot] = 1
+        self._changed_keys.add(key // CHUNK)
+        self._changed_slots.add(slot // CHUNK)
+        self._tombstones += 1
+        self._version += 1
+        return True
+
+    def compact(self, limit: Optional[int] = None) -> int:
+        """
+        뒤쪽의 live slot 을 앞쪽 tombstone 자리로 옮기고 size 를 줄인다.
+
+        한 번에 최대 limit 개의 tombstone 만 처리하므로 update 사이사이에 조금씩 나누어 실행할 수 있다.
+        옮기는 동안 pull 이 같은 arm 을 두 번 보지 않도록 원래 slot 을 먼저 tombstone 으로 표시한다.
+
+        :return: 회수한 tombstone 수.
+        """
+        holes = np.flatnonzero(self._deleted[: self._size]).tolist()
+        if limit is not None:
+            holes = holes[:limit]
+
+        reclaimed = self._truncate()
+        for hole in holes:
+            if hole >= self._size:
+                break
+            last = self._size - 1
+            key = self._keys.item(last)
+            self._deleted[last] = 1
+            self._matrix[:, hole] = self._matrix[:, last]
+            self._assign(key, hole)
+            self._deleted[hole] = 0
+            self._invalidate(hole)
+            self._keys[last] = -1
+            self._clear(last)
+            self._tombstones -= 1
+            self._size -= 1
+            reclaimed += 1 + self._truncate()
+        if reclaimed:
+            self._version += 1
+        return reclaimed
+
+    def export(self) -> Tuple[List[str], np.ndarray]:
+        """snapshot 용으로 tombstone 을 제외하고 복사한 (ids, matrix)."""
+        live = ~self.deleted
+        return self.ids, self._matrix[:, : self._size][:, live]
+
+    def restore(self, ids: List[str], matrix: np.ndarray):
+        """
+        store 전체를 ids 와 (column 수, len(ids)) 모양의 matrix 로 교체한다.
+
+        snapshot 의 mmap 배열을 item 별 put 없이 한 번에 복사하기 위해 사용한다.
+        """
+        size = len(ids)
+        while self.capacity < size:
+            self._grow()
+
+        keys = self._interner.intern_many(ids)
+        self._slots[:] = -1
+        self._keys[:] = -1
+        if size:
+            self._reserve(int(keys.max()))
+            self._slots[keys] = np.arange(size, dtype=np.int32)
+        self._keys[:size] = keys
+        self._size = size
+        self._tombstones = 0
+        for column, default in enumerate(DEFAULTS):
+            self._matrix[column] = default
+        self._matrix[: len(matrix), :size] = matrix
+        self._deleted[:size] = 0
+        self._explored_minute = None
+        self._stale.clear()
+        self._changed_all = True
+        self._version += 1
+
+    def reset(self):
+        size = self._size
+        self._alphas[:size] = 0
+        self._betas[:size] = 0
+        self._updated_ats[:size] = np.nan
+        self._explored_minute = None
+        self._changed_all = True
+        self._version += 1
+
+    def view(self, now: Optional[float] = None) -> "ArmView":
+        """
+        현재 상태를 복사한 읽기 전용 ArmView 를 lease 해서 반환한다. 다 읽었으면 release 해야 한다.
+
+        마지막 view 이후 바뀐 것이 없고 그 view 의 lease 가 남아 있으면 같은 view 를 반환한다.
+        lease 가 모두 풀린 view 의 배열이 있으면 그 배열이 만들어진 뒤 바뀐 chunk 만 복사하므로,
+        비용은 전체 arm 수가 아니라 publish 사이에 바뀐 arm 수에 비례한다.
+        explore 값은 now 의 분 기준으로 계산해서 함께 복사하며, 분이 바뀌면 전체를 다시 복사한다.
+        """
+        view = self._view
+        if view is not None and view.version == self._version and view.lease():
+            return view
+
+        now = time.time() if now is None else now
+        self.explores(now)
+        size = self._size
+        buffer = self._buffer()
+        matrix = buffer.matrix[:, :size]
+        keys = buffer.keys[:size]
+        slots = buffer.slots[:]
+        for array in (matrix, keys, slots):
+            array.flags.writeable = False
+
+        view = ArmView(
+            self._version,
+            self._interner,
+            matrix,
+            keys,
+            slots,
+            self._tombstones,
+            now,
+            buffer,
+            self._leases,
+        )
+        buffer.view = weakref.ref(view)
+        self._views.add(view)
+        self._view = view
+        return view
+
+    def oldest_view(self) -> Optional[int]:
+        """lease 가 남아 있는 view 중 가장 오래된 version, 없으면 None."""
+        with self._leases:
+            versions = [x.version for x in list(self._views) if x.leases]
+        return min(versions) if versions else None
+
+    def explores(self, now: float) -> np.ndarray:
+        """
+        arm 별 탐험 비율을 반환한다.
+
+        같은 wall-clock 분 안에서는 캐시된 값을 재사용하므로 최대 1 분 미만의 오차가 있을 수 있다.
+        """
+        size = self._size
+        minute = now // 60
+
+        if self._explored_minute != minute:
+            self._explores[:size] = explore_factors(now, self.updated_ats)
+            self._explored_minute = minute
+            self._stale.clear()
+            self._changed_all = True
+        elif self._stale:
+            stale = np.array(self._stale, dtype=np.intp)
+            stale = stale[stale < size]
+            self._explores[stale] = explore_factors(now, self._updated_ats[stale])
+            self._stale.clear()
+
+        return self._explores[:size]
+
+    def _buffer(self) -> "_ViewBuffer":
+        """읽는 view 가 없는 배열 묶음을 현재 상태로 맞춰서 반환한다. 없으면 새로 만든다."""
+        for buffer in self._buffers:
+            buffer.mark(self._changed_slots, self._changed_keys, self._changed_all)
+        self._changed_slots, self._changed_keys = set(), set()
+        self._changed_all = False
+
+        with self._leases:
+            buffer = next((x for x in self._buffers if x.idle()), None)
+        if buffer is None:
+            # lease 를 놓지 않는 reader 가 있으면 그 배열은 pool 에서 빼고 view 와 함께 사라지게 둔다.
+            buffer = _ViewBuffer(self._shared)
+            if len(self._buffers) == VIEW_BUFFERS:
+                self._buffers.pop(0)
+            self._buffers.append(buffer)
+        buffer.sync(self._matrix, self._keys, self._slots, self._size)
+        return buffer
+
+    def _invalidate(self, slot: int):
+        if self._explored_minute is None:
+            return
+        if len(self._stale) > len(self) // 8:
+            self._explored_minute = None
+            self._stale.clear()
+            return
+        self._stale.append(slot)
+
+    def _truncate(self) -> int:
+        """끝에 붙어 있는 tombstone 을 잘라낸다."""
+        truncated = 0
+        while self._size and self._deleted[self._size - 1]:
+            self._size -= 1
+            self._clear(self._size)
+            truncated += 1
+        self._tombstones -= truncated
+        return truncated
+
+    def _clear(self, slot: int):
+        for column, default in enumerate(DEFAULTS):
+            self._matrix[column, slot] = default
+        self._changed_slots.add(slot // CHUNK)
+
+    def _assign(self, key: int, slot: int):
+        self._reserve(key)
+        self._slots[key] = slot
+        self._keys[slot] = key
+        self._changed_keys.add(key // CHUNK)
+        self._changed_slots.add(slot // CHUNK)
+
+    def _reserve(self, key: int):
+        """key 를 index 할 수 있도록 key -> slot 배열을 늘린다."""
+        if key < len(self._slots):
+            return
+        size = max(len(self._slots) * 2, key + 1)
+        slots = np.full(size, -1, dtype=np.int32)
+        slots[: len(self._slots)] = self._slots
+        self._slots = slots
+
+    def _allocate(self, capacity: int) -> np.ndarray:
+        matrix = np.empty((len(DEFAULTS), capacity), dtype=np.float64)
+        for column, default in enumerate(DEFAULTS):
+            matrix[column] = default
+
+        self._alphas = matrix[ALPHAS]
+        self._betas = matrix[BETAS]
+        self._updated_ats = matrix[UPDATED_ATS]
+        self._ttls = matrix[TTLS]
+        self._explores = matrix[EXPLORES]
+        self._deleted = matrix[DELETED]
+        return matrix
+
+    def _grow(self):
+        matrix = self._matrix
+        self._matrix = self._allocate(self.capacity * 2)
+        self._matrix[:, : matrix.shape[1]] = matrix
+        keys = np.full(self.capacity, -1, dtype=np.int32)
+        keys[: len(self._keys)] = self._keys
+        self._keys = keys
+
+    def close(self):
+        """view 의 shared memory block 을 모두 반납한다."""
+        while self._buffers:
+            self._buffers.pop().close()
+
+    def __len__(self) -> int:
+        return self._size - self._tombstones
+
+    def __contains__(self, key: int) -> bool:
+        return self.slot(key) is not None
+
+    def __str__(self):
+        return f"ArmStore: {len(self)} arms"
+
+
+class _ViewBuffer:
+    """
+    ArmView 가 읽는 matrix, keys, slots 배열 묶음.
+
+    ArmView 의 배열은 모두 이 배열의 numpy view 이므로, 이 배열로 만든 마지막 view 의 lease 가 모두
+    풀린 뒤에만 ArmStore 가 그 사이 바뀐 chunk 만 복사해서 다음 view 에 재사용한다.
+    shared=True 이면 matrix 를 shared memory 에 할당해서 worker process 가 이름으로 attach 한다.
+    """
+
+    __slots__ = (
+        "matrix",
+        "keys",
+        "slots",
+        "view",
+        "_shared",
+        "_block",
+        "_finalizer",
+        "_slots",
+        "_keys",
+        "_all",
+        "__weakref__",
+    )
+
+    def __init__(self, shared: bool = False):
+        self.matrix: Optional[np.ndarray] = None
+        self.keys: Optional[np.ndarray] = None
+        self.slots: Optional[np.ndarray] = None
+        # 이 배열로 만든 마지막 ArmView 의 weakref
+        self.view: Optional[weakref.ref] = None
+        self._shared = shared
+        self._block: Optional[SharedMemory] = None
+        self._finalizer: Optional[weakref.finalize] = None
+        # 이 배열에 아직 복사하지 않은 slot, key 의 chunk 번호
+        self._slots: Set[int] = set()
+        self._keys: Set[int] = set()
+        self._all = True
+
+    @property
+    def shared_name(self) -> Optional[str]:
+        return self._block.name if self._block is not None else None
+
+    def mark(self, slots: Set[int], keys: Set[int], everything: bool):
+        self._slots |= slots
+        self._keys |= keys
+        self._all |= everything
+
+    def idle(self) -> bool:
+        """이 배열로 만든 view 를 아무도 lease 하고 있지 않으면 True. ArmStore 의 lease lock 안에서 호출한다."""
+        view = self.view() if self.view is not None else None
+        return view is None or not view.leases
+
+    def sync(self, matrix: np.ndarray, keys: np.ndarray, slots: np.ndarray, size: int):
+        """바뀐 chunk 만 복사해서 matrix, keys 의 앞 size 개와 slots 를 원본과 같게 만든다."""
+        if self._all or self.matrix.shape != matrix.shape:
+            self._allocate(matrix.shape)
+            self.keys = np.empty_like(keys)
+            self._slots = set(range(_chunks(size)))
+        if self._all or self.slots.shape != slots.shape:
+            self.slots = slots.copy()
+            self._keys = set()
+
+        if len(self._slots) * 2 >= _chunks(size):
+            self.matrix[:, :size] = matrix[:, :size]
+            self.keys[:size] = keys[:size]
+        else:
+            for chunk in self._slots:
+                start, stop = chunk * CHUNK, min((chunk + 1) * CHUNK, size)
+                if start < stop:
+                    self.matrix[:, start:stop] = matrix[:, start:stop]
+                    self.keys[start:stop] = keys[start:stop]
+        for chunk in self._keys:
+            start, stop = chunk * CHUNK, (chunk + 1) * CHUNK
+            self.slots[start:stop] = slots[start:stop]
+        self._slots, self._keys, self._all = set(), set(), False
+
+    def close(self):
+        if self._finalizer is not None:
+            self._finalizer()
+
+    def _allocate(self, shape: Tuple[int, int]):
+        self.close()
+        if not self._shared:
+            self.matrix = np.empty(shape, dtype=np.float64)
+            return
+        block = SharedMemory(create=True, size=int(np.prod(shape)) * 8)
+        self.matrix = np.ndarray(shape, dtype=np.float64, buffer=block.buf)
+        self._block = block
+        # 이 배열을 읽는 view 가 모두 사라지면 block 을 반납한다.
+        self._finalizer = weakref.finalize(self, _release, block)
+
+
+class ArmView:
+    """
+    ArmStore.view 로 만든 특정 version 의 읽기 전용 복사본.
+
+    배열은 모두 writeable=False 이고 store 가 이후에 바뀌어도 영향을 받지 않으므로,
+    여러 thread 가 lock 없이 읽어도 한 version 의 일관된 상태를 본다.
+    배열 property 와 slot 은 ArmStore 와 같은 의미이다.
+    """
+
+    __slots__ = (
+        "version",
+        "_interner",
+        "_matrix",
+        "_keys",
+        "_slots",
+        "_tombstones",
+        "_explored",
+        "_buffer",
+        "_lock",
+        "_leases",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        version: int,
+        interner: Interner,
+        matrix: np.ndarray,
+        keys: np.ndarray,
+        slots: np.ndarray,
+        tombstones: int,
+        now: float,
+        buffer: Optional[_ViewBuffer] = None,
+        lock: Optional[threading.Lock] = None,
+    ):
+        self.version = version
+        self._interner = interner
+        self._matrix = matrix
+        self._keys = keys
+        self._slots = slots
+        self._tombstones = tombstones
+        # (wall-clock 분, explore 배열), 한 번의 대입으로 교체되므로 thread 간에 안전하다.
+        self._explored = (now // 60, matrix[EXPLORES])
+        self._buffer = buffer
+        self._lock = threading.Lock() if lock is None else lock
+        # 만들어질 때 ArmStore.view 를 호출한 쪽이 lease 하나를 가진다.
+        self._leases = 1
+
+    @property
+    def leases(self) -> int:
+        return self._leases
+
+    @property
+    def shared_name(self) -> Optional[str]:
+        """worker process 가 attach 할 matrix 의 shared memory 이름, shared 가 아니면 None."""
+        return self._buffer.shared_name if self._buffer is not None else None
+
+    @property
+    def capacity(self) -> int:
+        """shared memory matrix 의 column 수."""
+        return self._buffer.matrix.shape[1] if self._buffer is not None else self.size
+
+    def lease(self) -> bool:
+        """
+        view 를 읽는 동안 배열이 재사용되지 않도록 lease 를 하나 더 잡는다.
+
+        :return: lease 가 이미 모두 풀려서 배열이 재사용될 수 있으면 False, 새로 publish 된 view 를 읽어야 한다.
+        """
+        with self._lock:
+            if not self._leases:
+                return False
+            self._leases += 1
+            return True
+
+    def release(self):
+        with self._lock:
+            self._leases -= 1
+
+    @property
+    def size(self) -> int:
+        return len(self._keys)
+
+    @property
+    def keys(self) -> np.ndarray:
+        return self._keys
+
+    @property
+    def alphas(self) -> np.ndarray:
+        return self._matrix[ALPHAS]
+
+    @property
+    def betas(self) -> np.ndarray:
+        return self._matrix[BETAS]
+
+    @property
+    def updated_ats(self) -> np.ndarray:
+        return self._matrix[UPDATED_ATS]
+
+    @property
+    def ttls(self) -> np.ndarray:
+        return self._matrix[TTLS]
+
+    def slot(self, key: int) -> Optional[int]:
+        if 0 <= key < len(self._slots):
+            slot = self._slots.item(key)
+            if slot >= 0:
+                return slot
+        return None
+
+    def slots(self, keys: np.ndarray) -> np.ndarray:
+        keys = np.asarray(keys, dtype=np.intp)
+        found = (keys >= 0) & (keys < len(self._slots))
+        slots = np.full(len(keys), -1, dtype=np.intp)
+        slots[found] = self._slots[keys[found]]
+        return slots
+
+    def names(self, slots: np.ndarray) -> List[str]:
+        return self._interner.names(self._keys[slots].tolist())
+
+    def available(self, now: float) -> Optional[np.ndarray]:
+        mask = self.ttls >= now
+        if self._tombstones:
+            mask &= self._matrix[DELETED] == 0
+        if mask.all():
+            return None
+        return np.flatnonzero(mask)
+
+    def explores(self, now: float) -> np.ndarray:
+        """
+        arm 별 탐험 비율, view 를 만든 분과 다른 분이면 updated_ats 로 다시 계산해서 캐시한다.
+        """
+        minute, explores = self._explored
+        if minute != now // 60:
+            explores = explore_factors(now, self.updated_ats)
+            self._explored = (now // 60, explores)
+        return explores
+
+    def __len__(self) -> int:
+        return self.size - self._tombstones
+
+    def __contains__(self, key: int) -> bool:
+        return self.slot(key) is not None
+
+    def __str__(self):
+        return f"ArmView: {len(self)} arms at version {self.version}"
+
+
+def explore_factors(now: float, updated_ats: np.ndarray) -> np.ndarray:
+    """마지막 context 이후 5 분에 걸쳐 0 에서 1 까지 선형으로 증가하는 탐험 비율."""
+    delta_minutes = (now - updated_ats) // 60
+    return np.where(delta_minutes > 0, np.minimum(delta_minutes / 5, 1), 0.0)
+
+
+def decay_factors(
+    now: float, updated_ats: np.ndarray, half_life: Optional[float]
+) -> Optional[np.ndarray]:
+    """
+    DecayedWindow 의 alpha, beta 를 마지막 context 시각에서 now 까지 감쇠하는 비율.
+
+    window 는 새 context 가 들어올 때만 감쇠하므로 읽는 쪽에서 곱해서 wall-clock 시각에 맞춘다.
+    half_life 가 None 이면 감쇠하지 않으므로 None 을 반환한다.
+    """
+    if half_life is None:
+        return None
+    elapsed = np.maximum(now - updated_ats, 0.0)
+    return np.where(np.isnan(elapsed), 1.0, np.exp2(-elapsed / half_life))
+
+
+def _chunks(size: int) -> int:
+    return (size + CHUNK - 1) // CHUNK
+
+
+def _release(block: SharedMemory):
+    try:
+        block.close()
+    except BufferError:
+        # 아직 참조 중인 view 가 있으면 mapping 은 view 가 사라질 때 해제된다.
+        pass
+    block.unlink()
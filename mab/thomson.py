@@ -1,9 +1,23 @@
+import collections
 import math
+import threading
 import time
+from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import Optional, Iterable, Dict, Tuple, List, Union
+from pathlib import Path
+from typing import (
+    Optional,
+    Iterable,
+    Dict,
+    Tuple,
+    List,
+    Union,
+    Sequence,
+    Iterator,
+    Set,
+    Deque,
+)
 
-import llist
 import numpy as np
 import scipy
 from matplotlib import pyplot as plt
@@ -11,6 +25,18 @@ from matplotlib import pyplot as plt
 import annotations
 from mab.abstracts import MAB
 from mab.context import Context
+from mab.interning import Interner
+from mab.kernels import KERNELS, sample_scores, top_k
+from mab.rng import LegacyEngine, RandomEngine
+from mab import snapshot
+from mab.journal import DELETE, Journal
+from mab.segments import SegmentStore, SegmentView
+from mab.sharded import ShardedSampler
+from mab.store import ArmStore, ArmView, decay_factors
+from mab import windows
+
+
+_LEGACY_ENGINE = LegacyEngine()
 
 
 @dataclass
@@ -21,6 +47,78 @@ class Prediction:
     beta: int
 
 
+class PredictionBatch(Sequence[Prediction]):
+    """
+    pull 결과를 item 별 Prediction 객체 대신 column 배열로 보관한다.
+
+    - item_ids: item_id 목록.
+    - scores, alphas, betas: item_ids 와 같은 순서의 numpy 배열.
+
+    index 로 접근하거나 순회할 때만 Prediction 을 만들며,
+    protobuf 로 변환할 때는 rows 로 column 을 한 번에 Python 값으로 꺼내 쓴다.
+    """
+
+    __slots__ = ("item_ids", "scores", "alphas", "betas")
+
+    def __init__(
+        self,
+        item_ids: List[str],
+        scores: np.ndarray,
+        alphas: np.ndarray,
+        betas: np.ndarray,
+    ):
+        self.item_ids = item_ids
+        self.scores = scores
+        self.alphas = alphas
+        self.betas = betas
+
+    @classmethod
+    def empty(cls) -> "PredictionBatch":
+        return cls([], np.empty(0), np.empty(0, np.int64), np.empty(0, np.int64))
+
+    def rows(self) -> Iterator[Tuple[str, float, int, int]]:
+        """(item_id, score, alpha, beta) 를 Python 값으로 반환한다."""
+        return zip(
+            self.item_ids,
+            self.scores.tolist(),
+            self.alphas.tolist(),
+            self.betas.tolist(),
+        )
+
+    def __getitem__(self, i: Union[int, slice]):
+        if isinstance(i, slice):
+            return PredictionBatch(
+                self.item_ids[i], self.scores[i], self.alphas[i], self.betas[i]
+            )
+        return Prediction(
+            item_id=self.item_ids[i],
+            score=self.scores.item(i),
+            alpha=self.alphas.item(i),
+            beta=self.betas.item(i),
+        )
+
+    def __len__(self) -> int:
+        return len(self.item_ids)
+
+    def __iter__(self) -> Iterator[Prediction]:
+        return (Prediction(*row) for row in self.rows())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PredictionBatch):
+            return (
+                self.item_ids == other.item_ids
+                and np.array_equal(self.scores, other.scores)
+                and np.array_equal(self.alphas, other.alphas)
+                and np.array_equal(self.betas, other.betas)
+            )
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"PredictionBatch({list(self)!r})"
+
+
 @dataclass
 class Observation:
     item_id: str
@@ -28,6 +126,39 @@ class Observation:
     beta: int
 
 
+def sample_prediction(
+    item_id: str,
+    alpha: float,
+    beta: float,
+    explore: float,
+    explorable: bool = True,
+    rng: Optional[RandomEngine] = None,
+) -> Prediction:
+    """
+    arm 하나의 score 를 샘플링한다. ThompsonBandit.pull 의 계산을 alpha, beta, explore 값만으로 수행한다.
+
+    :return: alpha, beta 는 1 을 더한 Beta 분포의 parameter 이다.
+    """
+    rng = rng or _LEGACY_ENGINE
+    alpha, beta = alpha + 1, beta + 1
+    regret_a, regret_b = math.log(alpha, math.e), math.log(beta, math.e)
+    reward = rng.beta(alpha, beta)
+
+    if not explorable:
+        prediction = Prediction(
+            item_id=item_id, score=reward, alpha=int(alpha), beta=int(beta)
+        )
+        return prediction
+
+    regret = rng.beta(regret_a + 1, regret_b + 1)
+    exploit = 1 - explore
+    score = (reward * exploit) + (regret * explore)
+    prediction = Prediction(
+        item_id=item_id, score=score, alpha=int(alpha), beta=int(beta)
+    )
+    return prediction
+
+
 class ThompsonBandit(MAB):
     def __init__(
         self,
@@ -35,14 +166,22 @@ class ThompsonBandit(MAB):
         created_at: Optional[float] = None,
         contexts: Iterable[Context] = tuple(),
         pool_size: int = 1000,
+        window: str = "count",
+        half_life: float = 60 * 60 * 24,
+        buckets: int = 24,
+        bucket_seconds: float = 60 * 60,
     ):
+        """
+        :param window: "count" 이면 최근 pool_size 개의 context 로, "decayed" 이면 half_life 초마다
+            절반으로 감쇠하는 가중치 합으로, "bucket" 이면 bucket_seconds 초 단위 bucket
+            buckets 개 안의 context 수로 alpha, beta 를 계산한다.
+        """
         super(ThompsonBandit, self).__init__()
         self._item_id = item_id
         self._created_at = created_at or time.time()
-        self.pool_size = pool_size
-        self.contexts = llist.dllist()
-        self._alpha = 0
-        self._beta = 0
+        self.contexts = windows.build(
+            window, item_id, pool_size, half_life, buckets, bucket_seconds
+        )
 
         contexts = sorted(contexts, key=lambda x: x.updated_at)
         for context in contexts:
@@ -57,22 +196,24 @@ class ThompsonBandit(MAB):
         return self._created_at
 
     @property
-    def alpha(self) -> int:
-        return self._alpha
+    def pool_size(self) -> Optional[int]:
+        return self.contexts.pool_size
 
     @property
-    def beta(self) -> int:
-        return self._beta
+    def alpha(self) -> Union[int, float]:
+        return self.contexts.alpha
 
     @property
-    def total(self) -> int:
+    def beta(self) -> Union[int, float]:
+        return self.contexts.beta
+
+    @property
+    def total(self) -> Union[int, float]:
         return self.alpha + self.beta
 
     @property
     def last_context(self) -> Optional[Context]:
-        if self.contexts.last:
-            return self.contexts.last.value
-        return None
+        return self.contexts.last
 
     @property
     def explore(self) -> float:
@@ -90,7 +231,9 @@ class ThompsonBandit(MAB):
         return float(1 - self.explore)
 
     @annotations.elapsed
-    def pull(self, explorable: bool = True) -> Prediction:
+    def pull(
+        self, explorable: bool = True, rng: Optional[RandomEngine] = None
+    ) -> Prediction:
         """
         Slot machine 을 당겨서 reward 를 받는다.
 
@@ -101,63 +244,31 @@ class ThompsonBandit(MAB):
         - reward: 1 or 0
         - regret: log scale 을 씌워 더 넓은 확률 분포를 가지도록 만든 임의의 값 기댓값이 너무 빨리 수렴되어 정확한 reward 에 도달되지 못하는 것을 막기 위해 탐험의 확률을 높이는 일을 한다.
 
+        :param rng: 샘플링에 사용할 RandomEngine, None 이면 전역 np.random 을 사용한다.
         :return: expected reward score as float between 0 to 1.
         """
-        alpha, beta = self._alpha + 1, self._beta + 1
-        regret_a, regret_b = math.log(alpha, math.e), math.log(beta, math.e)
-        reward = np.random.beta(alpha, beta)
-
-        if not explorable:
-            prediction = Prediction(
-                item_id=self.item_id, score=reward, alpha=alpha, beta=beta
-            )
-            return prediction
-
-        regret = np.random.beta(regret_a + 1, regret_b + 1)
-        explore = self.explore
-        exploit = 1 - explore
-        score = (reward * exploit) + (regret * explore)
-        prediction = Prediction(item_id=self.item_id, score=score, alpha=alpha, beta=beta)
-        return prediction
+        explore = self.explore if explorable else 0.0
+        return sample_prediction(
+            self.item_id, self.alpha, self.beta, explore, explorable, rng
+        )
 
     def mean(self) -> float:
-        return self._alpha / self.total
+        return self.alpha / self.total
 
     def observation(self) -> Observation:
-        return Observation(item_id=self.item_id, alpha=self.alpha, beta=self.beta)
+        return Observation(
+            item_id=self.item_id, alpha=int(self.alpha), beta=int(self.beta)
+        )
 
     def update(self, c: Context):
-        if c.value == 1:
-            nodes = list(self.contexts.iternodes())
-            for node in reversed(nodes):
-                if node.value.value == 0:
-                    self.contexts.remove(node)
-                    self._beta -= 1
-                    break
-
-            self._alpha += 1
-        elif c.value == 0:
-            self._beta += 1
-        else:
-            raise ValueError(f"Invalid context value: {c.value}")
-
         self.contexts.append(c)
 
-        if len(self.contexts) > self.pool_size:
-            context = self.contexts.popleft()
-            if context.value == 1:
-                self._alpha -= 1
-            else:
-                self._beta -= 1
-
     def reset(self):
-        self._alpha = 0
-        self._beta = 0
-        self.contexts = llist.dllist()
+        self.contexts = self.contexts.renew()
 
     def draw_beta_distribution(self):
         x = np.linspace(0.01, 0.99, 99)
-        y = scipy.stats.beta(self._alpha, self._beta).pdf(x)
+        y = scipy.stats.beta(self.alpha, self.beta).pdf(x)
         plt.figure(figsize=(12, 8))
         plt.plot(x, y, "r")
         plt.xlabel("X")
@@ -170,8 +281,8 @@ class ThompsonBandit(MAB):
         return (
             f"ThompsonBandit("
             f"item_id='{self.item_id}', "
-            f"alpha={self._alpha}, "
-            f"beta={self._beta}"
+            f"alpha={self.alpha}, "
+            f"beta={self.beta}"
             f")"
         )
 
@@ -187,16 +298,180 @@ class ThompsonBandit(MAB):
         return all(results)
 
 
+class Publication:
+    """
+    한 번에 publish 된 ArmView 와 SegmentView.
+
+    ThompsonMultiArmedBandit 은 publish 할 때 이 객체를 한 번의 대입으로 교체하므로,
+    reader 는 segment 통계와 arm 상태를 항상 같은 publish 의 것으로 읽는다.
+    """
+
+    __slots__ = ("view", "segments")
+
+    def __init__(self, view: ArmView, segments: Optional[SegmentView] = None):
+        self.view = view
+        self.segments = segments
+
+    @property
+    def version(self) -> int:
+        return self.view.version
+
+    def lease(self) -> bool:
+        """두 view 를 모두 lease 한다. 하나라도 이미 풀렸으면 잡은 lease 를 놓고 False 를 반환한다."""
+        if not self.view.lease():
+            return False
+        if self.segments is not None and not self.segments.lease():
+            self.view.release()
+            return False
+        return True
+
+    def release(self):
+        if self.segments is not None:
+            self.segments.release()
+        self.view.release()
+
+
+class Bandits(Mapping):
+    """
+    item_id -> ThompsonBandit 의 읽기 전용 view.
+
+    snapshot 에서 복원된 arm 은 ArmStore 에만 올라가 있으며, 아직 update 되지 않은 arm 은
+    접근할 때마다 snapshot 의 window 로 ThompsonBandit 을 새로 만든다.
+    reader thread 에서 접근해도 ThompsonMultiArmedBandit 의 상태를 바꾸지 않는다.
+    """
+
+    def __init__(self, mab: "ThompsonMultiArmedBandit"):
+        self._mab = mab
+
+    def __getitem__(self, item_id: str) -> ThompsonBandit:
+        key = self._mab.interner.code(item_id)
+        bandit = None if key is None else self._mab._load(key)
+        if bandit is None:
+            raise KeyError(item_id)
+        return bandit
+
+    def __contains__(self, item_id) -> bool:
+        key = self._mab.interner.code(item_id)
+        return key is not None and key in self._mab.store
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._mab.store.ids)
+
+    def __len__(self) -> int:
+        return len(self._mab.store)
+
+
 class ThompsonMultiArmedBandit(MAB):
-    def __init__(self, bandits: Iterable[ThompsonBandit] = tuple()):
-        self._bandits = {x.item_id: x for x in bandits}
+    def __init__(
+        self,
+        bandits: Iterable[ThompsonBandit] = tuple(),
+        rng: Optional[RandomEngine] = None,
+        kernel: str = "exact",
+        kernel_threshold: float = 100,
+        processes: int = 0,
+        sharding_threshold: int = 100000,
+        journal: Optional[Journal] = None,
+        interner: Optional[Interner] = None,
+        window: str = "count",
+        half_life: float = 60 * 60 * 24,
+        buckets: int = 24,
+        bucket_seconds: float = 60 * 60,
+        segmented: bool = False,
+        publish_interval: float = 0.0,
+    ):
+        """
+        :param window: 새로 만드는 ThompsonBandit 의 window 종류, "count", "decayed", "bucket".
+        :param half_life: "decayed" window 의 반감기 (초).
+        :param buckets: "bucket" window 의 bucket 수.
+        :param bucket_seconds: "bucket" window 의 bucket 하나의 길이 (초).
+        :param segmented: True 이면 Context.author_id 별 통계를 SegmentStore 에 함께 보관한다.
+        :param publish_interval: 변경을 새 ArmView 로 publish 하는 최소 간격 (초), 0 이면 변경마다 publish 한다.
+        """
+        if kernel not in KERNELS:
+            raise ValueError(f"Invalid sampling kernel: {kernel}")
+        if window not in windows.WINDOWS:
+            raise ValueError(f"Invalid window: {window}")
+        self._window = window
+        self._half_life = half_life
+        self._buckets = buckets
+        self._bucket_seconds = bucket_seconds
+        # DecayedWindow 는 새 context 가 들어올 때만 감쇠하므로 읽을 때 now 까지 감쇠한다.
+        self._decay_half_life = (
+            half_life if window == windows.DecayedWindow.KIND else None
+        )
+        bandits = list(bandits)
+        self._interner = Interner() if interner is None else interner
+        self._bandits: Dict[int, ThompsonBandit] = {
+            self._interner.intern(x.item_id): x for x in bandits
+        }
+        self._rng = rng or _LEGACY_ENGINE
+        self._kernel = kernel
+        self._kernel_threshold = kernel_threshold
+        self._sharding_threshold = sharding_threshold
+        self._sampler = (
+            ShardedSampler(processes, rng=self._rng) if processes > 0 else None
+        )
+        self._store = ArmStore(
+            capacity=max(len(self._bandits), 1024),
+            shared=self._sampler is not None,
+            interner=self._interner,
+        )
+        self._segments = SegmentStore(self._window_of) if segmented else None
+        # publish 된 view, 새 view 로 바뀌면 lease 를 놓아서 reader 가 다 읽은 뒤 배열이 재사용된다.
+        self._publication: Optional[Publication] = None
+        self._snapshot: Optional[snapshot.Snapshot] = None
+        # 직전 snapshot 이후 window 가 바뀐 arm 의 key, snapshot 은 이 arm 의 window 만 새로 export 한다.
+        self._dirty: Set[int] = set(self._bandits)
+        # window 를 벗어나는 bucket 이 생기는 시각, advance 에서 해당 arm 의 window 를 옮긴다.
+        self._expiries = windows.Expiries()
+        # 삭제된 arm 의 (삭제 후 ArmStore version, key), 그 전에 publish 된 view 의 lease 가 모두 풀리면
+        # compact 에서 code 를 반납한다.
+        self._retired: Deque[Tuple[int, int]] = collections.deque()
+        self._journal = journal
+        self._lock = threading.Lock()
+        self._publish_interval = publish_interval
+        self._published_at = -math.inf
+        for key, bandit in self._bandits.items():
+            self._sync(key, bandit)
+        self._publish()
+
+    @property
+    def bandits(self) -> Bandits:
+        return Bandits(self)
 
     @property
-    def bandits(self) -> Dict[str, ThompsonBandit]:
-        return self._bandits
+    def store(self) -> ArmStore:
+        return self._store
+
+    @property
+    def view(self) -> ArmView:
+        """마지막으로 publish 된 ArmView 를 lease 해서 반환한다. 다 읽었으면 release 해야 한다."""
+        while True:
+            view = self._published().view
+            if view.lease():
+                return view
+
+    @property
+    def rng(self) -> RandomEngine:
+        return self._rng
+
+    @property
+    def interner(self) -> Interner:
+        return self._interner
+
+    @property
+    def segments(self) -> Optional[SegmentStore]:
+        return self._segments
 
     @annotations.elapsed
-    def pull(self, explorable: bool = True) -> List[Prediction]:
+    def pull(
+        self,
+        explorable: bool = True,
+        k: Optional[int] = None,
+        item_ids: Optional[Sequence[str]] = None,
+        kernel: Optional[str] = None,
+        segments: Optional[Sequence[str]] = None,
+    ) -> PredictionBatch:
         """
         Slot machine 을 당겨서 rewards 를 받는다.
 
@@ -207,45 +482,204 @@ class ThompsonMultiArmedBandit(MAB):
         - reward: 1 or 0.
         - regret: log scale 을 씌워 더 넓은 확률 분포를 가지도록 만든 임의의 값 기댓값이 너무 빨리 수렴되어 정확한 reward 에 도달되지 못하는 것을 막기 위해 탐험의 확률을 높이는 일을 한다.
 
+        arm 별 객체를 순회하지 않고 마지막으로 publish 된 ArmView 의 배열 위에서 한 번에 계산한다.
+        view 는 변경되지 않으므로 update 와 동시에 실행되어도 lock 없이 한 version 의 상태를 읽는다.
+        k 가 주어지면 전체를 정렬하지 않고 상위 k 개만 골라 정렬한다.
+        item_ids 가 주어지면 해당 arm 들만 샘플링하여 item_ids 순서 그대로 반환하며,
+        존재하지 않는 item 은 alpha=0, beta=0 인 Beta(1, 1), 즉 uniform 분포에서 샘플링한다.
+        reward 는 kernel 로 샘플링하며 approximate kernel 은 alpha, beta 가 모두
+        kernel_threshold 이상이고 분포가 충분히 대칭인 arm 을 정규분포로 근사한다.
+        processes 가 지정되어 있고 arm 수가 sharding_threshold 이상이면 전체 arm 샘플링을
+        process pool 에서 shard 단위로 나누어 수행한다.
+        window 가 "decayed" 이면 alpha, beta 를 마지막 context 이후 지금까지 경과한 시간만큼 감쇠해서
+        샘플링하므로, 새 context 가 없는 arm 도 wall-clock 시각에 맞게 잊혀진다.
+
+        :param k: 반환할 최대 prediction 수, None 이면 전체를 반환한다.
+        :param item_ids: 샘플링 할 item 목록, None 이면 전체 arm 을 순위대로 반환한다.
+        :param kernel: "exact" 또는 "approximate", None 이면 생성 시 지정한 kernel 을 사용한다.
+        :param segments: 주어지면 전체 arm 대신 해당 segment (author_id) 들의 통계를 item 별로
+            합산해서 샘플링한다. segmented=True 로 생성해야 한다.
         :return: a tuple list consists of (id, reward)
         """
 
-        bandits = [x for x in self.bandits.values()]
+        if segments is not None:
+            return self._pull_segments(segments, explorable, k, item_ids, kernel)
 
-        if not bandits:
-            return []
+        publication = self._lease()
+        try:
+            return self._pull(
+                publication.view, time.time(), explorable, k, item_ids, kernel
+            )
+        finally:
+            publication.release()
 
-        bandits_matrix = [(x.alpha + 1, x.beta + 1, x.explore) for x in bandits]
-        bandits_matrix = np.array(bandits_matrix)
+    def _pull(
+        self,
+        view: ArmView,
+        now: float,
+        explorable: bool,
+        k: Optional[int],
+        item_ids: Optional[Sequence[str]],
+        kernel: Optional[str],
+    ) -> PredictionBatch:
+        """lease 한 view 에서 pull 한다."""
+        if item_ids is not None:
+            slots = view.slots(self._interner.codes(item_ids))
+            found = slots >= 0
+            alphas, betas = np.zeros(len(slots)), np.zeros(len(slots))
+            alphas[found], betas[found] = self._decay(
+                now,
+                view.alphas[slots[found]],
+                view.betas[slots[found]],
+                view.updated_ats[slots[found]],
+            )
+            explores = None
+            if explorable:
+                explores = view.explores(now)[slots[found]]
+            scores = np.empty(len(slots))
+            scores[found] = self._scores(alphas[found], betas[found], explores, kernel)
+            scores[~found] = self._rng.random(len(slots) - int(found.sum()))
+            return self._predictions(list(item_ids), scores, alphas, betas)
 
-        alphas, betas = bandits_matrix[:, 0], bandits_matrix[:, 1]
-        regret_a, regret_b = np.log(alphas) + 1, np.log(betas) + 1
+        if not len(view):
+            return PredictionBatch.empty()
 
-        rewards = np.random.beta(alphas, betas)
+        if self._sampler and len(view) >= self._sharding_threshold:
+            # worker process 는 lease 한 view 의 shared memory 를 직접 읽는다.
+            kernel = kernel or self._kernel
+            slots, *ranked = self._sampler.pull(
+                view,
+                k,
+                now,
+                kernel,
+                self._kernel_threshold,
+                explorable,
+                self._decay_half_life,
+            )
+            found = view.keys[slots] >= 0
+            if not found.all():
+                slots, ranked = slots[found], [x[found] for x in ranked]
+            return self._predictions(view.names(slots), *ranked)
 
-        if not explorable:
-            ranked_indices = np.argsort(rewards)[::-1]
-            ranked_bandits = tuple(bandits[x] for x in ranked_indices)
-            ranked_rewards = tuple(rewards[x] for x in ranked_indices)
-            return [
-                Prediction(item_id=x.item_id, score=y, alpha=x.alpha, beta=x.beta)
-                for x, y in zip(ranked_bandits, ranked_rewards)
-            ]
+        alphas, betas, updated_ats = view.alphas, view.betas, view.updated_ats
+        explores = view.explores(now) if explorable else None
+        slots = view.available(now)
+        if slots is not None:
+            alphas, betas, updated_ats = alphas[slots], betas[slots], updated_ats[slots]
+            explores = None if explores is None else explores[slots]
+        alphas, betas = self._decay(now, alphas, betas, updated_ats)
+        scores = self._scores(alphas, betas, explores, kernel)
 
-        regrets = np.random.beta(regret_a, regret_b)
-        explores = bandits_matrix[:, 2]
-        exploits = 1 - explores
-        rewards = (rewards * exploits) + (regrets * explores)
+        ranked_indices = top_k(scores, len(scores) if k is None else min(k, len(scores)))
+        ranked_slots = ranked_indices if slots is None else slots[ranked_indices]
+        return self._predictions(
+            view.names(ranked_slots),
+            scores[ranked_indices],
+            alphas[ranked_indices],
+            betas[ranked_indices],
+        )
 
-        ranked_indices = np.argsort(rewards)[::-1]
-        ranked_bandits = tuple(bandits[x] for x in ranked_indices)
-        ranked_rewards = tuple(rewards[x] for x in ranked_indices)
+    def get(self, item_id: str, explorable: bool = True) -> Optional[Prediction]:
+        """
+        publish 된 ArmView 에서 item 하나를 ThompsonBandit.pull 과 같은 방식으로 샘플링한다.
 
-        result = [
-            Prediction(item_id=x.item_id, score=y, alpha=x.alpha, beta=x.beta)
-            for x, y in zip(ranked_bandits, ranked_rewards)
-        ]
-        return result
+        :return: view 에 없는 item 이면 None.
+        """
+        publication = self._lease()
+        view = publication.view
+        try:
+            key = self._interner.code(item_id)
+            slot = None if key is None else view.slot(key)
+            if slot is None:
+                return None
+
+            now = time.time()
+            alpha, beta = view.alphas.item(slot), view.betas.item(slot)
+            decays = decay_factors(
+                now, view.updated_ats[slot : slot + 1], self._decay_half_life
+            )
+            if decays is not None:
+                alpha, beta = alpha * decays.item(), beta * decays.item()
+            explore = view.explores(now).item(slot) if explorable else 0.0
+            return sample_prediction(
+                self._interner.name(key), alpha, beta, explore, explorable, self._rng
+            )
+        finally:
+            publication.release()
+
+    def _pull_segments(
+        self,
+        segments: Sequence[str],
+        explorable: bool,
+        k: Optional[int],
+        item_ids: Optional[Sequence[str]],
+        kernel: Optional[str],
+    ) -> PredictionBatch:
+        """
+        segments 의 (segment, item) 통계를 item 별로 합산해서 한 번에 샘플링한다.
+
+        어떤 item 을 샘플링할지와 탐험 비율은 segment 없이 pull 할 때와 같이 publish 된 ArmView 로 정한다.
+        즉 삭제되었거나 TTL 이 만료된 item 은 순위에서 빠지고, explore 는 item 의 마지막 context 기준이다.
+        """
+        if self._segments is None:
+            raise ValueError("Multi armed bandit is not segmented.")
+
+        publication = self._lease()
+        try:
+            return self._pull_publication(
+                publication, segments, explorable, k, item_ids, kernel
+            )
+        finally:
+            publication.release()
+
+    def _pull_publication(
+        self,
+        publication: Publication,
+        segments: Sequence[str],
+        explorable: bool,
+        k: Optional[int],
+        item_ids: Optional[Sequence[str]],
+        kernel: Optional[str],
+    ) -> PredictionBatch:
+        """lease 한 publication 의 view 와 segment view 에서 segments 를 pull 한다."""
+        view = publication.view
+        now = time.time()
+        alphas, betas, _, present = publication.segments.aggregate(
+            segments, len(self._interner), now, self._decay_half_life
+        )
+        if item_ids is not None:
+            codes = self._interner.codes(item_ids)
+            slots = view.slots(codes)
+            found = slots >= 0
+            codes = codes[found]
+            alphas_, betas_ = np.zeros(len(slots)), np.zeros(len(slots))
+            alphas_[found], betas_[found] = alphas[codes], betas[codes]
+            explores = view.explores(now)[slots[found]] if explorable else None
+            scores = np.empty(len(slots))
+            scores[found] = self._scores(alphas_[found], betas_[found], explores, kernel)
+            scores[~found] = self._rng.random(len(slots) - int(found.sum()))
+            return self._predictions(list(item_ids), scores, alphas_, betas_)
+
+        codes = np.flatnonzero(present)
+        slots = view.slots(codes)
+        keep = slots >= 0
+        available = view.available(now)
+        if available is not None:
+            mask = np.zeros(view.size, dtype=bool)
+            mask[available] = True
+            keep[keep] = mask[slots[keep]]
+        codes, slots = codes[keep], slots[keep]
+        alphas, betas = alphas[codes], betas[codes]
+        explores = view.explores(now)[slots] if explorable else None
+        scores = self._scores(alphas, betas, explores, kernel)
+
+        ranked = top_k(scores, len(codes) if k is None else min(k, len(codes)))
+        return self._predictions(
+            self._interner.names(codes[ranked].tolist()),
+            scores[ranked],
+            alphas[ranked],
+            betas[ranked],
+        )
 
     def means(self) -> List[Tuple[str, float]]:
         return [(x.item_id, x.mean()) for x in self.bandits.values()]
@@ -254,29 +688,445 @@ class ThompsonMultiArmedBandit(MAB):
         return [x.observation() for x in self.bandits.values()]
 
     def update(self, c: Context):
-        bandit = self.bandits.get(c.item_id, None)
+        with self._lock:
+            # journal 에 먼저 기록해서, 기록에 실패하면 반영하지 않는다.
+            if self._journal:
+                self._journal.update(c)
+            self._update(c)
+            self._commit()
+
+    def update_many(self, contexts: Iterable[Context]):
+        """
+        여러 context 를 item 별로 묶어서 한 번에 반영한다.
+
+        item 내부의 순서는 유지되며 ArmStore 는 item 당 한 번만 갱신된다.
+        """
+        contexts = list(contexts)
+        with self._lock:
+            if self._journal:
+                self._journal.update_many(contexts)
+            self._update_many(contexts)
+            self._commit()
+
+    def delete(self, key_or_keys: Union[str, Iterable[str]]) -> List[ThompsonBandit]:
+        item_ids = [key_or_keys] if isinstance(key_or_keys, str) else list(key_or_keys)
+        with self._lock:
+            if self._journal:
+                self._journal.delete_many(item_ids)
+            deleted = self._delete(item_ids)
+            self._commit()
+            return deleted
+
+    def expire(self, item_id: str, ttl: float):
+        """
+        item 의 만료 timestamp 를 ArmStore 에 기록한다.
+
+        만료된 arm 은 전체 arm 을 순위대로 뽑을 때 샘플링 전에 제외된다. ttl 이 inf 이면 만료되지 않는다.
+        """
+        self.expire_many([item_id], [ttl])
+
+    def expire_many(self, item_ids: Sequence[str], ttls: Sequence[float]):
+        """item_ids 의 만료 timestamp 를 lock 한 번으로 기록하고, 바뀐 arm 이 있으면 한 번만 commit 한다."""
+        with self._lock:
+            changed = False
+            for item_id, ttl in zip(item_ids, ttls):
+                key = self._interner.code(item_id)
+                if key is not None and self._store.expire(key, ttl):
+                    changed = True
+            if changed:
+                self._commit()
+
+    def advance(self, now: Optional[float] = None, limit: Optional[int] = None) -> int:
+        """
+        "bucket" window 중 now 기준으로 window 를 벗어난 bucket 이 있는 arm 을 최대 limit 개 옮긴다.
+
+        BucketWindow 는 새 context 가 들어올 때만 움직이므로, 주기적으로 호출해서 새 context 가 없는
+        arm 의 오래된 view, click 을 뺀다. 옮길 arm 은 expires_at 으로 예약해 두므로 비용은 옮기는 arm 수에
+        비례하며, snapshot 에서 아직 복원되지 않은 arm 은 이때 복원된다.
+
+        :return: 처리한 arm 수, 0 이면 더 옮길 arm 이 없다.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            due = self._expiries.pop(now, limit)
+            for key in due:
+                bandit = self._find(key)
+                if bandit is None:
+                    continue
+                if bandit.contexts.advance(now):
+                    self._dirty.add(key)
+                    self._sync(key, bandit)
+                else:
+                    self._expiries.schedule(key, bandit.contexts.expires_at)
+            processed = len(due)
+            if self._segments is not None:
+                processed += self._segments.advance(now, limit)
+            if processed:
+                self._commit()
+            return processed
+
+    def publish(self, force: bool = True) -> bool:
+        """
+        마지막 publish 이후의 변경을 새 ArmView 로 publish 한다.
+
+        pull 은 publish 된 view 만 읽으므로 update 는 pull 과 경합하지 않고,
+        publish_interval 안에 들어온 변경은 하나의 view 로 합쳐진다.
+
+        :param force: False 이면 publish_interval 이 지나지 않았을 때 publish 를 미룬다.
+        :return: publish 된 view 가 최신 상태이면 True.
+        """
+        with self._lock:
+            if force:
+                self._publish()
+            else:
+                self._commit()
+            return self._publication.version == self._store.version
+
+    def publish_delay(self) -> float:
+        """다음 publish 까지 남은 시간 (초)."""
+        elapsed = time.monotonic() - self._published_at
+        return max(self._publish_interval - elapsed, 0.0)
+
+    def _published(self) -> Publication:
+        """
+        publish 된 Publication, reader 는 writer 를 기다리지 않는다.
+
+        Writer 없이 update 하는 경우를 위해 publish_interval 이 지나도록 publish 되지 않은 변경이 있으면
+        lock 이 비어 있을 때만 이때 publish 하고, writer 가 lock 을 잡고 있으면 지금 view 를 그대로 쓴다.
+        """
+        publication = self._publication
+        if publication.version == self._store.version or self.publish_delay():
+            return publication
+        if not self._lock.acquire(blocking=False):
+            return publication
+        try:
+            self._commit()
+        finally:
+            self._lock.release()
+        return self._publication
+
+    def _lease(self) -> Publication:
+        """publish 된 Publication 을 lease 해서 반환한다. 그 사이 새로 publish 되어 lease 가 풀렸으면 다시 읽는다."""
+        while True:
+            publication = self._published()
+            if publication.lease():
+                return publication
+
+    def _update(self, c: Context):
+        key = self._interner.intern(c.item_id)
+        bandit = self._find(key)
         if not bandit:
-            bandit = ThompsonBandit(item_id=c.item_id, created_at=c.updated_at)
-            self._bandits[c.item_id] = bandit
+            item_id = self._interner.name(key)
+            bandit = self._create(item_id, created_at=c.updated_at)
+            self._bandits[key] = bandit
         if c.value == 0 or c.value == 1:
             bandit.update(c)
+            if self._segments is not None:
+                self._segments.update(key, c)
+        self._dirty.add(key)
+        self._sync(key, bandit)
 
-    def delete(self, key_or_keys: Union[str, Iterable[str]]) -> List[ThompsonBandit]:
-        if isinstance(key_or_keys, str):
-            deleted = self._bandits.pop(key_or_keys, None)
-            return [deleted]
-
-        if isinstance(key_or_keys, Iterable):
-            getter = self._bandits.get
-            deleted = [getter(k, None) for k in key_or_keys]
-            self._bandits = {
-                k: v for k, v in self._bandits.items() if k not in key_or_keys
-            }
-            return deleted
+    def _update_many(self, contexts: Iterable[Context]):
+        grouped: Dict[int, List[Context]] = {}
+        intern = self._interner.intern
+        for c in contexts:
+            grouped.setdefault(intern(c.item_id), []).append(c)
+
+        for key, group in grouped.items():
+            bandit = self._find(key)
+            if not bandit:
+                item_id = self._interner.name(key)
+                bandit = self._create(item_id, created_at=group[0].updated_at)
+                self._bandits[key] = bandit
+            for c in group:
+                if c.value == 0 or c.value == 1:
+                    bandit.update(c)
+                    if self._segments is not None:
+                        self._segments.update(key, c)
+            self._dirty.add(key)
+            self._sync(key, bandit)
+
+    def _delete(self, item_ids: List[str]) -> List[Optional[ThompsonBandit]]:
+        """
+        arm 을 ArmStore 에서 tombstone 으로 표시한다.
+
+        snapshot 에서 아직 복원되지 않은 arm 은 지울 window 를 읽어 오지 않고 빈 ThompsonBandit 을 돌려준다.
+        """
+        deleted = []
+        for key in self._interner.codes(item_ids).tolist():
+            bandit = None
+            if key >= 0 and (key in self._bandits or key in self._store):
+                bandit = self._bandits.pop(key, None)
+                if bandit is None:
+                    bandit = self._create(self._interner.name(key))
+                self._dirty.discard(key)
+                self._expiries.discard(key)
+                self._store.delete(key)
+                self._retired.append((self._store.version, key))
+                if self._segments is not None:
+                    self._segments.delete(key)
+            deleted.append(bandit)
+        return deleted
+
+    def compact(self, limit: Optional[int] = None) -> int:
+        """
+        삭제로 생긴 ArmStore 의 tombstone 을 최대 limit 개 회수한다.
+
+        삭제 이전에 publish 된 ArmView 의 lease 가 모두 풀렸고 그 사이 다시 들어오지 않은 arm 의 code 도
+        Interner 에 반납한다. 그 view 를 읽고 있는 reader 가 재발급된 code 를 보지 않도록 바로 반납하지 않는다.
+        update 와 같은 lock 안에서 실행되므로 limit 을 작게 주면 update 를 오래 막지 않는다.
+        """
+        with self._lock:
+            reclaimed = self._store.compact(limit)
+            if self._segments is not None:
+                reclaimed += self._segments.compact(limit)
+            self._commit()
+            self._release()
+            return reclaimed
 
     def reset(self):
-        for bandit in self.bandits.values():
-            bandit.reset()
+        with self._lock:
+            for bandit in self._bandits.values():
+                bandit.reset()
+            self._dirty = set(self._bandits)
+            self._expiries.clear()
+            self._snapshot = None
+            self._store.reset()
+            if self._segments is not None:
+                self._segments.reset()
+            self._publish()
+
+    def snapshot(self, directory: Union[str, Path]) -> Path:
+        """
+        ArmStore 와 arm 별 window 를 directory 에 snapshot 으로 기록한다.
+
+        lock 안에서는 ArmStore 와 직전 snapshot 이후 바뀐 arm 의 window 만 복사하고,
+        나머지 arm 은 lock 밖에서 직전 snapshot 의 window 를 그대로 옮겨 쓴다.
+        journal 이 있으면 상태를 복사하는 동안 update 를 막고 새 segment 로 넘긴 뒤,
+        snapshot 이 기록되면 이전 segment 를 지운다.
+        segmented 이면 SegmentStore 의 통계도 같은 방식으로 함께 기록한다.
+        """
+        with self._lock:
+            checkpoint = self._journal.rotate() if self._journal else None
+            ids, matrix = self._store.export()
+            dirty, self._dirty = self._dirty, set()
+            exported = {}
+            for key in dirty:
+                bandit = self._bandits.get(key, None)
+                if bandit is not None:
+                    exported[bandit.item_id] = (
+                        bandit.created_at,
+                        *bandit.contexts.export(),
+                    )
+            previous = self._snapshot
+            segments = self._segments.export() if self._segments is not None else None
+
+        def state(item_id: str) -> snapshot.WindowState:
+            window = exported.get(item_id, None)
+            if window is None and previous is not None:
+                window = previous.state(item_id)
+            if window is None:
+                bandit = self._create(item_id)
+                window = (bandit.created_at, *bandit.contexts.export())
+            return window
+
+        try:
+            path = snapshot.save(directory, ids, matrix, state, checkpoint, segments)
+        except BaseException:
+            with self._lock:
+                self._dirty |= dirty
+                if self._segments is not None:
+                    self._segments.exported(None)
+            raise
+
+        with self._lock:
+            # 복사 이후 바뀐 arm 은 다시 dirty 이므로, 나머지 arm 은 새 snapshot 에서 복원해도 같다.
+            self._snapshot = snapshot.Snapshot(path)
+            if self._segments is not None:
+                self._segments.exported(self._snapshot.segments)
+        if self._journal:
+            self._journal.truncate(checkpoint)
+        return path
+
+    def restore(self, directory: Optional[Union[str, Path]] = None) -> Optional[float]:
+        """
+        directory 의 최신 snapshot 을 불러오고, journal 이 있으면 그 이후의 record 를 replay 한다.
+
+        ArmStore 는 mmap 된 배열을 한 번에 복사해서 즉시 pull 할 수 있으며,
+        ThompsonBandit 은 해당 arm 이 처음 update 되거나 조회될 때 복원된다.
+
+        :return: 복원된 마지막 context 의 timestamp, 복원할 것이 없으면 None.
+        """
+        loaded = snapshot.load(directory) if directory else None
+        watermark = None
+
+        with self._lock:
+            if loaded is not None:
+                self._bandits = {}
+                self._dirty = set()
+                self._snapshot = loaded
+                self._store.restore(loaded.ids, loaded.matrix)
+                self._schedule_restored()
+                watermark = loaded.watermark
+            if loaded is not None and self._segments is not None:
+                bucket = self._window == windows.BucketWindow.KIND
+                self._segments.restore(
+                    loaded.segments,
+                    self._interner,
+                    bucket_seconds=self._bucket_seconds if bucket else None,
+                )
+
+            if self._journal:
+                checkpoint = loaded.checkpoint if loaded else None
+                for kind, record in self._journal.replay(checkpoint or 0):
+                    if kind == DELETE:
+                        self._delete([record])
+                        continue
+                    self._update(record)
+                    if watermark is None or record.updated_at > watermark:
+                        watermark = record.updated_at
+            self._publish()
+
+        return watermark
+
+    def close(self):
+        if self._journal:
+            self._journal.close()
+        if self._sampler:
+            self._sampler.close()
+        self._store.close()
+        if self._segments is not None:
+            self._segments.close()
+
+    def _find(self, key: int) -> Optional[ThompsonBandit]:
+        """key 의 ThompsonBandit, snapshot 에만 있는 arm 이면 이때 복원한다. lock 안에서 호출해야 한다."""
+        bandit = self._bandits.get(key, None)
+        if bandit is None:
+            bandit = self._load(key)
+            if bandit is not None:
+                self._bandits[key] = bandit
+        return bandit
+
+    def _load(self, key: int) -> Optional[ThompsonBandit]:
+        """
+        key 의 ThompsonBandit, snapshot 에만 있는 arm 이면 snapshot 의 window 로 만들어서 반환한다.
+
+        _bandits 에 넣지 않으므로 reader thread 에서 lock 없이 호출해도 된다.
+        """
+        loaded = self._snapshot
+        bandit = self._bandits.get(key, None)
+        if bandit is not None or key not in self._store:
+            return bandit
+
+        item_id = self._interner.name(key)
+        restored = loaded.window(item_id) if loaded else None
+        if restored is None:
+            return self._create(item_id)
+        created_at, window = restored
+        bandit = self._create(item_id, created_at=created_at)
+        bandit.contexts = window
+        return bandit
+
+    def _release(self):
+        """
+        lease 가 남은 가장 오래된 view 보다 먼저 삭제된 arm 의 code 를 반납한다.
+
+        segment 로 pull 하는 reader 도 같이 publish 된 ArmView 를 함께 lease 하므로
+        ArmView 의 lease 만 보면 segment view 에 남은 pair 도 더 이상 읽히지 않는다.
+        """
+        oldest = self._store.oldest_view()
+        released = []
+        while self._retired and (oldest is None or self._retired[0][0] <= oldest):
+            _, key = self._retired.popleft()
+            if key not in self._store and key not in self._bandits:
+                released.append(key)
+        if released:
+            if self._segments is not None:
+                self._segments.release(released)
+            self._interner.release(released)
+
+    def _create(self, item_id: str, created_at: Optional[float] = None) -> ThompsonBandit:
+        return ThompsonBandit(
+            item_id=item_id,
+            created_at=created_at,
+            window=self._window,
+            half_life=self._half_life,
+            buckets=self._buckets,
+            bucket_seconds=self._bucket_seconds,
+        )
+
+    def _window_of(self, item_id: str) -> windows.Window:
+        return windows.build(
+            self._window,
+            item_id,
+            half_life=self._half_life,
+            buckets=self._buckets,
+            bucket_seconds=self._bucket_seconds,
+        )
+
+    def _commit(self):
+        """publish_interval 이 지났으면 publish 한다. lock 안에서 호출해야 한다."""
+        if time.monotonic() - self._published_at >= self._publish_interval:
+            self._publish()
+
+    def _publish(self):
+        now = time.time()
+        segments = self._segments.view(now) if self._segments is not None else None
+        previous = self._publication
+        self._publication = Publication(self._store.view(now), segments)
+        if previous is not None:
+            previous.release()
+        self._published_at = time.monotonic()
+
+    def _sync(self, key: int, bandit: ThompsonBandit):
+        updated_at = bandit.contexts.updated_at
+        self._store.put(key, bandit.alpha, bandit.beta, updated_at)
+        self._expiries.schedule(key, bandit.contexts.expires_at)
+
+    def _schedule_restored(self):
+        """snapshot 에서 window 를 읽지 않은 arm 이 bucket 경계에 advance 되도록 예약한다."""
+        self._expiries.clear()
+        if self._window != windows.BucketWindow.KIND:
+            return
+        store = self._store
+        live = store.alphas + store.betas > 0
+        self._expiries.schedule_buckets(
+            store.keys[live].tolist(),
+            store.updated_ats[live].tolist(),
+            self._bucket_seconds,
+        )
+
+    def _decay(
+        self, now: float, alphas: np.ndarray, betas: np.ndarray, updated_ats: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        decays = decay_factors(now, updated_ats, self._decay_half_life)
+        if decays is None:
+            return alphas, betas
+        return alphas * decays, betas * decays
+
+    def _scores(
+        self,
+        alphas: np.ndarray,
+        betas: np.ndarray,
+        explores: Optional[np.ndarray],
+        kernel: Optional[str] = None,
+    ) -> np.ndarray:
+        kernel = kernel or self._kernel
+        return sample_scores(
+            self._rng, alphas, betas, explores, kernel, self._kernel_threshold
+        )
+
+    @staticmethod
+    def _predictions(
+        item_ids: List[str],
+        scores: np.ndarray,
+        alphas: np.ndarray,
+        betas: np.ndarray,
+    ) -> PredictionBatch:
+        """item_ids 와 같은 순서로 정렬된 scores, alphas, betas 로 PredictionBatch 를 만든다."""
+        return PredictionBatch(
+            item_ids, scores, alphas.astype(np.int64), betas.astype(np.int64)
+        )
 
     def draw_beta_distribution(self, item_id: str):
         bandit = self.bandits.get(item_id, None)
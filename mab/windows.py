@@ -0,0 +1,695 @@
+import heapq
+import math
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from mab.context import Context
+
+_SEQUENCE_MASK = 0xFFFFFFFF
+
+# snapshot 용 window 상태, (kind, params, (view sequences, offsets), (click sequences, offsets))
+# sequences, offsets 는 각각 uint32, float32 배열의 bytes.
+State = Tuple[str, Tuple[float, ...], Tuple[bytes, bytes], Tuple[bytes, bytes]]
+
+
+class _Ring:
+    """
+    (sequence, offset) 쌍을 보관하는 고정 타입 ring buffer.
+
+    - sequences: uint32 순번, window 내부에서만 비교하므로 overflow 되어도 무방하다.
+    - offsets: window 의 origin 으로부터의 float32 초 단위 offset.
+
+    capacity 는 필요할 때마다 두 배씩 늘어나지만 limit 을 넘지 않는다.
+    """
+
+    __slots__ = ("_sequences", "_offsets", "_head", "_size", "_limit")
+
+    def __init__(self, limit: int, capacity: int = 4):
+        capacity = max(min(capacity, limit), 1)
+        self._sequences = array("I", bytes(4 * capacity))
+        self._offsets = array("f", bytes(4 * capacity))
+        self._head = 0
+        self._size = 0
+        self._limit = limit
+
+    @property
+    def capacity(self) -> int:
+        return len(self._sequences)
+
+    @property
+    def nbytes(self) -> int:
+        return self.capacity * (self._sequences.itemsize + self._offsets.itemsize)
+
+    def first(self) -> Tuple[int, float]:
+        return self[0]
+
+    def last(self) -> Tuple[int, float]:
+        return self[self._size - 1]
+
+    def append(self, sequence: int, offset: float):
+        if self._size == self.capacity:
+            self._grow()
+        i = (self._head + self._size) % self.capacity
+        self._sequences[i] = sequence
+        self._offsets[i] = offset
+        self._size += 1
+
+    def pop(self):
+        self._size -= 1
+
+    def popleft(self):
+        self._head = (self._head + 1) % self.capacity
+        self._size -= 1
+
+    def export(self) -> Tuple[bytes, bytes]:
+        """오래된 순서대로 정렬된 (sequences, offsets) 의 bytes 를 반환한다."""
+        start, stop = self._head, self._head + self._size
+        if stop <= self.capacity:
+            return (
+                self._sequences[start:stop].tobytes(),
+                self._offsets[start:stop].tobytes(),
+            )
+        stop -= self.capacity
+        return (
+            (self._sequences[start:] + self._sequences[:stop]).tobytes(),
+            (self._offsets[start:] + self._offsets[:stop]).tobytes(),
+        )
+
+    @classmethod
+    def restore(cls, limit: int, sequences: bytes, offsets: bytes) -> "_Ring":
+        ring = cls(limit=limit, capacity=1)
+        ring._sequences = array("I", sequences)
+        ring._offsets = array("f", offsets)
+        ring._size = len(ring._sequences)
+        if not ring._size:
+            ring._sequences.append(0)
+            ring._offsets.append(0)
+        return ring
+
+    def _grow(self):
+        capacity = min(self.capacity * 2, self._limit)
+        if capacity <= self.capacity:
+            raise OverflowError(f"Ring buffer is full: {self._limit}")
+        items = list(self)
+        self._sequences = array("I", bytes(4 * capacity))
+        self._offsets = array("f", bytes(4 * capacity))
+        self._head = 0
+        for i, (sequence, offset) in enumerate(items):
+            self._sequences[i] = sequence
+            self._offsets[i] = offset
+
+    def __getitem__(self, i: int) -> Tuple[int, float]:
+        i = (self._head + i) % self.capacity
+        return self._sequences[i], self._offsets[i]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Tuple[int, float]]:
+        return (self[i] for i in range(self._size))
+
+
+class CountWindow:
+    """
+    최근 pool_size 개의 context 만 유지하는 window.
+
+    - views: value 가 0 인 context, beta 에 해당한다.
+    - clicks: value 가 1 인 context, alpha 에 해당한다.
+
+    click 이 들어오면 가장 최근의 view 하나를 취소하고, pool_size 를 넘으면 가장 오래된 context 를 버린다.
+    Context.count 만큼 반복해서 반영하며, pool_size 번 이후의 반복은 window 를 더 바꾸지 않으므로 생략한다.
+    view 와 click 을 각각의 ring buffer 에 순번과 함께 보관하므로 두 동작 모두 O(1) 이다.
+    context 객체 대신 순번(uint32)과 timestamp offset(float32)만 저장하므로 arm 당 메모리는
+    최대 2 * pool_size * 8 bytes 로 제한되며, contexts 는 순회할 때 Context 로 복원된다.
+    """
+
+    __slots__ = ("item_id", "pool_size", "_views", "_clicks", "_sequence", "_origin")
+
+    KIND = "count"
+
+    def __init__(self, item_id: str = "", pool_size: int = 1000):
+        self.item_id = item_id
+        self.pool_size = pool_size
+        self._views = _Ring(limit=pool_size)
+        self._clicks = _Ring(limit=pool_size)
+        self._sequence = 0
+        self._origin: Optional[float] = None
+
+    @property
+    def alpha(self) -> int:
+        return len(self._clicks)
+
+    @property
+    def beta(self) -> int:
+        return len(self._views)
+
+    @property
+    def nbytes(self) -> int:
+        return self._views.nbytes + self._clicks.nbytes
+
+    @property
+    def last(self) -> Optional[Context]:
+        if not self._views and not self._clicks:
+            return None
+        if self._last_is_view():
+            return self._context(0, self._views.last())
+        return self._context(1, self._clicks.last())
+
+    @property
+    def updated_at(self) -> Optional[float]:
+        """마지막 context 의 timestamp, Context 를 만들지 않고 바로 계산한다."""
+        if not self._views and not self._clicks:
+            return None
+        ring = self._views if self._last_is_view() else self._clicks
+        return self._origin + ring.last()[1]
+
+    def append(self, c: Context):
+        if c.value != 0 and c.value != 1:
+            raise ValueError(f"Invalid context value: {c.value}")
+
+        if self._origin is None:
+            self._origin = c.updated_at
+
+        ring = self._clicks if c.value == 1 else self._views
+        offset = c.updated_at - self._origin
+        for _ in range(min(c.count, self.pool_size)):
+            if c.value == 1 and self._views:
+                self._views.pop()
+
+            if len(self) >= self.pool_size:
+                self._evict()
+
+            ring.append(self._sequence, offset)
+            self._sequence = (self._sequence + 1) & _SEQUENCE_MASK
+
+    @property
+    def expires_at(self) -> Optional[float]:
+        """context 수로만 밀려나므로 시간이 지나도 바뀌지 않는다."""
+        return None
+
+    def advance(self, now: float) -> bool:
+        return False
+
+    def renew(self) -> "CountWindow":
+        """같은 설정의 빈 window."""
+        return CountWindow(item_id=self.item_id, pool_size=self.pool_size)
+
+    def export(self) -> State:
+        """snapshot 용 상태, params 는 (pool_size, origin, sequence)."""
+        origin = math.nan if self._origin is None else self._origin
+        params = (self.pool_size, origin, self._sequence)
+        return self.KIND, params, self._views.export(), self._clicks.export()
+
+    @classmethod
+    def restore(
+        cls,
+        item_id: str,
+        params: Tuple[float, ...],
+        views: Tuple[bytes, bytes],
+        clicks: Tuple[bytes, bytes],
+    ) -> "CountWindow":
+        """export 로 저장한 상태에서 window 를 복원한다."""
+        pool_size, origin, sequence = int(params[0]), params[1], int(params[2])
+        window = cls(item_id=item_id, pool_size=pool_size)
+        window._origin = None if math.isnan(origin) else origin
+        window._sequence = sequence
+        window._views = _Ring.restore(pool_size, *views)
+        window._clicks = _Ring.restore(pool_size, *clicks)
+        return window
+
+    def _age(self, sequence: int) -> int:
+        return (self._sequence - sequence) & _SEQUENCE_MASK
+
+    def _last_is_view(self) -> bool:
+        if not self._clicks:
+            return True
+        if not self._views:
+            return False
+        return self._age(self._views.last()[0]) < self._age(self._clicks.last()[0])
+
+    def _evict(self):
+        if not self._clicks:
+            self._views.popleft()
+        elif not self._views:
+            self._clicks.popleft()
+        elif self._age(self._views.first()[0]) > self._age(self._clicks.first()[0]):
+            self._views.popleft()
+        else:
+            self._clicks.popleft()
+
+    def _context(self, value: int, entry: Tuple[int, float]) -> Context:
+        return Context(
+            item_id=self.item_id, value=value, updated_at=self._origin + entry[1]
+        )
+
+    def __len__(self) -> int:
+        return len(self._views) + len(self._clicks)
+
+    def __iter__(self) -> Iterator[Context]:
+        views, clicks = iter(self._views), iter(self._clicks)
+        view, click = next(views, None), next(clicks, None)
+        while view is not None or click is not None:
+            if click is None or (
+                view is not None and self._age(view[0]) > self._age(click[0])
+            ):
+                yield self._context(0, view)
+                view = next(views, None)
+            else:
+                yield self._context(1, click)
+                click = next(clicks, None)
+
+
+class DecayedWindow:
+    """
+    context 를 보관하지 않고 시간에 따라 지수적으로 감쇠하는 alpha, beta 만 유지하는 window.
+
+    - alpha: click 가중치의 합.
+    - beta: view 가중치의 합.
+
+    새 context 가 들어오면 마지막 context 이후 경과한 시간만큼 기존 값을
+    2 ** (-elapsed / half_life) 로 감쇠한 뒤 더하므로, arm 당 상태는 float 몇 개이고 update 는 O(1) 이다.
+    마지막 context 보다 오래된 context 는 그만큼 감쇠된 가중치로 더한다.
+    CountWindow 와 같이 click 은 가장 최근의 view 하나를 취소하며, 개별 view 를 보관하지 않으므로
+    beta 에서 click 의 가중치만큼 빼는 것으로 근사한다. Context.count 는 가중치에 곱해진다.
+    """
+
+    __slots__ = ("item_id", "half_life", "_alpha", "_beta", "_updated_at", "_value")
+
+    KIND = "decayed"
+
+    def __init__(self, item_id: str = "", half_life: float = 60 * 60 * 24):
+        if half_life <= 0:
+            raise ValueError(f"Invalid half life: {half_life}")
+        self.item_id = item_id
+        self.half_life = half_life
+        self._alpha = 0.0
+        self._beta = 0.0
+        self._updated_at: Optional[float] = None
+        self._value = 0
+
+    @property
+    def pool_size(self) -> Optional[int]:
+        """context 수 제한이 없으므로 None."""
+        return None
+
+    @property
+    def alpha(self) -> float:
+        return self._alpha
+
+    @property
+    def beta(self) -> float:
+        return self._beta
+
+    @property
+    def nbytes(self) -> int:
+        return 3 * 8
+
+    @property
+    def last(self) -> Optional[Context]:
+        if self._updated_at is None:
+            return None
+        return Context(
+            item_id=self.item_id, value=self._value, updated_at=self._updated_at
+        )
+
+    @property
+    def updated_at(self) -> Optional[float]:
+        return self._updated_at
+
+    def append(self, c: Context):
+        if c.value != 0 and c.value != 1:
+            raise ValueError(f"Invalid context value: {c.value}")
+
+        weight = float(c.count)
+        if self._updated_at is None or c.updated_at >= self._updated_at:
+            if self._updated_at is not None:
+                decay = 2.0 ** ((self._updated_at - c.updated_at) / self.half_life)
+                self._alpha *= decay
+                self._beta *= decay
+            self._updated_at = c.updated_at
+            self._value = c.value
+        else:
+            weight *= 2.0 ** ((c.updated_at - self._updated_at) / self.half_life)
+
+        if c.value == 1:
+            self._beta = max(self._beta - weight, 0.0)
+            self._alpha += weight
+        else:
+            self._beta += weight
+
+    @property
+    def expires_at(self) -> Optional[float]:
+        """감쇠는 읽는 쪽에서 decay_factors 로 반영하므로 window 를 옮길 필요가 없다."""
+        return None
+
+    def advance(self, now: float) -> bool:
+        return False
+
+    def renew(self) -> "DecayedWindow":
+        """같은 설정의 빈 window."""
+        return DecayedWindow(item_id=self.item_id, half_life=self.half_life)
+
+    def export(self) -> State:
+        """snapshot 용 상태, params 는 (half_life, alpha, beta, updated_at, value)."""
+        updated_at = math.nan if self._updated_at is None else self._updated_at
+        params = (self.half_life, self._alpha, self._beta, updated_at, self._value)
+        return self.KIND, params, (b"", b""), (b"", b"")
+
+    @classmethod
+    def restore(
+        cls,
+        item_id: str,
+        params: Tuple[float, ...],
+        views: Tuple[bytes, bytes] = (b"", b""),
+        clicks: Tuple[bytes, bytes] = (b"", b""),
+    ) -> "DecayedWindow":
+        """export 로 저장한 상태에서 window 를 복원한다."""
+        half_life, alpha, beta, updated_at, value = params[:5]
+        window = cls(item_id=item_id, half_life=half_life)
+        window._alpha = alpha
+        window._beta = beta
+        window._updated_at = None if math.isnan(updated_at) else updated_at
+        window._value = int(value)
+        return window
+
+    def __len__(self) -> int:
+        return 0 if self._updated_at is None else 1
+
+    def __iter__(self) -> Iterator[Context]:
+        """개별 context 를 보관하지 않으므로 마지막 context 만 반환한다."""
+        last = self.last
+        if last is not None:
+            yield last
+
+
+class BucketWindow:
+    """
+    최근 buckets * bucket_seconds 초 동안의 view, click 수를 시간 bucket 단위로 유지하는 window.
+
+    - alpha: window 안의 click 수.
+    - beta: window 안의 view 수.
+
+    bucket 마다 view, click 수만 uint32 배열에 보관하므로 arm 당 메모리는 2 * buckets * 4 bytes 로
+    window 길이와 무관하다. 새 bucket 의 context 가 들어오면 window 를 벗어난 bucket 을 통째로
+    비우므로 만료 비용은 context 수가 아닌 bucket 수에 비례한다.
+    window 는 가장 최근 context 의 시각 또는 advance 로 넘겨준 시각 중 늦은 쪽을 기준으로 움직이며,
+    window 보다 오래된 context 는 버린다. 새 context 가 없는 arm 은 expires_at 이 지난 뒤 advance 를
+    호출해야 오래된 bucket 이 빠진다.
+    CountWindow 와 같이 click 은 같거나 이전 bucket 중 가장 최근 bucket 의 view 하나를 취소한다.
+    Context.count 는 bucket 의 count 에 한 번에 더한다.
+    """
+
+    __slots__ = (
+        "item_id",
+        "buckets",
+        "bucket_seconds",
+        "_views",
+        "_clicks",
+        "_head",
+        "_alpha",
+        "_beta",
+        "_updated_at",
+        "_value",
+    )
+
+    KIND = "bucket"
+
+    def __init__(
+        self, item_id: str = "", buckets: int = 24, bucket_seconds: float = 3600
+    ):
+        if buckets <= 0:
+            raise ValueError(f"Invalid buckets: {buckets}")
+        if bucket_seconds <= 0:
+            raise ValueError(f"Invalid bucket seconds: {bucket_seconds}")
+        self.item_id = item_id
+        self.buckets = buckets
+        self.bucket_seconds = bucket_seconds
+        self._views = array("I", bytes(4 * buckets))
+        self._clicks = array("I", bytes(4 * buckets))
+        # 가장 최근 bucket 의 번호, floor(updated_at / bucket_seconds)
+        self._head: Optional[int] = None
+        self._alpha = 0
+        self._beta = 0
+        self._updated_at: Optional[float] = None
+        self._value = 0
+
+    @property
+    def pool_size(self) -> Optional[int]:
+        """context 수 제한이 없으므로 None."""
+        return None
+
+    @property
+    def alpha(self) -> int:
+        return self._alpha
+
+    @property
+    def beta(self) -> int:
+        return self._beta
+
+    @property
+    def nbytes(self) -> int:
+        return self._views.itemsize * len(self._views) * 2
+
+    @property
+    def last(self) -> Optional[Context]:
+        if self._updated_at is None:
+            return None
+        return Context(
+            item_id=self.item_id, value=self._value, updated_at=self._updated_at
+        )
+
+    @property
+    def updated_at(self) -> Optional[float]:
+        return self._updated_at
+
+    @property
+    def expires_at(self) -> Optional[float]:
+        """가장 오래된 비어 있지 않은 bucket 이 window 를 벗어나는 시각, 비어 있으면 None."""
+        if self._head is None or not (self._alpha or self._beta):
+            return None
+        for x in range(self._head - self.buckets + 1, self._head + 1):
+            i = x % self.buckets
+            if self._views[i] or self._clicks[i]:
+                return (x + self.buckets) * self.bucket_seconds
+        return None
+
+    def advance(self, now: float) -> bool:
+        """
+        window 를 now 가 속한 bucket 까지 옮긴다.
+
+        :return: window 를 벗어난 bucket 이 있어서 alpha, beta 가 바뀌었으면 True.
+        """
+        bucket = math.floor(now / self.bucket_seconds)
+        if self._head is None or bucket <= self._head:
+            return False
+        alpha, beta = self._alpha, self._beta
+        self._advance(bucket)
+        return alpha != self._alpha or beta != self._beta
+
+    def append(self, c: Context):
+        if c.value != 0 and c.value != 1:
+            raise ValueError(f"Invalid context value: {c.value}")
+
+        bucket = math.floor(c.updated_at / self.bucket_seconds)
+        if self._head is None or bucket > self._head:
+            self._advance(bucket)
+        elif bucket <= self._head - self.buckets:
+            return
+
+        if self._updated_at is None or c.updated_at >= self._updated_at:
+            self._updated_at = c.updated_at
+            self._value = c.value
+
+        i = bucket % self.buckets
+        if c.value == 1:
+            self._cancel(bucket, c.count)
+            self._clicks[i] += c.count
+            self._alpha += c.count
+        else:
+            self._views[i] += c.count
+            self._beta += c.count
+
+    def renew(self) -> "BucketWindow":
+        """같은 설정의 빈 window."""
+        return BucketWindow(
+            item_id=self.item_id, buckets=self.buckets, bucket_seconds=self.bucket_seconds
+        )
+
+    def export(self) -> State:
+        """
+        snapshot 용 상태, params 는 (buckets, bucket_seconds, head, updated_at, value).
+
+        views, clicks 의 sequences 에는 오래된 bucket 부터의 count 를, offsets 에는 각 bucket 이
+        가장 최근 bucket 보다 몇 초 앞서는지를 담는다.
+        """
+        head = math.nan if self._head is None else self._head
+        updated_at = math.nan if self._updated_at is None else self._updated_at
+        params = (self.buckets, self.bucket_seconds, head, updated_at, self._value)
+        if self._head is None:
+            return self.KIND, params, (b"", b""), (b"", b"")
+        order = [(self._head + 1 + x) % self.buckets for x in range(self.buckets)]
+        ages = array("f", ((self.buckets - 1 - x) * self.bucket_seconds for x in order))
+        views = array("I", (self._views[x] for x in order))
+        clicks = array("I", (self._clicks[x] for x in order))
+        return (
+            self.KIND,
+            params,
+            (views.tobytes(), ages.tobytes()),
+            (
+                clicks.tobytes(),
+                ages.tobytes(),
+            ),
+        )
+
+    @classmethod
+    def restore(
+        cls,
+        item_id: str,
+        params: Tuple[float, ...],
+        views: Tuple[bytes, bytes] = (b"", b""),
+        clicks: Tuple[bytes, bytes] = (b"", b""),
+    ) -> "BucketWindow":
+        """export 로 저장한 상태에서 window 를 복원한다."""
+        buckets, bucket_seconds, head, updated_at, value = params[:5]
+        window = cls(item_id=item_id, buckets=int(buckets), bucket_seconds=bucket_seconds)
+        window._updated_at = None if math.isnan(updated_at) else updated_at
+        window._value = int(value)
+        if math.isnan(head):
+            return window
+
+        window._head = int(head)
+        counts = zip(array("I", views[0]), array("I", clicks[0]))
+        for x, (n_views, n_clicks) in enumerate(counts):
+            i = (window._head + 1 + x) % window.buckets
+            window._views[i] = n_views
+            window._clicks[i] = n_clicks
+        window._alpha = sum(window._clicks)
+        window._beta = sum(window._views)
+        return window
+
+    def _advance(self, bucket: int):
+        """head 를 bucket 으로 옮기고 window 를 벗어난 bucket 을 비운다."""
+        if self._head is not None:
+            for x in range(max(self._head + 1, bucket - self.buckets + 1), bucket + 1):
+                i = x % self.buckets
+                self._alpha -= self._clicks[i]
+                self._beta -= self._views[i]
+                self._clicks[i] = 0
+                self._views[i] = 0
+        self._head = bucket
+
+    def _cancel(self, bucket: int, count: int = 1):
+        """bucket 과 같거나 이전인 bucket 중 최근 bucket 부터 view 를 최대 count 개 취소한다."""
+        for x in range(bucket, self._head - self.buckets, -1):
+            if count <= 0:
+                return
+            i = x % self.buckets
+            cancelled = min(self._views[i], count)
+            self._views[i] -= cancelled
+            self._beta -= cancelled
+            count -= cancelled
+
+    def __len__(self) -> int:
+        return self._alpha + self._beta
+
+    def __iter__(self) -> Iterator[Context]:
+        """개별 context 를 보관하지 않으므로 마지막 context 만 반환한다."""
+        last = self.last
+        if last is not None:
+            yield last
+
+
+Window = Union[CountWindow, DecayedWindow, BucketWindow]
+
+WINDOWS = {
+    CountWindow.KIND: CountWindow,
+    DecayedWindow.KIND: DecayedWindow,
+    BucketWindow.KIND: BucketWindow,
+}
+
+
+class Expiries:
+    """
+    key 별 window 의 expires_at 을 예약해 두는 min-heap.
+
+    key 마다 가장 이른 예약만 유효하며, 취소되었거나 더 이른 예약으로 바뀐 heap entry 는
+    꺼낼 때 버린다. (lazy invalidation) 따라서 pop 은 만료된 key 수에 비례하는 비용만 든다.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int]] = []
+        self._scheduled: Dict[int, float] = {}
+
+    def schedule(self, key: int, at: Optional[float]):
+        """key 를 at 에 만료되도록 예약한다. 이미 더 이른 예약이 있으면 무시한다."""
+        if at is None or at >= self._scheduled.get(key, math.inf):
+            return
+        self._scheduled[key] = at
+        heapq.heappush(self._heap, (at, key))
+
+    def schedule_buckets(
+        self, keys: List[int], updated_ats: List[float], bucket_seconds: float
+    ):
+        """
+        snapshot 에서 복원한 key 를 마지막 context 다음 bucket 경계에 만료되도록 예약한다.
+
+        가장 오래된 bucket 이 빠지는 시각은 그 이후이므로, 만료된 key 의 window 를 복원해서
+        정확한 expires_at 으로 다시 예약하면 된다.
+        """
+        for key, updated_at in zip(keys, updated_ats):
+            if key >= 0 and not math.isnan(updated_at):
+                self.schedule(
+                    key, (math.floor(updated_at / bucket_seconds) + 1) * bucket_seconds
+                )
+
+    def discard(self, key: int):
+        self._scheduled.pop(key, None)
+
+    def pop(self, now: float, limit: Optional[int] = None) -> List[int]:
+        """now 까지 만료된 key 를 최대 limit 개 꺼낸다. 꺼낸 key 의 예약은 사라진다."""
+        heap, scheduled = self._heap, self._scheduled
+        due = []
+        while heap and heap[0][0] <= now and (limit is None or len(due) < limit):
+            at, key = heapq.heappop(heap)
+            if scheduled.get(key, None) == at:
+                del scheduled[key]
+                due.append(key)
+        return due
+
+    def clear(self):
+        self._heap = []
+        self._scheduled = {}
+
+    def __len__(self) -> int:
+        return len(self._scheduled)
+
+
+def build(
+    kind: str = CountWindow.KIND,
+    item_id: str = "",
+    pool_size: int = 1000,
+    half_life: float = 60 * 60 * 24,
+    buckets: int = 24,
+    bucket_seconds: float = 60 * 60,
+) -> Window:
+    """kind 에 해당하는 빈 window 를 만든다."""
+    if kind == CountWindow.KIND:
+        return CountWindow(item_id=item_id, pool_size=pool_size)
+    if kind == DecayedWindow.KIND:
+        return DecayedWindow(item_id=item_id, half_life=half_life)
+    if kind == BucketWindow.KIND:
+        return BucketWindow(
+            item_id=item_id, buckets=buckets, bucket_seconds=bucket_seconds
+        )
+    raise ValueError(f"Invalid window: {kind}")
+
+
+def restore(
+    item_id: str,
+    kind: str,
+    params: Tuple[float, ...],
+    views: Tuple[bytes, bytes],
+    clicks: Tuple[bytes, bytes],
+) -> Window:
+    """export 로 저장한 상태에서 kind 에 맞는 window 를 복원한다."""
+    return WINDOWS[kind].restore(item_id, params, views, clicks)
@@ -1,23 +1,87 @@
 import asyncio
+import dataclasses
+import inspect
 from enum import Enum
-from typing import Callable, TypeVar, List, NoReturn, Generic
+from typing import Callable, Dict, TypeVar, List, NoReturn, Generic, Optional, Tuple
 
 from loggers import logger
+from mab import Context
 
 TERMINATE = Enum("TERMINATE", "0")
 
 T = TypeVar("T")
 
 
+class _Subscriber:
+    """
+    subscriber callback 하나와 선택적인 전용 queue.
+
+    callback 이 awaitable 을 반환하면 (async 함수나 Writer 가 반환한 future) 끝날 때까지 기다리므로
+    같은 subscriber 에는 항상 publish 된 순서대로 전달된다.
+    전용 queue 가 있으면 별도의 task 가 queue 를 비우며, Observable 은 queue 가 가득 찼을 때만 기다린다.
+    """
+
+    def __init__(self, callback: Callable, max_size: Optional[int] = None):
+        self.callback = callback
+        self.queue = None if max_size is None else asyncio.Queue(maxsize=max_size)
+        self.task = None if self.queue is None else asyncio.create_task(self._run())
+
+    async def notify(self, data) -> NoReturn:
+        if self.queue is None:
+            await self._call(data)
+        else:
+            await self.queue.put(data)
+
+    async def join(self) -> NoReturn:
+        if self.queue is not None:
+            await self.queue.join()
+
+    async def close(self) -> NoReturn:
+        if self.queue is not None:
+            await self.queue.put(TERMINATE)
+            await self.queue.join()
+
+    async def _call(self, data) -> NoReturn:
+        try:
+            result = self.callback(data)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(e)
+
+    async def _run(self) -> NoReturn:
+        while True:
+            data = await self.queue.get()
+            try:
+                if data is TERMINATE:
+                    break
+                await self._call(data)
+            finally:
+                self.queue.task_done()
+
+
 class Observable(Generic[T]):
+    """
+    publish 된 item 을 subscriber 들에게 전달한다.
+
+    item 마다 subscriber 들을 동시에 실행하고 모두 끝나면 다음 item 으로 넘어간다.
+    subscribe 에 max_size 를 주면 그 subscriber 는 전용 queue 를 가지므로 느린 subscriber 가
+    다른 subscriber 나 publish 를 막지 않는다. (queue 가 가득 차기 전까지)
+    """
+
     def __init__(self, max_size: int = 10):
-        self._callbacks: List[Callable[[T], NoReturn]] = []
+        self._subscribers: List[_Subscriber] = []
         self._queue = asyncio.Queue(maxsize=max_size)
         logger.debug("Starting Observable.asyncio.queue..")
         asyncio.create_task(self._init())
 
-    def subscribe(self, callback: Callable[[T], NoReturn]) -> NoReturn:
-        self._callbacks.append(callback)
+    def subscribe(
+        self, callback: Callable[[T], NoReturn], max_size: Optional[int] = None
+    ) -> NoReturn:
+        """
+        :param max_size: 주어지면 이 크기의 전용 queue 로 callback 을 따로 실행한다.
+        """
+        self._subscribers.append(_Subscriber(callback, max_size))
 
     async def publish(self, data: T) -> NoReturn:
         await self._queue.put(data)
@@ -28,19 +92,22 @@ class Observable(Generic[T]):
                 data = await self._queue.get()
 
                 if data == TERMINATE:
+                    await asyncio.gather(*(x.close() for x in self._subscribers))
                     break
 
-                for subscriber in self._callbacks:
-                    if asyncio.iscoroutinefunction(subscriber):
-                        await subscriber(data)
-                    else:
-                        subscriber(data)
+                await self._notify(data)
 
             except Exception as e:
                 logger.error(e)
             finally:
                 self._queue.task_done()
 
+    async def _notify(self, data) -> NoReturn:
+        if len(self._subscribers) == 1:
+            await self._subscribers[0].notify(data)
+            return
+        await asyncio.gather(*(x.notify(data) for x in self._subscribers))
+
     async def close(self) -> NoReturn:
         logger.debug("Closing Observable.asyncio.queue..")
         await self._queue.put(TERMINATE)
@@ -48,3 +115,137 @@ class Observable(Generic[T]):
 
     async def join(self) -> NoReturn:
         await self._queue.join()
+        for subscriber in self._subscribers:
+            await subscriber.join()
+
+
+class BatchObservable(Observable[T]):
+    """
+    publish 된 item 을 모아서 subscriber 에 List[T] 로 전달하는 Observable.
+
+    첫 item 을 받은 뒤 최대 batch_size 개가 모이거나 linger 초가 지나면 한 번에 전달한다.
+    queue 에 이미 쌓인 item 은 기다리지 않고 바로 꺼내므로 burst 가 들어오면 batch 가 커지고,
+    한가할 때는 최대 linger 만큼만 지연된다.
+    """
+
+    def __init__(
+        self, max_size: int = 1000, batch_size: int = 100, linger: float = 0.005
+    ):
+        if batch_size <= 0:
+            raise ValueError(f"Invalid batch size: {batch_size}")
+        self.batch_size = batch_size
+        self.linger = linger
+        super(BatchObservable, self).__init__(max_size=max_size)
+
+    def subscribe(
+        self, callback: Callable[[List[T]], NoReturn], max_size: Optional[int] = None
+    ) -> NoReturn:
+        super(BatchObservable, self).subscribe(callback, max_size)
+
+    async def _init(self) -> NoReturn:
+        loop = asyncio.get_running_loop()
+        while True:
+            items = [await self._queue.get()]
+            try:
+                deadline = loop.time() + self.linger
+                while items[-1] is not TERMINATE and len(items) < self.batch_size:
+                    if not self._queue.empty():
+                        items.append(self._queue.get_nowait())
+                        continue
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        items.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                batch = [x for x in items if x is not TERMINATE]
+                if batch:
+                    await self._notify(batch)
+                if items[-1] is TERMINATE:
+                    await asyncio.gather(*(x.close() for x in self._subscribers))
+
+            except Exception as e:
+                logger.error(e)
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+
+            if items[-1] is TERMINATE:
+                break
+
+
+class AggregateObservable(Observable[Context]):
+    """
+    publish 된 Context 를 (item_id, author_id, value) 별로 합쳐서 interval 마다 전달하는 Observable.
+
+    한 item 에 event 가 몰려도 flush 마다 item 당 view, click Context 가 하나씩만 subscriber 에
+    전달되며, 합쳐진 event 수는 Context.count 에, 가장 최근 timestamp 는 updated_at 에 담긴다.
+    flush 안에서는 view 를 click 보다 먼저 전달하므로 click 은 같은 flush 의 view 를 취소한다.
+    쌓인 key 가 max_items 개가 되면 interval 을 기다리지 않고 바로 flush 한다.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1000,
+        interval: float = 0.05,
+        max_items: int = 10000,
+        downstream: Optional[Observable[Context]] = None,
+    ):
+        """
+        :param downstream: 주어지면 합쳐진 Context 를 downstream 에 publish 한다.
+        """
+        if interval <= 0:
+            raise ValueError(f"Invalid interval: {interval}")
+        if max_items <= 0:
+            raise ValueError(f"Invalid max items: {max_items}")
+        self.interval = interval
+        self.max_items = max_items
+        self._pending: Dict[Tuple[str, Optional[str], int], Context] = {}
+        self._flushing = asyncio.Lock()
+        self._closed = asyncio.Event()
+        super(AggregateObservable, self).__init__(max_size=max_size)
+        if downstream is not None:
+            self.subscribe(downstream.publish)
+        self._flusher = asyncio.create_task(self._flush_periodically())
+
+    async def publish(self, data: Context) -> NoReturn:
+        key = (data.item_id, data.author_id, data.value)
+        merged = self._pending.get(key, None)
+        if merged is None:
+            self._pending[key] = dataclasses.replace(data)
+            if len(self._pending) >= self.max_items:
+                await self.flush()
+            return
+
+        merged.count += data.count
+        if data.updated_at > merged.updated_at:
+            merged.updated_at = data.updated_at
+
+    async def flush(self) -> NoReturn:
+        """지금까지 합친 Context 를 view 먼저 subscriber 에게 넘긴다."""
+        async with self._flushing:
+            pending, self._pending = self._pending, {}
+            for c in sorted(pending.values(), key=lambda x: x.value == 1):
+                await super(AggregateObservable, self).publish(c)
+
+    async def _flush_periodically(self) -> NoReturn:
+        while not self._closed.is_set():
+            try:
+                await asyncio.wait_for(self._closed.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(e)
+
+    async def join(self) -> NoReturn:
+        await self.flush()
+        await super(AggregateObservable, self).join()
+
+    async def close(self) -> NoReturn:
+        self._closed.set()
+        await self._flusher
+        await super(AggregateObservable, self).close()
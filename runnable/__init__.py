@@ -6,7 +6,6 @@ from grpc_health.v1._async import HealthServicer
 from grpc_reflection.v1alpha import reflection
 from prometheus_client import start_http_server
 
-from caches import TTL
 from configs import settings
 from connectors import Connector
 from container import Container
@@ -14,6 +13,7 @@ from loggers import logger
 from mab import ThompsonMultiArmedBandit
 from protos import bandit_pb2
 from streamable import Streamable
+from writers import Writer
 
 
 @inject
@@ -21,18 +21,22 @@ async def master(
     master_server: grpc.aio.Server = Provide[Container.master_server],
     health_servicer: HealthServicer = Provide[Container.health_servicer],
     multi_armed_bandit: ThompsonMultiArmedBandit = Provide[Container.multi_armed_bandit],
-    ttl: TTL = Provide[Container.ttl],
+    writer: Writer = Provide[Container.writer],
     item_stream: Streamable = Provide[Container.item_stream],
     trace_stream: Streamable = Provide[Container.trace_stream],
-    _: Connector = Provide[Container.ttl_connector],
-    __: Connector = Provide[Container.mab_connector],
+    _: Connector = Provide[Container.writer_connector],
     master_scheduler: AsyncIOScheduler = Provide[Container.master_scheduler],
 ) -> None:
     logger.info("Starting [MASTER] server..")
 
+    watermark = None
+    if settings.snapshot_directory or settings.journal_directory:
+        logger.info("Restoring 'multi_armed_bandit' from snapshot and journal..")
+        watermark = multi_armed_bandit.restore(settings.snapshot_directory or None)
+
     logger.info("Initializing 'ttl' with retrieved contexts..")
     item_ids = multi_armed_bandit.bandits.keys()
-    ttl.update(item_ids)
+    await writer.renew(item_ids)
 
     service_names = (
         bandit_pb2.DESCRIPTOR.services_by_name["Bandit"].full_name,
@@ -45,8 +49,8 @@ async def master(
 
     logger.debug("Starting service on %s", "0.0.0.0:50051")
 
-    item_stream.start()
-    trace_stream.start()
+    item_stream.start(since=watermark)
+    trace_stream.start(since=watermark)
     master_scheduler.start()
 
     await master_server.start()
@@ -1,20 +1,53 @@
-from typing import List
+from typing import List, Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from caches import TTL
+from loggers import logger
 from observable import Observable
+from writers import Writer
 
 
 def scheduler(
     ttl: TTL,
     deletable: Observable[List[str]],
     seconds: int = 60 * 10,
+    expiry_limit: int = 10000,
+    writer: Optional[Writer] = None,
+    snapshot_directory: str = "",
+    snapshot_seconds: int = 60 * 10,
+    compaction_seconds: int = 60,
+    compaction_limit: int = 10000,
+    advance_seconds: int = 60,
+    advance_limit: int = 10000,
 ):
     async def cleanup():
-        expired_ids = ttl.expired()
-        await deletable.publish(expired_ids)
+        while True:
+            if writer is not None:
+                expired_ids = await writer.pop_expired(expiry_limit)
+            else:
+                expired_ids = ttl.pop_expired(expiry_limit)
+            if not expired_ids:
+                break
+            await deletable.publish(expired_ids)
+
+    async def compact():
+        while await writer.compact(compaction_limit):
+            pass
+
+    async def advance():
+        while await writer.advance(advance_limit):
+            pass
+
+    async def snapshot():
+        path = await writer.snapshot(snapshot_directory)
+        logger.info(f"Saved snapshot: {path}")
 
     asyncio_scheduler = AsyncIOScheduler()
     asyncio_scheduler.add_job(cleanup, "interval", seconds=seconds)
+    if writer is not None:
+        asyncio_scheduler.add_job(compact, "interval", seconds=compaction_seconds)
+        asyncio_scheduler.add_job(advance, "interval", seconds=advance_seconds)
+    if writer is not None and snapshot_directory:
+        asyncio_scheduler.add_job(snapshot, "interval", seconds=snapshot_seconds)
     return asyncio_scheduler
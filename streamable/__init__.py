@@ -2,17 +2,64 @@ import abc
 import asyncio
 import json
 import uuid
-from typing import Dict
+from typing import Any, AsyncIterator, Dict, Optional
 
+import aiokafka
 import cachetools
+from aiokafka import TopicPartition
 from prometheus_client import Counter
 
 import clients
+from configs import settings
 from loggers import logger
 from mab import Context
+from mab.interning import Interner
 from observable import Observable
 
 
+async def consume(topic: str, since: Optional[float] = None) -> AsyncIterator[Any]:
+    """
+    topic 의 record 를 처음부터 consume 한다.
+
+    since 가 주어지고 kafka_bootstrap_servers 가 설정되어 있으면 partition 마다 offsets_for_times 로
+    since 시각 이후의 첫 offset 을 찾아 seek 하므로, 재시작할 때 topic 의 전체 이력을 다시 읽지 않는다.
+    record timestamp 는 event 의 시각과 조금 다를 수 있으므로 호출하는 쪽에서 한 번 더 걸러야 한다.
+    """
+    if since is None or not settings.kafka_bootstrap_servers:
+        async for message in clients.kafka.v1.json.consume(
+            topic=topic, group_id=str(uuid.uuid4())
+        ):
+            yield message
+        return
+
+    consumer = aiokafka.AIOKafkaConsumer(
+        bootstrap_servers=settings.kafka_bootstrap_servers,
+        group_id=None,
+        enable_auto_commit=False,
+    )
+    await consumer.start()
+    try:
+        await consumer.topics()
+        partitions = [
+            TopicPartition(topic, x) for x in consumer.partitions_for_topic(topic) or ()
+        ]
+        consumer.assign(partitions)
+        timestamp = int(since * 1000)
+        offsets = await consumer.offsets_for_times({x: timestamp for x in partitions})
+        for partition in partitions:
+            found = offsets.get(partition, None)
+            if found is None:
+                await consumer.seek_to_end(partition)
+            else:
+                consumer.seek(partition, found.offset)
+        logger.info(f"Seeked {topic} to {since}: {offsets}")
+
+        async for message in consumer:
+            yield message
+    finally:
+        await consumer.stop()
+
+
 class Streamable(abc.ABC):
     kafka_counter_metric = Counter(
         "kafka_messages_total", "Count of total kafka messages."
@@ -22,36 +69,51 @@ class Streamable(abc.ABC):
         pass
 
     @abc.abstractmethod
-    def start(self):
+    def start(self, since: Optional[float] = None):
         pass
 
 
 class ItemStream(Streamable, abc.ABC):
-    def __init__(self, updatable: Observable, deletable: Observable):
+    def __init__(
+        self,
+        updatable: Observable,
+        deletable: Observable,
+        interner: Optional[Interner] = None,
+    ):
         super().__init__()
         self._updatable = updatable
         self._deletable = deletable
+        self._interner = Interner() if interner is None else interner
+
+    def start(self, since: Optional[float] = None):
+        """
+        Publishing 을 시작한다.
 
-    def start(self):
-        """Publishing 을 시작한다."""
+        :param since: snapshot 의 watermark, 이 시각 이전에 생성된 item 과 이 시각 이전에 기록된
+            delete 는 이미 반영되어 있으므로 건너뛴다.
+        """
 
         async def implementation():
             def to_context(x: Dict) -> Context:
-                item_id_ = x["item_id"]
+                item_id_ = self._interner.name(self._interner.intern(x["item_id"]))
                 value = -1
                 updated_at = x["created_ts"]
-                return Context(item_id_, value, updated_at)
+                return Context(item_id_, value, updated_at, author_id=x.get("author_id"))
 
-            async for message in clients.kafka.v1.json.consume(
-                topic=clients.configs.settings.item_topic, group_id=str(uuid.uuid4())
-            ):
+            topic = clients.configs.settings.item_topic
+            async for message in consume(topic, since):
                 try:
+                    # delete 에는 item 의 시각이 없으므로 record 가 기록된 시각으로 watermark 와 비교한다.
+                    recorded_at = message.timestamp / 1000
                     message = message.value.decode("utf-8")
                     message = json.loads(message)
                     if message["event"] in ["update", "create"]:
-                        context = to_context(message["item"])
-                        await self._updatable.publish(context)
+                        if since is not None and message["item"]["created_ts"] <= since:
+                            continue
+                        await self._updatable.publish(to_context(message["item"]))
                     elif message["event"] in ["delete", "remove"]:
+                        if since is not None and recorded_at <= since:
+                            continue
                         item_id = message["item_id"]
                         await self._deletable.publish([item_id])
                 except Exception as e:
@@ -63,37 +125,44 @@ class ItemStream(Streamable, abc.ABC):
 
 
 class TraceStream(Streamable, abc.ABC):
-    def __init__(self, updatable: Observable):
+    def __init__(self, updatable: Observable, interner: Optional[Interner] = None):
         super().__init__()
         self._updatable = updatable
+        self._interner = Interner() if interner is None else interner
         self.cache = cachetools.TTLCache(maxsize=200000, ttl=600)
 
-    def start(self):
-        """Publishing 을 시작한다."""
+    def start(self, since: Optional[float] = None):
+        """
+        Publishing 을 시작한다.
+
+        :param since: snapshot 의 watermark, 이 시각 이전의 trace 는 이미 반영되어 있으므로 건너뛴다.
+        """
 
         async def implementation():
             def to_context(x: Dict) -> Context:
-                item_id_ = x["item_id"]
+                item_id_ = self._interner.name(self._interner.intern(x["item_id"]))
                 value = 1 if x["exposed_by"] == "detail" else 0
                 updated_at = x["created_ts"]
-                return Context(item_id_, value, updated_at)
+                return Context(item_id_, value, updated_at, author_id=x.get("author_id"))
 
-            async for message in clients.kafka.v1.json.consume(
-                topic=clients.configs.settings.trace_topic, group_id=str(uuid.uuid4())
-            ):
+            topic = clients.configs.settings.trace_topic
+            async for message in consume(topic, since):
                 try:
                     message = message.value.decode("utf-8")
                     message = json.loads(message)
+                    # 반영되지 않을 trace 로 Interner 의 code 가 늘어나지 않도록 원래 문자열로 거른다.
+                    if since is not None and message["created_ts"] <= since:
+                        continue
                     message_hash = (
-                        message["session_id"] + message["item_id"] + message["exposed_by"]
+                        message["session_id"],
+                        message["item_id"],
+                        message["exposed_by"],
                     )
                     if message_hash in self.cache:
                         continue
 
                     self.cache[message_hash] = True
-
-                    context = to_context(message)
-                    await self._updatable.publish(context)
+                    await self._updatable.publish(to_context(message))
                 except Exception as e:
                     logger.error(e)
                 finally:
@@ -0,0 +1,230 @@
+import math
+
+import numpy as np
+
+from caches import TTL
+from mab import ArmStore, ThompsonMultiArmedBandit
+from mab.store import CHUNK, VIEW_BUFFERS
+
+
+def test_arm_store_put():
+    store = ArmStore(capacity=1)
+    intern = store.interner.intern
+
+    assert store.put(intern("item_1"), 1, 2, 1666180000) == 0
+    assert store.put(intern("item_2"), 3, 4) == 1
+    assert store.put(intern("item_1"), 2, 2, 1666180060) == 0
+
+    assert len(store) == 2
+    assert store.capacity == 2
+    assert store.ids == ["item_1", "item_2"]
+    assert store.alphas.tolist() == [2, 3]
+    assert store.betas.tolist() == [2, 4]
+    assert store.updated_ats[0] == 1666180060
+    assert math.isnan(store.updated_ats[1])
+    assert store.ttls.tolist() == [math.inf, math.inf]
+
+
+def test_arm_store_delete():
+    store = ArmStore()
+    intern = store.interner.intern
+    store.put(intern("item_1"), 1, 1)
+    store.put(intern("item_2"), 2, 2)
+    store.put(intern("item_3"), 3, 3)
+
+    assert store.delete(intern("item_1")) is True
+    assert store.delete(intern("item_1")) is False
+
+    assert intern("item_1") not in store
+    assert len(store) == 2
+    assert store.tombstones == 1
+    assert store.ids == ["item_2", "item_3"]
+    assert store.deleted.tolist() == [True, False, False]
+
+    assert store.compact() == 1
+    assert store.tombstones == 0
+    assert store.ids == ["item_3", "item_2"]
+    assert store.slot(intern("item_3")) == 0
+    assert store.alphas.tolist() == [3, 2]
+    assert not store.deleted.any()
+
+
+def test_arm_store_compact_incrementally():
+    store = ArmStore(capacity=8)
+    intern = store.interner.intern
+    for i in range(8):
+        store.put(intern(f"item_{i}"), i, i)
+    for i in [0, 2, 5, 7]:
+        store.delete(intern(f"item_{i}"))
+
+    # one hole is filled, the tombstones left at the tail are dropped for free
+    assert store.compact(limit=1) == 3
+    assert store.size == 5
+    assert store.compact() == 1
+    assert store.size == 4
+    assert sorted(store.ids) == ["item_1", "item_3", "item_4", "item_6"]
+    for item_id in store.ids:
+        slot = store.slot(intern(item_id))
+        assert store.alphas[slot] == int(item_id[-1])
+
+    # a full store reclaims tombstones before growing
+    for i in range(8, 12):
+        store.put(intern(f"item_{i}"), i, i)
+    store.delete(intern("item_8"))
+    store.put(intern("item_12"), 12, 12)
+    assert store.capacity == 8
+
+
+def test_arm_store_explores():
+    store = ArmStore()
+    intern = store.interner.intern
+    store.put(intern("item_1"), 1, 1, 1666180000)
+    store.put(intern("item_2"), 1, 1, 1666180000 - 60 * 2)
+    store.put(intern("item_3"), 1, 1, 1666180000 - 60 * 10)
+    store.put(intern("item_4"), 1, 1)
+
+    explores = store.explores(1666180000 + 30)
+    assert explores.tolist() == [0.0, 0.4, 1.0, 0.0]
+
+
+def test_multi_armed_bandit_store(multi_armed_bandit: ThompsonMultiArmedBandit):
+    store = multi_armed_bandit.store
+
+    assert len(store) == len(multi_armed_bandit.bandits)
+    for item_id, bandit in multi_armed_bandit.bandits.items():
+        slot = store.slot(store.interner.code(item_id))
+        assert store.alphas[slot] == bandit.alpha
+        assert store.betas[slot] == bandit.beta
+        assert store.updated_ats[slot] == bandit.last_context.updated_at
+
+    multi_armed_bandit.delete(["test_thompson_bandits_1", "test_thompson_bandits_2"])
+    assert len(store) == len(multi_armed_bandit.bandits)
+    assert "test_thompson_bandits_1" not in multi_armed_bandit.bandits
+    assert np.all(store.alphas >= 0)
+
+
+def test_arm_store_explores_cached_per_minute():
+    store = ArmStore()
+    intern = store.interner.intern
+    store.put(intern("item_1"), 1, 1, 1666180000)
+    store.put(intern("item_2"), 1, 1, 1666180000)
+
+    now = 1666180000 // 60 * 60 + 60 * 3
+    assert store.explores(now).tolist() == [0.4, 0.4]
+
+    # same wall-clock minute, only the touched arm is refreshed
+    store.put(intern("item_2"), 1, 2, now)
+    assert store.explores(now + 30).tolist() == [0.4, 0.0]
+
+    # next minute, every arm is refreshed
+    assert store.explores(now + 60).tolist() == [0.6, 0.2]
+
+    store.delete(intern("item_1"))
+    store.compact()
+    assert store.explores(now + 60).tolist() == [0.2]
+
+
+def test_arm_store_available_skips_expired_and_deleted():
+    store = ArmStore()
+    intern = store.interner.intern
+    store.expire(intern("item_1"), 100)
+    for x in range(1, 5):
+        store.put(intern(f"item_{x}"), x, x)
+
+    assert store.ttls.tolist() == [100, math.inf, math.inf, math.inf]
+    assert store.available(50) is None
+    store.delete(intern("item_3"))
+    assert store.available(150).tolist() == [1, 3]
+
+
+def test_multi_armed_bandit_pull_skips_expired(
+    multi_armed_bandit: ThompsonMultiArmedBandit,
+):
+    ttl = TTL(interner=multi_armed_bandit.interner, expire=multi_armed_bandit.expire_many)
+    ttl.update(multi_armed_bandit.bandits.keys())
+    ttl.update("test_thompson_bandits_1", -1)
+
+    item_ids = [x.item_id for x in multi_armed_bandit.pull()]
+    assert "test_thompson_bandits_1" not in item_ids
+    assert len(item_ids) == len(multi_armed_bandit.bandits) - 1
+    assert len(multi_armed_bandit.pull(k=100)) == len(item_ids)
+
+    ttl.delete("test_thompson_bandits_1")
+    assert len(multi_armed_bandit.pull()) == len(multi_armed_bandit.bandits)
+
+
+def test_arm_store_view_is_immutable_snapshot():
+    store = ArmStore()
+    intern = store.interner.intern
+    store.put(intern("item_1"), 1, 2, 1666180000)
+    store.put(intern("item_2"), 3, 4, 1666180000)
+
+    view = store.view(1666180000)
+    assert store.view(1666180000) is view
+    assert view.alphas.tolist() == [1, 3]
+    assert not view.alphas.flags.writeable
+
+    store.put(intern("item_1"), 5, 5, 1666180060)
+    store.delete(intern("item_2"))
+    store.compact()
+
+    assert view.alphas.tolist() == [1, 3]
+    assert view.available(1666180000) is None
+    assert view.names(np.arange(2)) == ["item_1", "item_2"]
+    assert view.slot(intern("item_2")) == 1
+    assert view.explores(1666180000 + 120).tolist() == [0.4, 0.4]
+
+    latest = store.view(1666180060)
+    assert latest.version == store.version > view.version
+    assert latest.alphas.tolist() == [5]
+    assert intern("item_2") not in latest
+
+
+def test_arm_store_view_copies_changed_chunks_only():
+    store = ArmStore(capacity=4 * CHUNK)
+    keys = store.interner.intern_many([f"item_{x}" for x in range(3 * CHUNK)])
+    for key in keys.tolist():
+        store.put(key, 1, 1, 1666180000)
+    store.view(1666180000).release()
+    held = store.view(1666180000)
+    view = held
+
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        for key in rng.choice(keys, 10).tolist():
+            if rng.random() < 0.2:
+                store.delete(key)
+            else:
+                store.put(key, rng.integers(10), rng.integers(10), 1666180000)
+        store.compact(3)
+        previous, view = view, store.view(1666180000)
+        if previous is not held:
+            previous.release()
+
+        # a buffer whose views are all released is brought up to date chunk by chunk
+        assert view.keys.tolist() == store.keys.tolist()
+        assert view.alphas.tolist() == store.alphas.tolist()
+        assert view.slots(keys).tolist() == store.slots(keys).tolist()
+        assert len(store._buffers) <= VIEW_BUFFERS
+
+    # a view still leased is never reused
+    assert held.alphas.tolist() == [1] * 3 * CHUNK
+
+
+def test_arm_store_view_lease():
+    store = ArmStore()
+    store.put(store.interner.intern("item_1"), 1, 2, 1666180000)
+
+    view = store.view(1666180000)
+    assert store.view(1666180000) is view
+    assert view.leases == 2
+    assert view.lease()
+    for _ in range(3):
+        view.release()
+
+    # once every lease is released the buffer may be reused, so the view is never leased again
+    assert not view.lease()
+    latest = store.view(1666180000)
+    assert latest is not view
+    assert latest.version == view.version
+    assert latest.alphas.tolist() == [1]
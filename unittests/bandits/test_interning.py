@@ -0,0 +1,89 @@
+import numpy as np
+
+from caches import TTL
+from mab import Context, ThompsonMultiArmedBandit
+from mab.interning import Interner
+
+
+def test_interner():
+    interner = Interner()
+
+    assert interner.intern("item_1") == 0
+    assert interner.intern("item_2") == 1
+    assert interner.intern("item_1") == 0
+
+    assert interner.code("item_3") is None
+    assert interner.codes(["item_2", "item_3", "item_1"]).tolist() == [1, -1, 0]
+    assert interner.names([1, 0]) == ["item_2", "item_1"]
+    assert len(interner) == 2
+
+
+def test_interner_shared_across_engine():
+    interner = Interner()
+    ttl = TTL(interner=interner)
+    multi_armed_bandit = ThompsonMultiArmedBandit(interner=interner)
+
+    item_id = "".join(["item", "_1"])
+    multi_armed_bandit.update(Context(item_id=item_id, value=0, updated_at=1666180000))
+    ttl.update("item_1", 100)
+
+    assert len(interner) == 1
+    assert multi_armed_bandit.bandits["item_1"].item_id is item_id
+    assert ttl.items() == [("item_1", 100)]
+
+    multi_armed_bandit.delete("item_1")
+    assert "item_1" not in multi_armed_bandit.bandits
+    assert multi_armed_bandit.interner.code("item_1") == 0
+
+
+def test_interner_release_reuses_codes():
+    interner = Interner()
+    interner.intern_many(["item_1", "item_2"])
+
+    interner.release([0, 0])
+    assert interner.code("item_1") is None
+    assert "item_1" not in interner
+    assert interner.intern("item_3") == 0
+    assert interner.names([0, 1]) == ["item_3", "item_2"]
+    assert len(interner) == 2
+
+
+def test_compact_releases_deleted_codes():
+    interner = Interner()
+    multi_armed_bandit = ThompsonMultiArmedBandit(interner=interner)
+    for item_id in ["item_1", "item_2", "item_3"]:
+        multi_armed_bandit.update(
+            Context(item_id=item_id, value=0, updated_at=1666180000)
+        )
+
+    multi_armed_bandit.delete(["item_1", "item_2"])
+    multi_armed_bandit.update(Context(item_id="item_2", value=1, updated_at=1666180001))
+    multi_armed_bandit.compact()
+
+    assert interner.code("item_1") is None
+    assert interner.code("item_2") == 1
+    multi_armed_bandit.update(Context(item_id="item_4", value=0, updated_at=1666180002))
+    assert interner.code("item_4") == 0
+    assert len(interner) == 3
+    assert sorted(multi_armed_bandit.store.ids) == ["item_2", "item_3", "item_4"]
+
+
+def test_compact_keeps_codes_of_leased_views():
+    interner = Interner()
+    multi_armed_bandit = ThompsonMultiArmedBandit(interner=interner)
+    for item_id in ["item_1", "item_2"]:
+        multi_armed_bandit.update(
+            Context(item_id=item_id, value=0, updated_at=1666180000)
+        )
+
+    view = multi_armed_bandit.view
+    multi_armed_bandit.delete("item_1")
+    multi_armed_bandit.compact()
+
+    # a reader of a view published before the delete still resolves the old code
+    assert interner.code("item_1") == 0
+    assert view.names(np.arange(view.size)) == ["item_1", "item_2"]
+
+    view.release()
+    multi_armed_bandit.compact()
+    assert interner.code("item_1") is None
@@ -0,0 +1,86 @@
+import pytest
+
+from mab import Context, ThompsonMultiArmedBandit
+from mab import journal
+from mab.journal import DELETE, UPDATE, Journal
+
+
+def test_journal_replay(tmp_path):
+    journal = Journal(tmp_path)
+    journal.update(Context(item_id="item_1", value=1, updated_at=1666180000))
+    journal.update(Context("item_2", 0, 1666180001, author_id="author"))
+    journal.update(Context("item_3", 1, 1666180002, author_id="author", count=7))
+    journal.delete("item_1")
+    journal.close()
+
+    journal = Journal(tmp_path)
+    assert list(journal.replay()) == [
+        (UPDATE, Context(item_id="item_1", value=1, updated_at=1666180000)),
+        (UPDATE, Context("item_2", 0, 1666180001, author_id="author")),
+        (UPDATE, Context("item_3", 1, 1666180002, author_id="author", count=7)),
+        (DELETE, "item_1"),
+    ]
+    journal.close()
+
+
+def test_journal_ignores_torn_record(tmp_path):
+    journal = Journal(tmp_path)
+    journal.update(Context(item_id="item_1", value=1, updated_at=1666180000))
+    journal.update(Context(item_id="item_2", value=1, updated_at=1666180001))
+    journal.close()
+
+    (path,) = tmp_path.glob("*.wal")
+    path.write_bytes(path.read_bytes()[:-3])
+
+    journal = Journal(tmp_path)
+    assert [x.item_id for _, x in journal.replay()] == ["item_1"]
+    journal.close()
+
+
+def test_multi_armed_bandit_recovers_from_journal(
+    multi_armed_bandit: ThompsonMultiArmedBandit, tmp_path
+):
+    journal = Journal(tmp_path / "journal")
+    primary = ThompsonMultiArmedBandit(journal=journal)
+    for bandit in multi_armed_bandit.bandits.values():
+        primary.update_many(bandit.contexts)
+    primary.snapshot(tmp_path / "snapshot")
+    assert journal.segments() == [journal.segment]
+
+    primary.update(Context(item_id="item_new", value=1, updated_at=1666180000))
+    primary.delete("test_thompson_bandits_1")
+    primary.close()
+
+    recovered = ThompsonMultiArmedBandit(journal=Journal(tmp_path / "journal"))
+    assert recovered.restore(tmp_path / "snapshot") is not None
+    assert sorted(recovered.bandits.keys()) == sorted(primary.bandits.keys())
+    for item_id, bandit in primary.bandits.items():
+        assert recovered.bandits[item_id] == bandit
+    recovered.close()
+
+
+def test_journal_build_requires_snapshot_directory(tmp_path):
+    assert journal.build("") is None
+    with pytest.raises(ValueError):
+        journal.build(str(tmp_path / "journal"))
+
+    built = journal.build(str(tmp_path / "journal"), snapshot_directory=str(tmp_path))
+    assert isinstance(built, Journal)
+    built.close()
+
+
+def test_multi_armed_bandit_journals_float_values_before_applying(tmp_path):
+    multi_armed_bandit = ThompsonMultiArmedBandit(journal=Journal(tmp_path))
+    # gRPC delivers value as a float
+    multi_armed_bandit.update_many([Context("item_1", 1.0, 1666180000)])
+
+    with pytest.raises(Exception):
+        multi_armed_bandit.update_many(
+            [Context("item_2", 1, 1666180001), Context("item_3", 1, None)]
+        )
+    assert sorted(multi_armed_bandit.bandits.keys()) == ["item_1"]
+    multi_armed_bandit.close()
+
+    journal = Journal(tmp_path)
+    assert list(journal.replay()) == [(UPDATE, Context("item_1", 1, 1666180000))]
+    journal.close()
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from mab import ThompsonMultiArmedBandit
+from mab import kernels
+from mab import rng
+
+
+def test_approximate_kernel_is_exact_below_threshold():
+    alphas = np.array([1.0, 10.0, 999.0])
+    betas = np.array([2.0, 2000.0, 5000.0])
+
+    np.random.seed(0)
+    expected = kernels.exact(rng.LegacyEngine(), alphas, betas)
+
+    np.random.seed(0)
+    samples = kernels.approximate(rng.LegacyEngine(), alphas, betas, threshold=1000)
+
+    assert samples.tolist() == expected.tolist()
+
+
+def test_approximate_kernel_is_exact_for_skewed_arms():
+    # both counts are large, but the means are too close to 0 for a normal to fit
+    alphas = np.array([1000.0, 300.0])
+    betas = np.array([20000.0, 700.0])
+
+    np.random.seed(0)
+    expected = kernels.exact(rng.LegacyEngine(), alphas, betas)
+
+    np.random.seed(0)
+    samples = kernels.approximate(rng.LegacyEngine(), alphas, betas, threshold=100)
+
+    assert samples.tolist() == expected.tolist()
+
+
+def test_approximate_kernel_matches_moments():
+    engine = rng.build("pcg64", seed=0)
+    alpha, beta = 2000.0, 30000.0
+    alphas = np.full(200000, alpha)
+    betas = np.full(200000, beta)
+
+    samples = kernels.approximate(engine, alphas, betas, threshold=1000)
+
+    total = alpha + beta
+    mean = alpha / total
+    std = np.sqrt(alpha * beta / (total * total * (total + 1)))
+    assert samples.mean() == pytest.approx(mean, rel=1e-3)
+    assert samples.std() == pytest.approx(std, rel=1e-2)
+    assert np.all((0 <= samples) & (samples <= 1))
+
+
+def test_multi_armed_bandit_kernel(multi_armed_bandit: ThompsonMultiArmedBandit):
+    with pytest.raises(ValueError):
+        ThompsonMultiArmedBandit(kernel="unknown")
+
+    predictions = multi_armed_bandit.pull(kernel="approximate")
+    assert len(predictions) == len(multi_armed_bandit.bandits)
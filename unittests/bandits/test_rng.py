@@ -0,0 +1,55 @@
+import concurrent.futures
+
+import numpy as np
+from pytest_mock import MockerFixture
+
+from mab import ThompsonMultiArmedBandit
+from mab import rng
+
+
+def test_legacy_engine_follows_global_seed():
+    engine = rng.build("legacy", seed=0)
+    values = engine.beta([1, 2], [3, 4])
+
+    np.random.seed(0)
+    assert values.tolist() == np.random.beta([1, 2], [3, 4]).tolist()
+
+
+def test_generator_engine_is_reproducible():
+    a = rng.build("pcg64", seed=42)
+    b = rng.build("pcg64", seed=42)
+    assert a.beta(2, 3, size=5).tolist() == b.beta(2, 3, size=5).tolist()
+
+    c = rng.build("philox", seed=42)
+    assert c.random(5).shape == (5,)
+
+
+def test_generator_engine_streams_per_thread():
+    engine = rng.GeneratorEngine(seed=42)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(engine.random, 4) for _ in range(2)]
+        first, second = [x.result().tolist() for x in futures]
+
+    assert first != second
+
+
+def test_buffered_engine():
+    engine = rng.build("pcg64", seed=42, buffer_size=16)
+
+    assert 0 <= engine.random() < 1
+    assert engine.random((2, 3)).shape == (2, 3)
+    assert engine.standard_normal(100).shape == (100,)
+    assert len({engine.random() for _ in range(64)}) == 64
+
+
+def test_multi_armed_bandit_with_engine(
+    mocker: MockerFixture, multi_armed_bandit: ThompsonMultiArmedBandit
+):
+    mocker.patch("time.time", return_value=1666180000 + 130)
+    bandits = multi_armed_bandit.bandits.values()
+
+    a = ThompsonMultiArmedBandit(bandits=bandits, rng=rng.build("pcg64", seed=0))
+    b = ThompsonMultiArmedBandit(bandits=bandits, rng=rng.build("pcg64", seed=0))
+
+    assert a.pull() == b.pull()
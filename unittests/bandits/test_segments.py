@@ -0,0 +1,123 @@
+import numpy as np
+import pytest
+
+from mab import Context, ThompsonMultiArmedBandit
+from mab.rng import build
+
+
+def test_segment_store_aggregates_segments():
+    multi_armed_bandit = ThompsonMultiArmedBandit(segmented=True)
+    multi_armed_bandit.update_many(
+        [
+            Context("item_1", 1, 1666180000, author_id="a"),
+            Context("item_1", 0, 1666180001, author_id="b"),
+            Context("item_1", 0, 1666180002, author_id="b"),
+            Context("item_2", 0, 1666180003, author_id="b"),
+            Context("item_3", 0, 1666180004),
+        ]
+    )
+    segments = multi_armed_bandit.segments
+    size = len(multi_armed_bandit.interner)
+
+    alphas, betas, updated_ats, present = segments.aggregate(["b"], size)
+    assert alphas.tolist() == [0, 0, 0]
+    assert betas.tolist() == [2, 1, 0]
+    assert present.tolist() == [True, True, False]
+
+    alphas, betas, updated_ats, present = segments.aggregate(None, size)
+    assert alphas.tolist() == [1, 0, 0]
+    assert betas.tolist() == [2, 1, 0]
+    assert updated_ats[:2].tolist() == [1666180002, 1666180003]
+    assert np.isnan(updated_ats[2])
+
+
+def test_segment_view_keeps_its_pair_tables():
+    multi_armed_bandit = ThompsonMultiArmedBandit(segmented=True)
+    multi_armed_bandit.update(Context("item_1", 1, 1666180000, author_id="a"))
+    segments = multi_armed_bandit.segments
+    view = segments.view()
+
+    # pairs registered or reset after the view was taken do not change what it reads
+    segments.reset()
+    multi_armed_bandit.update(Context("item_2", 0, 1666180001, author_id="b"))
+    multi_armed_bandit.update(Context("item_1", 0, 1666180002, author_id="a"))
+
+    alphas, betas, _, present = view.aggregate(["a"], 2)
+    assert alphas.tolist() == [1, 0]
+    assert betas.tolist() == [0, 0]
+    assert present.tolist() == [True, False]
+    view.release()
+
+
+def test_multi_armed_bandit_pull_segments():
+    multi_armed_bandit = ThompsonMultiArmedBandit(
+        rng=build("pcg64", seed=0), segmented=True
+    )
+    for x in range(100):
+        multi_armed_bandit.update(Context("item_1", x % 2, x, author_id="a"))
+        multi_armed_bandit.update(Context("item_2", 0, x, author_id="b"))
+
+    predictions = multi_armed_bandit.pull(explorable=False, segments=["a"])
+    assert [(x.item_id, x.alpha, x.beta) for x in predictions] == [("item_1", 50, 0)]
+
+    predictions = multi_armed_bandit.pull(explorable=False, k=1, segments=["a", "b"])
+    assert predictions[0].item_id == "item_1"
+
+    predictions = multi_armed_bandit.pull(
+        explorable=False, item_ids=["item_2", "item_x"], segments=["b"]
+    )
+    assert [(x.item_id, x.beta) for x in predictions] == [("item_2", 100), ("item_x", 0)]
+
+    multi_armed_bandit.delete("item_2")
+    assert multi_armed_bandit.pull(segments=["b"]) == []
+    assert multi_armed_bandit.compact() == 2
+
+    with pytest.raises(ValueError):
+        ThompsonMultiArmedBandit().pull(segments=["a"])
+
+
+def test_multi_armed_bandit_pull_segments_skips_expired_items():
+    multi_armed_bandit = ThompsonMultiArmedBandit(
+        rng=build("pcg64", seed=0), segmented=True
+    )
+    for item_id in ["item_1", "item_2"]:
+        multi_armed_bandit.update(Context(item_id, 0, 1666180000, author_id="a"))
+    multi_armed_bandit.expire("item_2", 0)
+
+    predictions = multi_armed_bandit.pull(explorable=False, segments=["a"])
+    assert [x.item_id for x in predictions] == ["item_1"]
+
+    # sampling requested items is not filtered, like pull without segments
+    predictions = multi_armed_bandit.pull(
+        explorable=True, item_ids=["item_2", "item_x"], segments=["a"]
+    )
+    assert [(x.item_id, x.beta) for x in predictions] == [("item_2", 1), ("item_x", 0)]
+
+
+def test_multi_armed_bandit_snapshot_restores_segments(tmp_path):
+    multi_armed_bandit = ThompsonMultiArmedBandit(segmented=True)
+    multi_armed_bandit.update_many(
+        [
+            Context("item_1", 1, 1666180000, author_id="a"),
+            Context("item_1", 0, 1666180001, author_id="b"),
+            Context("item_2", 0, 1666180002, author_id="b"),
+        ]
+    )
+    multi_armed_bandit.snapshot(tmp_path)
+    # the second snapshot copies clean windows from the first one
+    multi_armed_bandit.update(Context("item_2", 1, 1666180003, author_id="a"))
+    multi_armed_bandit.snapshot(tmp_path)
+
+    restored = ThompsonMultiArmedBandit(segmented=True)
+    restored.restore(tmp_path)
+    size = len(restored.interner)
+    alphas, betas, _, present = restored.segments.aggregate(["b"], size)
+    items = restored.interner.names(np.flatnonzero(present))
+    assert sorted(zip(items, betas[present].tolist())) == [("item_1", 1), ("item_2", 1)]
+
+    # windows restored from the snapshot keep counting
+    restored.update(Context("item_1", 1, 1666180004, author_id="a"))
+    predictions = restored.pull(explorable=False, item_ids=["item_1"], segments=["a"])
+    assert [(x.alpha, x.beta) for x in predictions] == [(2, 0)]
+    predictions = restored.pull(explorable=False, item_ids=["item_2"], segments=["a"])
+    assert [(x.alpha, x.beta) for x in predictions] == [(1, 0)]
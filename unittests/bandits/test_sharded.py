@@ -0,0 +1,78 @@
+import pytest
+
+from mab import Context, ThompsonMultiArmedBandit
+from mab import rng
+from mab.sharded import ShardedSampler
+from mab.store import ArmStore
+
+
+@pytest.fixture
+def sharded_multi_armed_bandit() -> ThompsonMultiArmedBandit:
+    mab = ThompsonMultiArmedBandit(processes=2, sharding_threshold=1)
+    for i in range(100):
+        # the larger i, the higher the click ratio, with very narrow distributions
+        key = mab.interner.intern(f"item_{i}")
+        mab.store.put(key, alpha=1000 * i, beta=1000 * (100 - i), updated_at=0)
+    mab.publish()
+    yield mab
+    mab.close()
+
+
+def test_sharded_pull(sharded_multi_armed_bandit: ThompsonMultiArmedBandit):
+    predictions = sharded_multi_armed_bandit.pull(explorable=False, k=5)
+
+    assert [x.item_id for x in predictions] == [f"item_{i}" for i in range(99, 94, -1)]
+    assert [x.alpha for x in predictions] == [99000, 98000, 97000, 96000, 95000]
+
+    predictions = sharded_multi_armed_bandit.pull(explorable=True)
+    assert len(predictions) == 100
+
+    sharded_multi_armed_bandit.store.delete(
+        sharded_multi_armed_bandit.interner.code("item_99")
+    )
+    sharded_multi_armed_bandit.publish()
+    predictions = sharded_multi_armed_bandit.pull(explorable=False, k=5)
+    assert [x.item_id for x in predictions] == [f"item_{i}" for i in range(98, 93, -1)]
+
+    sharded_multi_armed_bandit.expire("item_98", -1)
+    predictions = sharded_multi_armed_bandit.pull(explorable=False, k=5)
+    assert [x.item_id for x in predictions] == [f"item_{i}" for i in range(97, 92, -1)]
+
+
+def test_sharded_pull_after_store_grows():
+    mab = ThompsonMultiArmedBandit(processes=2, sharding_threshold=1)
+    try:
+        mab.update(Context(item_id="item_0", value=1, updated_at=0))
+        assert len(mab.pull(explorable=False)) == 1
+
+        for i in range(1, 3000):
+            mab.update(Context(item_id=f"item_{i}", value=0, updated_at=0))
+        assert mab.store.capacity > 1024
+        assert len(mab.pull(explorable=False)) == 3000
+    finally:
+        mab.close()
+
+
+def test_sharded_sampler_requires_shared_store():
+    sampler = ShardedSampler(processes=1)
+    try:
+        with pytest.raises(ValueError):
+            sampler.pull(ArmStore().view())
+    finally:
+        sampler.close()
+
+
+def test_sharded_pull_is_reproducible_with_seeded_rng():
+    def pull(seed: int) -> list:
+        mab = ThompsonMultiArmedBandit(
+            rng=rng.build("pcg64", seed=seed), processes=2, sharding_threshold=1
+        )
+        try:
+            for i in range(100):
+                mab.update(Context(item_id=f"item_{i}", value=i % 2, updated_at=0))
+            return mab.pull(explorable=False).scores.tolist()
+        finally:
+            mab.close()
+
+    assert pull(0) == pull(0)
+    assert pull(0) != pull(1)
@@ -0,0 +1,122 @@
+import numpy as np
+
+from mab import Context, ThompsonMultiArmedBandit
+from mab import windows
+from mab.windows import CountWindow
+
+
+def test_count_window_export_restore():
+    window = CountWindow(item_id="item", pool_size=4)
+    for x, value in enumerate([0, 0, 1, 0, 0, 0, 1, 0]):
+        window.append(Context(item_id="item", value=value, updated_at=1666180000 + x))
+
+    restored = windows.restore("item", *window.export())
+
+    assert list(restored) == list(window)
+    assert restored.alpha == window.alpha
+    assert restored.beta == window.beta
+
+    c = Context(item_id="item", value=1, updated_at=1666180010)
+    window.append(c)
+    restored.append(c)
+    assert list(restored) == list(window)
+
+
+def test_multi_armed_bandit_snapshot_restore(
+    multi_armed_bandit: ThompsonMultiArmedBandit, tmp_path
+):
+    multi_armed_bandit.update(Context(item_id="item_new", value=-1, updated_at=0))
+    path = multi_armed_bandit.snapshot(tmp_path)
+    assert (tmp_path / "CURRENT").read_text() == path.name
+
+    restored = ThompsonMultiArmedBandit()
+    watermark = restored.restore(tmp_path)
+
+    store, expected = restored.store, multi_armed_bandit.store
+    assert watermark == np.nanmax(expected.updated_ats)
+    assert store.ids == expected.ids
+    assert store.alphas.tolist() == expected.alphas.tolist()
+    assert store.betas.tolist() == expected.betas.tolist()
+
+    # windows are read from the snapshot on access, reading does not hydrate them
+    assert not restored._bandits
+    for item_id, bandit in multi_armed_bandit.bandits.items():
+        assert restored.bandits[item_id] == bandit
+        assert list(restored.bandits[item_id].contexts) == list(bandit.contexts)
+    assert not restored._bandits
+
+
+def test_multi_armed_bandit_snapshot_keeps_unhydrated_arms(
+    multi_armed_bandit: ThompsonMultiArmedBandit, tmp_path
+):
+    multi_armed_bandit.snapshot(tmp_path / "first")
+
+    restored = ThompsonMultiArmedBandit()
+    restored.restore(tmp_path / "first")
+    item_id = restored.store.ids[0]
+    updated_at = restored.bandits[item_id].last_context.updated_at + 60
+    restored.update(Context(item_id=item_id, value=1, updated_at=updated_at))
+    restored.snapshot(tmp_path / "second")
+
+    again = ThompsonMultiArmedBandit()
+    assert again.restore(tmp_path / "second") == max(
+        updated_at, np.nanmax(multi_armed_bandit.store.updated_ats)
+    )
+    for key, bandit in multi_armed_bandit.bandits.items():
+        if key != item_id:
+            assert again.bandits[key] == bandit
+    assert again.bandits[item_id].alpha == multi_armed_bandit.bandits[item_id].alpha + 1
+
+    assert ThompsonMultiArmedBandit().restore(tmp_path / "missing") is None
+
+
+def test_decayed_multi_armed_bandit_snapshot_restore(tmp_path):
+    multi_armed_bandit = ThompsonMultiArmedBandit(window="decayed", half_life=60)
+    for x, value in enumerate([0, 0, 1, 0, 1]):
+        c = Context(item_id=f"item_{x % 2}", value=value, updated_at=1666180000 + x * 30)
+        multi_armed_bandit.update(c)
+    multi_armed_bandit.snapshot(tmp_path)
+
+    restored = ThompsonMultiArmedBandit(window="decayed", half_life=60)
+    restored.restore(tmp_path)
+    for item_id, bandit in multi_armed_bandit.bandits.items():
+        assert restored.bandits[item_id].alpha == bandit.alpha
+        assert restored.bandits[item_id].beta == bandit.beta
+        assert restored.bandits[item_id].pool_size is None
+
+
+def test_multi_armed_bandit_snapshot_exports_only_dirty_windows(
+    multi_armed_bandit: ThompsonMultiArmedBandit, tmp_path
+):
+    multi_armed_bandit.snapshot(tmp_path)
+    assert not multi_armed_bandit._dirty
+
+    item_id = multi_armed_bandit.store.ids[0]
+    updated_at = multi_armed_bandit.bandits[item_id].last_context.updated_at + 60
+    multi_armed_bandit.update(Context(item_id=item_id, value=1, updated_at=updated_at))
+    assert len(multi_armed_bandit._dirty) == 1
+    multi_armed_bandit.snapshot(tmp_path)
+
+    restored = ThompsonMultiArmedBandit()
+    restored.restore(tmp_path)
+    for key, bandit in multi_armed_bandit.bandits.items():
+        assert restored.bandits[key] == bandit
+        assert list(restored.bandits[key].contexts) == list(bandit.contexts)
+
+
+def test_multi_armed_bandit_delete_does_not_hydrate_windows(
+    multi_armed_bandit: ThompsonMultiArmedBandit, tmp_path, mocker
+):
+    multi_armed_bandit.snapshot(tmp_path)
+    restored = ThompsonMultiArmedBandit()
+    restored.restore(tmp_path)
+    window = mocker.spy(restored._snapshot, "window")
+
+    item_id = restored.store.ids[0]
+    deleted = restored.delete([item_id, "NOT_EXISTING_ID"])
+
+    window.assert_not_called()
+    assert deleted[0].item_id == item_id
+    assert deleted[1] is None
+    assert item_id not in restored.store.ids
+    assert not restored._bandits
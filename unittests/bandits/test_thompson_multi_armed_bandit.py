@@ -1,3 +1,4 @@
+import time
 import numpy as np
 from pytest_mock import MockerFixture
 
@@ -5,6 +6,7 @@ from mab import Context
 from mab import ThompsonMultiArmedBandit
 from mab.thomson import Observation
 from mab.thomson import Prediction
+from mab.thomson import PredictionBatch
 
 
 def test_multi_armed_bandit_create(multi_armed_bandit: ThompsonMultiArmedBandit):
@@ -213,3 +215,181 @@ def test_multi_armed_bandit_observations(
         Observation(item_id="test_thompson_bandits_9", alpha=3, beta=1),
         Observation(item_id="test_thompson_bandits_10", alpha=1, beta=4),
     ]
+
+
+def test_multi_armed_bandit_pull_top_k(
+    mocker: MockerFixture, multi_armed_bandit: ThompsonMultiArmedBandit
+):
+    mocker.patch("time.time", return_value=1666180000 + 130)
+
+    np.random.seed(0)
+    predictions = multi_armed_bandit.pull()
+
+    np.random.seed(0)
+    assert multi_armed_bandit.pull(k=3) == predictions[:3]
+
+    np.random.seed(0)
+    assert multi_armed_bandit.pull(k=100) == predictions
+
+    np.random.seed(0)
+    assert multi_armed_bandit.pull(k=0) == []
+
+
+def test_multi_armed_bandit_pull_returns_columns(
+    multi_armed_bandit: ThompsonMultiArmedBandit,
+):
+    predictions = multi_armed_bandit.pull(explorable=False, k=3)
+
+    assert isinstance(predictions, PredictionBatch)
+    assert predictions.alphas.dtype == np.int64
+    assert list(predictions.rows()) == [
+        (x.item_id, x.score, x.alpha, x.beta) for x in predictions
+    ]
+    assert predictions[-1] == list(predictions)[-1]
+    assert isinstance(predictions[1:], PredictionBatch)
+
+
+def test_multi_armed_bandit_update_many(
+    multi_armed_bandit: ThompsonMultiArmedBandit,
+):
+    contexts = [
+        Context(item_id="test_thompson_bandits_1", value=1, updated_at=1666180000 + 180),
+        Context(item_id="test_thompson_bandits_5", value=1, updated_at=1666180000 + 180),
+        Context(item_id="test_thompson_bandits_11", value=-1, updated_at=1666180000),
+        Context(item_id="test_thompson_bandits_5", value=0, updated_at=1666180000 + 190),
+        Context(item_id="test_thompson_bandits_11", value=0, updated_at=1666180000 + 200),
+    ]
+
+    multi_armed_bandit.update_many(contexts)
+
+    assert multi_armed_bandit.bandits["test_thompson_bandits_1"].alpha == 2
+    assert multi_armed_bandit.bandits["test_thompson_bandits_1"].beta == 1
+
+    assert multi_armed_bandit.bandits["test_thompson_bandits_5"].alpha == 2
+    assert multi_armed_bandit.bandits["test_thompson_bandits_5"].beta == 4
+
+    assert multi_armed_bandit.bandits["test_thompson_bandits_11"].alpha == 0
+    assert multi_armed_bandit.bandits["test_thompson_bandits_11"].beta == 1
+    assert multi_armed_bandit.bandits["test_thompson_bandits_11"].created_at == 1666180000
+
+    store = multi_armed_bandit.store
+    slot = store.slot(store.interner.code("test_thompson_bandits_5"))
+    assert (store.alphas[slot], store.betas[slot]) == (2, 4)
+    assert store.updated_ats[slot] == 1666180000 + 190
+
+
+def test_multi_armed_bandit_pull_item_ids(
+    mocker: MockerFixture, multi_armed_bandit: ThompsonMultiArmedBandit
+):
+    mocker.patch("time.time", return_value=1666180000 + 130)
+    np.random.seed(0)
+
+    item_ids = ["test_thompson_bandits_7", "NOT_EXISTING_ID", "test_thompson_bandits_4"]
+    predictions = multi_armed_bandit.pull(item_ids=item_ids)
+
+    assert [x.item_id for x in predictions] == item_ids
+    assert [(x.alpha, x.beta) for x in predictions] == [(4, 3), (0, 0), (0, 5)]
+    assert all(0 <= x.score <= 1 for x in predictions)
+
+    assert multi_armed_bandit.pull(item_ids=[]) == []
+    assert ThompsonMultiArmedBandit().pull(item_ids=["NOT_EXISTING_ID"])[0].alpha == 0
+
+    # unknown items are Beta(1, 1), drawn as a plain uniform
+    np.random.seed(0)
+    score = multi_armed_bandit.pull(item_ids=["NOT_EXISTING_ID"])[0].score
+    assert score == np.float64(np.random.RandomState(0).random_sample())
+
+
+def test_multi_armed_bandit_pull_skips_deleted(
+    multi_armed_bandit: ThompsonMultiArmedBandit,
+):
+    deleted = ["test_thompson_bandits_1", "test_thompson_bandits_5"]
+    multi_armed_bandit.delete(deleted)
+    assert multi_armed_bandit.store.tombstones == 2
+
+    item_ids = [x.item_id for x in multi_armed_bandit.pull()]
+    assert len(item_ids) == len(multi_armed_bandit.bandits)
+    assert not set(deleted) & set(item_ids)
+
+    assert multi_armed_bandit.compact() == 2
+    item_ids = [x.item_id for x in multi_armed_bandit.pull()]
+    assert sorted(item_ids) == sorted(multi_armed_bandit.bandits.keys())
+
+
+def test_multi_armed_bandit_reads_published_view():
+    multi_armed_bandit = ThompsonMultiArmedBandit(publish_interval=60)
+    multi_armed_bandit.update(Context(item_id="item_1", value=1, updated_at=1666180000))
+    view = multi_armed_bandit.view
+
+    # within publish_interval the change stays pending
+    assert len(multi_armed_bandit.pull()) == 0
+    assert multi_armed_bandit.get("item_1") is None
+    assert multi_armed_bandit.publish_delay() > 0
+    assert multi_armed_bandit.publish(force=False) is False
+
+    assert multi_armed_bandit.publish() is True
+    assert multi_armed_bandit.view is not view
+    assert [x.item_id for x in multi_armed_bandit.pull()] == ["item_1"]
+
+    prediction = multi_armed_bandit.get("item_1", explorable=False)
+    assert (prediction.item_id, prediction.alpha, prediction.beta) == ("item_1", 2, 1)
+
+
+def test_decayed_multi_armed_bandit_pull_decays_to_now(mocker: MockerFixture):
+    multi_armed_bandit = ThompsonMultiArmedBandit(window="decayed", half_life=60)
+    multi_armed_bandit.update(
+        Context(item_id="item_1", value=0, updated_at=1666180000, count=12)
+    )
+    multi_armed_bandit.update(
+        Context(item_id="item_1", value=1, updated_at=1666180000, count=4)
+    )
+
+    mocker.patch("time.time", return_value=1666180000 + 60)
+    (prediction,) = multi_armed_bandit.pull(explorable=False)
+    assert (prediction.alpha, prediction.beta) == (2, 4)
+    (prediction,) = multi_armed_bandit.pull(explorable=False, item_ids=["item_1"])
+    assert (prediction.alpha, prediction.beta) == (2, 4)
+    # get returns the Beta parameters, alpha + 1 and beta + 1
+    prediction = multi_armed_bandit.get("item_1", explorable=False)
+    assert (prediction.alpha, prediction.beta) == (3, 5)
+
+    # the window itself only decays when a new context arrives
+    assert multi_armed_bandit.bandits["item_1"].alpha == 4
+
+
+def test_bucket_multi_armed_bandit_advance(tmp_path):
+    multi_armed_bandit = ThompsonMultiArmedBandit(
+        window="bucket", buckets=3, bucket_seconds=10
+    )
+    multi_armed_bandit.update(Context(item_id="item_1", value=0, updated_at=5))
+    multi_armed_bandit.update(Context(item_id="item_1", value=0, updated_at=25))
+    multi_armed_bandit.update(Context(item_id="item_2", value=0, updated_at=25))
+    multi_armed_bandit.snapshot(tmp_path)
+
+    assert multi_armed_bandit.advance(now=29) == 0
+    assert multi_armed_bandit.advance(now=30) == 1
+    assert multi_armed_bandit.store.betas.tolist() == [1, 1]
+
+    # arms restored from a snapshot are advanced without a new context too
+    restored = ThompsonMultiArmedBandit(window="bucket", buckets=3, bucket_seconds=10)
+    restored.restore(tmp_path)
+    assert restored.advance(now=30) == 2
+    assert restored.store.betas.tolist() == [1, 1]
+    assert restored.advance(now=60) == 2
+    assert restored.store.betas.tolist() == [0, 0]
+    assert restored.advance(now=1000) == 0
+
+
+def test_multi_armed_bandit_pull_does_not_wait_for_writer():
+    multi_armed_bandit = ThompsonMultiArmedBandit(publish_interval=0.01)
+    multi_armed_bandit.update(Context(item_id="item_1", value=1, updated_at=0))
+    multi_armed_bandit.publish()
+    multi_armed_bandit.update(Context(item_id="item_2", value=1, updated_at=0))
+    time.sleep(0.02)
+
+    # a writer holds the lock: the reader keeps the published view
+    with multi_armed_bandit._lock:
+        assert [x.item_id for x in multi_armed_bandit.pull()] == ["item_1"]
+
+    # without a Writer, stale changes are published by the next reader
+    assert len(multi_armed_bandit.pull()) == 2
@@ -0,0 +1,164 @@
+import dataclasses
+import random
+from typing import List
+
+import pytest
+
+from mab import Context
+from mab import windows
+from mab.windows import BucketWindow, CountWindow, DecayedWindow
+
+
+def reference(contexts: List[Context], pool_size: int) -> List[Context]:
+    """Previous llist based implementation of ThompsonBandit.update."""
+    window = []
+    for c in contexts:
+        if c.value == 1:
+            for i in reversed(range(len(window))):
+                if window[i].value == 0:
+                    del window[i]
+                    break
+        window.append(c)
+        if len(window) > pool_size:
+            window.pop(0)
+    return window
+
+
+def test_count_window_matches_reference():
+    random.seed(0)
+    contexts = [
+        Context(item_id="item", value=random.choice([0, 0, 0, 1]), updated_at=x)
+        for x in range(5000)
+    ]
+
+    window = CountWindow(item_id="item", pool_size=100)
+    for c in contexts:
+        window.append(c)
+
+    expected = reference(contexts, pool_size=100)
+    assert list(window) == expected
+    assert window.alpha == sum(1 for x in expected if x.value == 1)
+    assert window.beta == sum(1 for x in expected if x.value == 0)
+    assert window.last == expected[-1]
+    assert window.updated_at == expected[-1].updated_at
+
+
+def test_count_window_memory_is_bounded():
+    window = CountWindow(item_id="item", pool_size=1000)
+    assert window.nbytes <= 64
+
+    for x in range(100000):
+        window.append(Context(item_id="item", value=x % 2, updated_at=x))
+
+    assert len(window) <= 1000
+    assert window.nbytes <= 2 * 1000 * 8
+
+
+def test_count_window_click_cancels_latest_view():
+    window = CountWindow(item_id="item", pool_size=3)
+    window.append(Context(item_id="item", value=0, updated_at=1))
+    window.append(Context(item_id="item", value=0, updated_at=2))
+    window.append(Context(item_id="item", value=1, updated_at=3))
+
+    assert [x.updated_at for x in window] == [1, 3]
+    assert (window.alpha, window.beta) == (1, 1)
+
+
+def test_count_window_invalid_value():
+    window = CountWindow()
+    with pytest.raises(ValueError):
+        window.append(Context(item_id="item", value=2, updated_at=1))
+    assert len(window) == 0
+    assert window.last is None
+
+
+def test_decayed_window_halves_per_half_life():
+    window = DecayedWindow(item_id="item", half_life=10)
+    window.append(Context(item_id="item", value=0, updated_at=0))
+    window.append(Context(item_id="item", value=0, updated_at=0))
+    window.append(Context(item_id="item", value=1, updated_at=0))
+    assert (window.alpha, window.beta) == (1, 1)
+
+    window.append(Context(item_id="item", value=0, updated_at=10))
+    assert window.alpha == pytest.approx(0.5)
+    assert window.beta == pytest.approx(1.5)
+    assert window.updated_at == 10
+    assert window.nbytes <= 64
+
+
+def test_decayed_window_older_context_is_discounted():
+    window = DecayedWindow(item_id="item", half_life=10)
+    window.append(Context(item_id="item", value=0, updated_at=20))
+    window.append(Context(item_id="item", value=0, updated_at=10))
+    assert window.beta == pytest.approx(1.5)
+    assert window.last == Context(item_id="item", value=0, updated_at=20)
+
+    restored = windows.restore("item", *window.export())
+    assert (restored.alpha, restored.beta) == (window.alpha, window.beta)
+    assert list(restored) == list(window)
+
+
+def test_bucket_window_expires_whole_buckets():
+    window = BucketWindow(item_id="item", buckets=3, bucket_seconds=10)
+    for updated_at, value in [(0, 0), (5, 0), (12, 0), (15, 1), (25, 0)]:
+        window.append(Context(item_id="item", value=value, updated_at=updated_at))
+    assert (window.alpha, window.beta) == (1, 3)
+    assert window.nbytes == 2 * 3 * 4
+
+    # bucket [0, 10) falls out of the window
+    window.append(Context(item_id="item", value=0, updated_at=30))
+    assert (window.alpha, window.beta) == (1, 2)
+
+    # contexts older than the window are dropped
+    window.append(Context(item_id="item", value=0, updated_at=5))
+    assert (window.alpha, window.beta) == (1, 2)
+    assert window.last == Context(item_id="item", value=0, updated_at=30)
+
+    restored = windows.restore("item", *window.export())
+    assert (restored.alpha, restored.beta) == (window.alpha, window.beta)
+    c = Context(item_id="item", value=1, updated_at=41)
+    window.append(c)
+    restored.append(c)
+    assert (restored.alpha, restored.beta) == (window.alpha, window.beta) == (1, 1)
+
+    window.append(Context(item_id="item", value=0, updated_at=1000))
+    assert (window.alpha, window.beta) == (0, 1)
+
+
+def test_bucket_window_advances_without_new_contexts():
+    window = BucketWindow(item_id="item", buckets=3, bucket_seconds=10)
+    for updated_at, value in [(5, 0), (12, 0), (15, 1), (25, 0)]:
+        window.append(Context(item_id="item", value=value, updated_at=updated_at))
+    assert (window.alpha, window.beta) == (1, 2)
+    assert window.expires_at == 30
+
+    assert window.advance(29) is False
+    assert window.advance(30) is True
+    assert (window.alpha, window.beta) == (1, 1)
+    assert window.expires_at == 40
+
+    assert window.advance(100) is True
+    assert (window.alpha, window.beta) == (0, 0)
+    assert window.expires_at is None
+    assert window.last == Context(item_id="item", value=0, updated_at=25)
+
+    # a late context inside the advanced window is still counted
+    window.append(Context(item_id="item", value=0, updated_at=85))
+    assert (window.alpha, window.beta) == (0, 1)
+
+
+@pytest.mark.parametrize("kind", ["count", "decayed", "bucket"])
+def test_window_applies_counted_context_like_repeated_contexts(kind: str):
+    repeated, counted = windows.build(kind, pool_size=4), windows.build(kind, pool_size=4)
+    contexts = [
+        Context(item_id="item", value=0, updated_at=1666180000, count=3),
+        Context(item_id="item", value=1, updated_at=1666180060, count=2),
+        Context(item_id="item", value=0, updated_at=1666180120, count=6),
+    ]
+    for c in contexts:
+        counted.append(c)
+        for _ in range(c.count):
+            repeated.append(dataclasses.replace(c, count=1))
+
+    assert (counted.alpha, counted.beta) == (repeated.alpha, repeated.beta)
+    assert counted.updated_at == repeated.updated_at
@@ -1,3 +1,4 @@
+import math
 import time
 
 from caches import TTL
@@ -39,3 +40,38 @@ def test_ttl():
     items = list(ttl.items())
     assert len(items) == 2
     assert items == [("key1", 300), ("key2", 400)]
+
+
+def test_ttl_pop_expired():
+    ttl = TTL()
+    now = time.time()
+    ttl.update(["key1", "key2", "key3", "key4"], now - 100)
+    ttl.update("key2", now + 100)
+    ttl.update("key3", now - 200)
+    ttl.delete("key4")
+
+    assert sorted(ttl.expired()) == ["key1", "key3"]
+    assert ttl.pop_expired(limit=1) == ["key3"]
+    assert ttl.get("key3") is None
+    assert ttl.pop_expired() == ["key1"]
+    assert ttl.pop_expired() == []
+    assert ttl.expired() == []
+    assert ttl.items() == [("key2", now + 100)]
+
+
+def test_ttl_rebuilds_stale_heap():
+    ttl = TTL()
+    for x in range(3000):
+        ttl.update("key", x)
+    assert len(ttl._heap) <= 2 * 1024 + 1
+    assert ttl.pop_expired() == ["key"]
+
+
+def test_ttl_expires_in_batches():
+    calls = []
+    ttl = TTL(expire=lambda keys, ttls: calls.append((keys, ttls)))
+
+    ttl.update(["key1", "key2", "key1"], 100)
+    ttl.delete(["key1", "key3"])
+
+    assert calls == [(["key1", "key2"], [100, 100]), (["key1"], [math.inf])]
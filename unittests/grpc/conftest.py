@@ -15,8 +15,8 @@ import clients
 from backends.grpc.interceptors import RequestCounterInterceptor
 from backends.grpc.interceptors import RequestLatencyInterceptor
 from backends.grpc.interceptors import WelcomeInterceptor
-from backends.grpc.interceptors.ttl import TTLInterceptor
 from backends.grpc.servicers import MasterBanditServicer, SlaveBanditServicer
+from caches import TTL
 from container import Container
 from loggers import logger
 from observable import Observable
@@ -49,15 +49,8 @@ async def deletable(container: Container) -> Observable:
 
 @pytest.mark.asyncio
 @pytest_asyncio.fixture(autouse=True)
-async def ttl_connector(container: Container) -> Observable:
-    o = container.ttl_connector()
-    yield o
-
-
-@pytest.mark.asyncio
-@pytest_asyncio.fixture(autouse=True)
-async def mab_connector(container: Container) -> Observable:
-    o = container.mab_connector()
+async def writer_connector(container: Container) -> Observable:
+    o = container.writer_connector()
     yield o
 
 
@@ -81,8 +74,8 @@ async def health_servicer(container: Container) -> HealthServicer:
 
 @pytest.mark.asyncio
 @pytest_asyncio.fixture(autouse=True)
-async def ttl_interceptor(container: Container) -> List[grpc.aio.ServerInterceptor]:
-    return container.ttl_interceptor()
+async def ttl(container: Container) -> TTL:
+    return container.ttl()
 
 
 @pytest.mark.asyncio
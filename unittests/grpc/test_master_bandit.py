@@ -4,9 +4,10 @@ import numpy as np
 import pytest
 from pytest_mock import MockerFixture
 
-from backends.grpc.interceptors.ttl import TTLInterceptor
 from backends.grpc.servicers import MasterBanditServicer
-from mab import Context
+from caches import TTL
+from mab import Context, ThompsonMultiArmedBandit
+from mab.journal import Journal
 from observable import Observable
 from protos import bandit_pb2
 from protos import bandit_pb2_grpc
@@ -155,6 +156,7 @@ async def test_master_bandit_stub_sample_without_explorable(
     """explorable=False 이면 exploit 만 대상이 된다."""
 
     # Given
+    # samples 는 요청한 arm 만 요청 순서대로 샘플링하므로 rank 와 같은 seed 라도 score 가 다르다.
     np.random.seed(0)
     # '+ 600' 이 붙으므로 원래 explore 의 대상이지만 explorable 이 False 이므로 무시한다.
     mocker.patch("time.time", return_value=1666180000 + 600)
@@ -176,19 +178,19 @@ async def test_master_bandit_stub_sample_without_explorable(
     assert len(response.predictions) == 3
     assert response.predictions[0] == bandit_pb2.Prediction(
         item_id="test_thompson_bandits_2",
-        score=0.90980697,
+        score=0.74982417,
         alpha=2,
         beta=1,
     )
     assert response.predictions[1] == bandit_pb2.Prediction(
         item_id="test_thompson_bandits_7",
-        score=0.7963802,
+        score=0.82639086,
         alpha=4,
         beta=3,
     )
     assert response.predictions[2] == bandit_pb2.Prediction(
         item_id="test_thompson_bandits_6",
-        score=0.7289961,
+        score=0.3567613,
         alpha=2,
         beta=3,
     )
@@ -201,6 +203,7 @@ async def test_master_bandit_stub_sample_with_explorable(
     """explorable=True 이면 explore 가 포함 된다."""
 
     # Given
+    # samples 는 요청한 arm 만 요청 순서대로 샘플링하므로 rank 와 같은 seed 라도 score 가 다르다.
     np.random.seed(0)
     mocker.patch("time.time", return_value=(1666180000 + 600))
 
@@ -221,19 +224,19 @@ async def test_master_bandit_stub_sample_with_explorable(
     assert len(response.predictions) == 3
     assert response.predictions[0] == bandit_pb2.Prediction(
         item_id="test_thompson_bandits_2",
-        score=0.48902976,
+        score=0.66431874,
         alpha=2,
         beta=1,
     )
     assert response.predictions[1] == bandit_pb2.Prediction(
         item_id="test_thompson_bandits_7",
-        score=0.70128924,
+        score=0.53980523,
         alpha=4,
         beta=3,
     )
     assert response.predictions[2] == bandit_pb2.Prediction(
         item_id="test_thompson_bandits_6",
-        score=0.53660476,
+        score=0.72126645,
         alpha=2,
         beta=3,
     )
@@ -243,12 +246,13 @@ async def test_master_bandit_stub_sample_with_explorable(
 async def test_master_bandit_stub_sample_with_invalid_ttl(
     mocker: MockerFixture,
     master: bandit_pb2_grpc.BanditStub,
-    ttl_interceptor: TTLInterceptor,
+    ttl: TTL,
 ):
     # Given
+    # samples 는 요청한 arm 만 요청 순서대로 샘플링하므로 rank 와 같은 seed 라도 score 가 다르다.
     np.random.seed(0)
     mocker.patch("time.time", return_value=1666180000)
-    ttl_interceptor.ttl.update("test_thompson_bandits_2", -1)
+    ttl.update("test_thompson_bandits_2", -1)
 
     # When
     request = bandit_pb2.SamplesRequest(
@@ -266,19 +270,19 @@ async def test_master_bandit_stub_sample_with_invalid_ttl(
     assert len(response.predictions) == 3
     assert response.predictions[0] == bandit_pb2.Prediction(
         item_id="test_thompson_bandits_2",
-        score=0.90980697,
+        score=0.74982417,
         alpha=2,
         beta=1,
     )
     assert response.predictions[1] == bandit_pb2.Prediction(
         item_id="test_thompson_bandits_7",
-        score=0.7963802,
+        score=0.82639086,
         alpha=4,
         beta=3,
     )
     assert response.predictions[2] == bandit_pb2.Prediction(
         item_id="test_thompson_bandits_6",
-        score=0.7289961,
+        score=0.3567613,
         alpha=2,
         beta=3,
     )
@@ -288,12 +292,13 @@ async def test_master_bandit_stub_sample_with_invalid_ttl(
 async def test_master_bandit_stub_sample_with_not_existing_id(
     mocker: MockerFixture,
     master: bandit_pb2_grpc.BanditStub,
-    ttl_interceptor: TTLInterceptor,
+    ttl: TTL,
 ):
     # Given
+    # samples 는 요청한 arm 만 요청 순서대로 샘플링하므로 rank 와 같은 seed 라도 score 가 다르다.
     np.random.seed(0)
     mocker.patch("time.time", return_value=1666180000)
-    ttl_interceptor.ttl.update("test_thompson_bandits_2", -1)
+    ttl.update("test_thompson_bandits_2", -1)
 
     # When
     request = bandit_pb2.SamplesRequest(
@@ -312,25 +317,25 @@ async def test_master_bandit_stub_sample_with_not_existing_id(
     assert len(response.predictions) == 4
     assert response.predictions[0] == bandit_pb2.Prediction(
         item_id="test_thompson_bandits_2",
-        score=0.90980697,
+        score=0.74982417,
         alpha=2,
         beta=1,
     )
     assert response.predictions[1] == bandit_pb2.Prediction(
         item_id="test_thompson_bandits_7",
-        score=0.7963802,
+        score=0.82639086,
         alpha=4,
         beta=3,
     )
     assert response.predictions[2] == bandit_pb2.Prediction(
         item_id="test_thompson_bandits_6",
-        score=0.7289961,
+        score=0.3567613,
         alpha=2,
         beta=3,
     )
     assert response.predictions[3] == bandit_pb2.Prediction(
         item_id="test_thompson_bandits_NOT_EXISTING",
-        score=0.720552,
+        score=0.56804454,
         alpha=0,
         beta=0,
     )
@@ -362,11 +367,11 @@ async def test_master_bandit_stub_update(
 
 
 @pytest.mark.asyncio
-async def test_master_bandit_ttl_intercept(
+async def test_master_bandit_update_ttl(
     mocker: MockerFixture,
     master: bandit_pb2_grpc.BanditStub,
     master_bandit_servicer: MasterBanditServicer,
-    ttl_interceptor: TTLInterceptor,
+    ttl: TTL,
 ):
     # Given
     np.random.seed(0)
@@ -377,7 +382,7 @@ async def test_master_bandit_ttl_intercept(
         item_id="test_thompson_bandits_9999",
         value=1.0,
     )
-    assert ttl_interceptor.ttl.get("test_thompson_bandits_9999") is None
+    assert ttl.get("test_thompson_bandits_9999") is None
     response = await master.update(request)
 
     # Then
@@ -388,8 +393,60 @@ async def test_master_bandit_ttl_intercept(
         ].alpha
         == 1.0
     )
-    ttl_to_verify = ttl_interceptor.ttl.get("test_thompson_bandits_9999")
-    assert ttl_to_verify == 1666180000 + ttl_interceptor.ttl.default_ttl
+    ttl_to_verify = ttl.get("test_thompson_bandits_9999")
+    assert ttl_to_verify == 1666180000 + ttl.default_ttl
+
+
+@pytest.mark.asyncio
+async def test_master_bandit_update_and_rank_segments():
+    # Given
+    servicer = MasterBanditServicer(ThompsonMultiArmedBandit(segmented=True))
+    for item_id, author_id in [("item_1", "a"), ("item_2", "b"), ("item_3", None)]:
+        request = bandit_pb2.UpdateRequest(item_id=item_id, value=1.0, updated_at=1)
+        if author_id is not None:
+            request.author_id = author_id
+        await servicer.update(request, None)
+
+    # When
+    ranked = await servicer.rank(
+        bandit_pb2.RankRequest(count=10, explorable=False, segments=["a"]), None
+    )
+    sampled = await servicer.samples(
+        bandit_pb2.SamplesRequest(item_ids=["item_2", "item_3"], segments=["b"]), None
+    )
+
+    # Then
+    assert [(x.item_id, x.alpha) for x in ranked.predictions] == [("item_1", 1)]
+    assert [(x.item_id, x.alpha) for x in sampled.predictions] == [
+        ("item_2", 1),
+        ("item_3", 0),
+    ]
+    servicer.writer.close()
+
+
+@pytest.mark.asyncio
+async def test_master_bandit_update_with_journal(tmp_path):
+    multi_armed_bandit = ThompsonMultiArmedBandit(journal=Journal(tmp_path))
+    servicer = MasterBanditServicer(multi_armed_bandit)
+
+    request = bandit_pb2.UpdateRequest(item_id="item_1", value=1.0, updated_at=1)
+    response = await servicer.update(request, None)
+
+    assert response.success
+    servicer.writer.close()
+    multi_armed_bandit.close()
+    journal = Journal(tmp_path)
+    assert [x.item_id for _, x in journal.replay()] == ["item_1"]
+    journal.close()
+
+
+@pytest.mark.asyncio
+async def test_master_bandit_stub_rank_segments_without_segmented(
+    master: bandit_pb2_grpc.BanditStub,
+):
+    response = await master.rank(bandit_pb2.RankRequest(count=10, segments=["a"]))
+    assert not response.success
+    assert response.error
 
 
 @pytest.mark.asyncio
@@ -447,11 +504,11 @@ async def test_deletable_publish_with_mab(
 
 @pytest.mark.asyncio
 async def test_deletable_publish_with_ttl(
-    ttl_interceptor: TTLInterceptor,
+    ttl: TTL,
     deletable: Observable,
 ):
     # Given
-    assert ttl_interceptor.ttl.get("test_thompson_bandits_1") is not None
+    assert ttl.get("test_thompson_bandits_1") is not None
 
     # When
     await deletable.publish(["test_thompson_bandits_1"])
@@ -459,7 +516,7 @@ async def test_deletable_publish_with_ttl(
     await asyncio.sleep(0.1)
 
     # Then
-    assert ttl_interceptor.ttl.get("test_thompson_bandits_1") is None
+    assert ttl.get("test_thompson_bandits_1") is None
 
 
 @pytest.mark.asyncio
@@ -497,11 +554,11 @@ async def test_updatable_publish_with_mab(
 
 @pytest.mark.asyncio
 async def test_updatable_publish_with_mab2(
-    ttl_interceptor: TTLInterceptor,
+    ttl: TTL,
     updatable: Observable,
 ):
     # Given
-    assert ttl_interceptor.ttl.get("test_thompson_bandits_1") is not None
+    assert ttl.get("test_thompson_bandits_1") is not None
 
     # When
     await updatable.publish(
@@ -510,4 +567,4 @@ async def test_updatable_publish_with_mab2(
     await updatable.join()
 
     # Then
-    assert ttl_interceptor.ttl.get("test_thompson_bandits_1") == 1666784800
+    assert ttl.get("test_thompson_bandits_1") == 1666784800
@@ -191,7 +191,7 @@ async def test_slave_bandit_stub_sample_with_explorable_mode(
     )
     assert response.predictions[3] == bandit_pb2.Prediction(
         item_id="test_thompson_bandits_NOT_EXISTING",
-        score=0.44912526,
+        score=0.5488135,
         alpha=0,
         beta=0,
     )
@@ -242,7 +242,21 @@ async def test_slave_bandit_stub_sample_without_explorable_mode(
     )
     assert response.predictions[3] == bandit_pb2.Prediction(
         item_id="test_thompson_bandits_NOT_EXISTING",
-        score=0.44912526,
+        score=0.5488135,
         alpha=0,
         beta=0,
     )
+
+
+@pytest.mark.asyncio
+async def test_slave_bandit_stub_forwards_segments_to_master(
+    slave: bandit_pb2_grpc.BanditStub,
+) -> None:
+    # the master of the fixture is not segmented, so it answers with an error
+    response = await slave.rank(bandit_pb2.RankRequest(count=4, segments=["a"]))
+    assert not response.success
+
+    response = await slave.samples(
+        bandit_pb2.SamplesRequest(item_ids=["test_thompson_bandits_2"], segments=["a"])
+    )
+    assert not response.success
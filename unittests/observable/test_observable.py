@@ -1,6 +1,9 @@
+import asyncio
+
 import pytest
 
-from observable import Observable
+from mab import Context
+from observable import AggregateObservable, BatchObservable, Observable
 
 
 @pytest.mark.asyncio
@@ -32,3 +35,85 @@ async def test_close():
     await observable.close()
 
     assert observable._queue.empty() is True
+
+
+@pytest.mark.asyncio
+async def test_batch_observable_delivers_lists():
+    observable = BatchObservable(max_size=100, batch_size=3, linger=0.01)
+    batches = []
+    observable.subscribe(batches.append)
+
+    for x in range(7):
+        await observable.publish(x)
+    await observable.join()
+
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+    await observable.publish(7)
+    await observable.close()
+    assert batches[-1] == [7]
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_does_not_block_others():
+    observable = Observable(max_size=100)
+    fast, slow = [], []
+    release = asyncio.Event()
+
+    async def slow_subscriber(data: int) -> None:
+        await release.wait()
+        slow.append(data)
+
+    observable.subscribe(slow_subscriber, max_size=100)
+    observable.subscribe(fast.append)
+
+    for x in range(5):
+        await observable.publish(x)
+    await asyncio.sleep(0.01)
+    assert fast == [0, 1, 2, 3, 4]
+    assert slow == []
+
+    release.set()
+    await observable.join()
+    assert slow == [0, 1, 2, 3, 4]
+    await observable.close()
+
+
+@pytest.mark.asyncio
+async def test_aggregate_observable_combines_contexts_per_item():
+    downstream = Observable(max_size=100)
+    contexts = []
+    downstream.subscribe(contexts.append)
+    observable = AggregateObservable(interval=10, max_items=100, downstream=downstream)
+
+    for x in range(5):
+        await observable.publish(Context(item_id="hot", value=1, updated_at=x))
+        await observable.publish(Context(item_id="hot", value=0, updated_at=x))
+    await observable.publish(Context(item_id="cold", value=0, updated_at=3))
+    await observable.join()
+    await downstream.join()
+
+    assert contexts == [
+        Context(item_id="hot", value=0, updated_at=4, count=5),
+        Context(item_id="cold", value=0, updated_at=3),
+        Context(item_id="hot", value=1, updated_at=4, count=5),
+    ]
+
+    await observable.close()
+    await downstream.close()
+
+
+@pytest.mark.asyncio
+async def test_aggregate_observable_flushes_on_interval_and_size():
+    contexts = []
+    observable = AggregateObservable(interval=0.01, max_items=2)
+    observable.subscribe(contexts.append)
+
+    await observable.publish(Context(item_id="item_1", value=0, updated_at=0))
+    await asyncio.sleep(0.05)
+    assert [x.item_id for x in contexts] == ["item_1"]
+
+    await observable.publish(Context(item_id="item_2", value=0, updated_at=0))
+    await observable.publish(Context(item_id="item_3", value=0, updated_at=0))
+    await observable.close()
+    assert [x.item_id for x in contexts] == ["item_1", "item_2", "item_3"]
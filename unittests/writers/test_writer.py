@@ -0,0 +1,138 @@
+import time
+
+import pytest
+
+from caches import TTL
+from connectors import WriterConnector
+from mab import Context, ThompsonMultiArmedBandit
+from observable import BatchObservable, Observable
+from writers import Writer
+
+
+@pytest.mark.asyncio
+async def test_writer_applies_commands_in_order():
+    multi_armed_bandit = ThompsonMultiArmedBandit()
+    ttl = TTL(interner=multi_armed_bandit.interner)
+    writer = Writer(multi_armed_bandit, ttl)
+
+    writer.update([Context(item_id="item_1", value=0, updated_at=1666180000)])
+    writer.update([Context(item_id="item_1", value=1, updated_at=1666180001)])
+    writer.update([Context(item_id="item_2", value=0, updated_at=1666180002)])
+    deleted = await writer.delete(["item_2", "item_3"])
+
+    assert [x is not None for x in deleted] == [True, False]
+    assert multi_armed_bandit.bandits["item_1"].alpha == 1
+    assert "item_2" not in multi_armed_bandit.bandits
+    assert ttl.get("item_1") is not None
+    assert ttl.get("item_2") is None
+
+    ttl.update("item_1", time.time() - 1)
+    assert await writer.pop_expired() == ["item_1"]
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_writer_connector():
+    multi_armed_bandit = ThompsonMultiArmedBandit()
+    writer = Writer(multi_armed_bandit)
+    updatable = BatchObservable(batch_size=10, linger=0.001)
+    deletable = Observable()
+    _ = WriterConnector(writer, updatable, deletable)
+
+    for x in range(5):
+        await updatable.publish(Context(item_id="item", value=0, updated_at=x))
+    await updatable.join()
+    assert multi_armed_bandit.bandits["item"].beta == 5
+
+    await deletable.publish(["item"])
+    await deletable.join()
+    assert "item" not in multi_armed_bandit.bandits
+
+    await updatable.close()
+    await deletable.close()
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_writer_publishes_before_resolving():
+    multi_armed_bandit = ThompsonMultiArmedBandit(publish_interval=0.05)
+    writer = Writer(multi_armed_bandit)
+
+    await writer.update([Context(item_id="item_1", value=1, updated_at=1666180000)])
+    await writer.update([Context(item_id="item_2", value=1, updated_at=1666180000)])
+
+    assert sorted(x.item_id for x in multi_armed_bandit.pull()) == ["item_1", "item_2"]
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_writer_advances_bucket_windows():
+    multi_armed_bandit = ThompsonMultiArmedBandit(
+        window="bucket", buckets=3, bucket_seconds=10
+    )
+    writer = Writer(multi_armed_bandit)
+    writer.update([Context(item_id="item_1", value=0, updated_at=time.time() - 60)])
+
+    assert await writer.advance(10) == 1
+    assert await writer.advance(10) == 0
+    assert multi_armed_bandit.pull(item_ids=["item_1"])[0].beta == 0
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_writer_compacts_snapshots_and_renews(tmp_path):
+    multi_armed_bandit = ThompsonMultiArmedBandit()
+    expired = []
+    ttl = TTL(
+        interner=multi_armed_bandit.interner,
+        expire=lambda item_ids, ttls: expired.append(item_ids),
+    )
+    writer = Writer(multi_armed_bandit, ttl)
+
+    # the same item in one batch updates the TTL once
+    writer.update([Context(item_id="item_1", value=0, updated_at=x) for x in range(3)])
+    await writer.update([Context(item_id="item_2", value=0, updated_at=3)])
+    assert expired == [["item_1", "item_2"]]
+
+    await writer.delete(["item_2"])
+    assert await writer.compact(10) == 1
+    path = await writer.snapshot(tmp_path)
+    assert path.parent == tmp_path
+
+    await writer.renew(["item_3", "item_3"])
+    assert ttl.get("item_3") is not None
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_writer_survives_publish_failure(mocker):
+    multi_armed_bandit = ThompsonMultiArmedBandit()
+    writer = Writer(multi_armed_bandit)
+    publish = mocker.patch.object(
+        multi_armed_bandit, "publish", side_effect=[RuntimeError("failed")]
+    )
+
+    with pytest.raises(RuntimeError):
+        await writer.update([Context(item_id="item_1", value=0, updated_at=0)])
+
+    publish.side_effect = None
+    await writer.update([Context(item_id="item_2", value=0, updated_at=1)])
+    assert sorted(multi_armed_bandit.bandits.keys()) == ["item_1", "item_2"]
+    writer.close()
+
+
+@pytest.mark.asyncio
+async def test_writer_rejects_commands_after_close():
+    multi_armed_bandit = ThompsonMultiArmedBandit(publish_interval=60)
+    writer = Writer(multi_armed_bandit)
+
+    updated = writer.update([Context(item_id="item_1", value=0, updated_at=0)])
+    writer.close()
+    await updated
+    assert "item_1" in multi_armed_bandit.bandits
+
+    with pytest.raises(RuntimeError):
+        writer.update([Context(item_id="item_2", value=0, updated_at=1)])
+    with pytest.raises(RuntimeError):
+        writer.delete(["item_1"])
+    writer.close()
@@ -0,0 +1,223 @@
+import asyncio
+import collections
+import threading
+from pathlib import Path
+from typing import Any, Deque, Iterable, List, NoReturn, Optional, Tuple, Union
+
+from caches import TTL
+from loggers import logger
+from mab import Context, ThompsonMultiArmedBandit
+
+UPDATE, DELETE, EXPIRE, ADVANCE, COMPACT, SNAPSHOT, RENEW, STOP = range(8)
+
+# (kind, payload, 결과를 돌려줄 future 와 loop)
+Command = Tuple[int, Any, Optional[asyncio.Future], Optional[asyncio.AbstractEventLoop]]
+
+# (future, loop, 결과 또는 예외)
+Settled = Tuple[asyncio.Future, asyncio.AbstractEventLoop, Any]
+
+
+class Writer:
+    """
+    ThompsonMultiArmedBandit 과 TTL 의 모든 변경을 하나의 thread 에서 적용하는 single writer.
+
+    update, delete, pop_expired, advance, compact, snapshot, renew 는 command 를 deque 에 넣기만 하고
+    바로 반환한다.
+    writer thread 는 깨어날 때마다 쌓인 command 를 모두 꺼내고, 연속된 같은 종류의 command 를
+    하나로 합쳐서 update_many, delete 를 한 번씩 호출한다. 따라서 event 마다 thread 를 오가거나
+    future 를 만들 필요가 없고, 두 상태를 바꾸는 thread 가 하나뿐이라 읽는 쪽과 경합하지 않는다.
+
+    적용한 변경은 ThompsonMultiArmedBandit.publish_interval 마다 한 번씩 새 ArmView 로 publish 하며,
+    더 이상 쌓인 command 가 없으면 남은 시간만큼 기다렸다가 publish 한다.
+
+    event loop 에서 호출하면 적용된 변경이 publish 되었을 때 완료되는 asyncio.Future 를 반환하며,
+    기다리지 않아도 적용 순서는 호출 순서와 같다. close 한 뒤에는 command 를 받지 않고 RuntimeError 를 낸다.
+    """
+
+    def __init__(
+        self, multi_armed_bandit: ThompsonMultiArmedBandit, ttl: Optional[TTL] = None
+    ):
+        self.multi_armed_bandit = multi_armed_bandit
+        self.ttl = ttl
+        self._commands: Deque[Command] = collections.deque()
+        self._wakeup = threading.Event()
+        # close 이후에 STOP 뒤로 command 가 들어가지 않도록 closed 확인과 append 를 함께 묶는다.
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="writer", daemon=True)
+        self._thread.start()
+
+    def update(self, contexts: List[Context]) -> Optional[asyncio.Future]:
+        return self._submit(UPDATE, contexts)
+
+    def delete(self, item_ids: List[str]) -> Optional[asyncio.Future]:
+        """적용이 끝나면 item_ids 순서대로 삭제된 ThompsonBandit (없었으면 None) 목록이 결과가 된다."""
+        return self._submit(DELETE, item_ids)
+
+    def pop_expired(self, limit: Optional[int] = None) -> Optional[asyncio.Future]:
+        """TTL.pop_expired 를 writer thread 에서 실행하고 꺼낸 item_id 목록을 결과로 준다."""
+        return self._submit(EXPIRE, limit)
+
+    def advance(self, limit: Optional[int] = None) -> Optional[asyncio.Future]:
+        """
+        ThompsonMultiArmedBandit.advance 를 writer thread 에서 실행하고 처리한 arm 수를 결과로 준다.
+        """
+        return self._submit(ADVANCE, limit)
+
+    def compact(self, limit: Optional[int] = None) -> Optional[asyncio.Future]:
+        """
+        ThompsonMultiArmedBandit.compact 를 writer thread 에서 실행하고 회수한 tombstone 수를 결과로 준다.
+        """
+        return self._submit(COMPACT, limit)
+
+    def snapshot(self, directory: Union[str, Path]) -> Optional[asyncio.Future]:
+        """
+        ThompsonMultiArmedBandit.snapshot 을 writer thread 에서 실행하고 기록한 경로를 결과로 준다.
+
+        snapshot 을 기록하는 동안 뒤의 command 는 적용되지 않고 쌓였다가 한 번에 적용된다.
+        """
+        return self._submit(SNAPSHOT, directory)
+
+    def renew(self, item_ids: Iterable[str]) -> Optional[asyncio.Future]:
+        """arm 은 바꾸지 않고 item_ids 의 TTL 만 기본 TTL 로 갱신한다. 복원한 arm 의 TTL 을 채울 때 사용한다."""
+        return self._submit(RENEW, list(item_ids))
+
+    def close(self) -> NoReturn:
+        """쌓인 command 를 모두 적용한 뒤 writer thread 를 멈춘다. 이후의 command 는 RuntimeError 를 낸다."""
+        with self._lock:
+            if not self._closed.is_set():
+                self._closed.set()
+                self._commands.append((STOP, None, None, None))
+        self._wakeup.set()
+        self._thread.join()
+
+    def _submit(self, kind: int, payload: Any) -> Optional[asyncio.Future]:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        with self._lock:
+            if self._closed.is_set():
+                raise RuntimeError("Writer is closed.")
+            future = loop.create_future() if loop else None
+            self._commands.append((kind, payload, future, loop))
+        self._wakeup.set()
+        return future
+
+    def _run(self) -> NoReturn:
+        # 적용은 끝났지만 아직 publish 되지 않은 command 의 결과
+        settled: List[Settled] = []
+        pending = False
+        while True:
+            delay = self.multi_armed_bandit.publish_delay() if pending else None
+            self._wakeup.wait(delay)
+            self._wakeup.clear()
+
+            commands = []
+            while self._commands:
+                commands.append(self._commands.popleft())
+
+            try:
+                start = 0
+                for i in range(1, len(commands) + 1):
+                    if i < len(commands) and commands[i][0] == commands[start][0]:
+                        continue
+                    if commands[start][0] == STOP:
+                        self.multi_armed_bandit.publish()
+                        _settle(settled)
+                        _settle(_reject(commands[start + 1 :]))
+                        return
+                    settled.extend(self._apply(commands[start:i]))
+                    pending = True
+                    start = i
+
+                if pending and self.multi_armed_bandit.publish(force=False):
+                    _settle(settled)
+                    settled, pending = [], False
+            except Exception as e:
+                # publish 에 실패해도 writer thread 는 계속 돌아야 하므로, 기다리는 future 에 예외를 전달한다.
+                logger.error(e)
+                settled.extend(
+                    (f, loop, None) for _, _, f, loop in commands if f is not None
+                )
+                _settle([(f, loop, e) for f, loop, _ in settled])
+                settled, pending = [], False
+                if any(command[0] == STOP for command in commands):
+                    return
+
+    def _apply(self, commands: List[Command]) -> List[Settled]:
+        """같은 종류의 command 들을 한 번에 적용하고 각 future 에 전달할 결과를 반환한다."""
+        kind = commands[0][0]
+        try:
+            if kind == UPDATE:
+                contexts = [c for command in commands for c in command[1]]
+                self.multi_armed_bandit.update_many(contexts)
+                if self.ttl is not None:
+                    self.ttl.update(dict.fromkeys(c.item_id for c in contexts))
+                results = [None] * len(commands)
+            elif kind == RENEW:
+                if self.ttl is not None:
+                    self.ttl.update(
+                        dict.fromkeys(x for command in commands for x in command[1])
+                    )
+                results = [None] * len(commands)
+            elif kind == DELETE:
+                item_ids = [x for command in commands for x in command[1]]
+                deleted = self.multi_armed_bandit.delete(item_ids)
+                if self.ttl is not None:
+                    self.ttl.delete(item_ids)
+                results, start = [], 0
+                for command in commands:
+                    results.append(deleted[start : start + len(command[1])])
+                    start += len(command[1])
+            elif kind == ADVANCE:
+                results = [
+                    self.multi_armed_bandit.advance(limit=command[1])
+                    for command in commands
+                ]
+            elif kind == COMPACT:
+                results = [
+                    self.multi_armed_bandit.compact(command[1]) for command in commands
+                ]
+            elif kind == SNAPSHOT:
+                results = [
+                    self.multi_armed_bandit.snapshot(command[1]) for command in commands
+                ]
+            else:
+                results = [
+                    self.ttl.pop_expired(command[1]) if self.ttl is not None else []
+                    for command in commands
+                ]
+        except Exception as e:
+            logger.error(e)
+            return [(f, loop, e) for _, _, f, loop in commands if f is not None]
+
+        return [
+            (future, loop, result)
+            for (_, _, future, loop), result in zip(commands, results)
+            if future is not None
+        ]
+
+
+def _reject(commands: Iterable[Command]) -> List[Settled]:
+    """writer 가 멈춘 뒤 남은 command 의 future 에 전달할 closed 예외."""
+    e = RuntimeError("Writer is closed.")
+    return [(f, loop, e) for _, _, f, loop in commands if f is not None]
+
+
+def _settle(settled: List[Settled]) -> NoReturn:
+    for future, loop, result in settled:
+        if isinstance(result, Exception):
+            loop.call_soon_threadsafe(_set_exception, future, result)
+        else:
+            loop.call_soon_threadsafe(_set_result, future, result)
+
+
+def _set_result(future: asyncio.Future, result: Any) -> NoReturn:
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_exception(future: asyncio.Future, e: Exception) -> NoReturn:
+    if not future.done():
+        future.set_exception(e)